@@ -20,17 +20,36 @@ SOFTWARE.
 
 import aiohttp
 import asyncio
+import hashlib
+import inspect
 import io
+import logging
+import os
+import random
+import re
+import tempfile
 import time
 
-from collections import defaultdict
-from datetime import datetime, timedelta
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
 
 import discord
 from discord.ext import commands, tasks
 from discord.ui import View, Button
+from pymongo import DeleteOne, UpdateOne
+from pymongo.errors import PyMongoError
+
+try:
+    import boto3  # S3-compatible archive store (AWS, MinIO, ...)
+    from botocore.exceptions import ClientError
+    HAS_BOTO3 = True
+except ImportError:
+    HAS_BOTO3 = False
 from core import checks
 from core.models import PermissionLevel
 
@@ -43,6 +62,8 @@ __copyright__ = "MIT License 2020-2025"
 __description__ = "Enhanced Modmail plugin for media logging with smart user tracking"
 __installation__ = "!plugin add WebKide/modmail-plugins/media-logger@master"
 
+logger = logging.getLogger("Modmail")
+
 # Constants
 DEFAULT_MEDIA_TYPES = {
     '.png': True, '.gif': True, '.jpg': True, '.jpeg': True, '.webp': True,
@@ -76,6 +97,29 @@ MAX_ATTACHMENT_SIZE = 25 * 1024 * 1024  # 25MB
 MAX_DIRECT_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB
 CACHE_TTL = 300  # 5 minutes
 STATS_PRUNE_DAYS = 7  # Prune stats older than 1 week
+TRACKED_MESSAGE_TTL = STATS_PRUNE_DAYS * 86400  # Tracked message docs expire with the stats window
+STATS_FLUSH_INTERVAL = 30  # Seconds between user stats delta flushes
+MAX_TRACKED_MESSAGES = 50000  # In-memory cap for delete tracking
+TRACKED_FLUSH_INTERVAL = 5  # Seconds between write-behind flushes
+MAX_CONCURRENT_DOWNLOADS = 8  # Global cap on attachment downloads in flight
+MAX_DOWNLOADS_PER_HOST = 4  # Per CDN host cap
+SIGNATURE_BYTES = 256  # Bytes fetched for magic-number checks
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+ARCHIVE_WORKERS = 4  # Concurrent archive transfers
+ARCHIVE_QUEUE_SIZE = 500  # Jobs waiting for a worker, newer ones are dropped beyond this
+ARCHIVE_DRAIN_TIMEOUT = 10  # Seconds to let queued archive jobs finish on unload
+ARCHIVE_DIR = os.environ.get('MEDIALOG_ARCHIVE_DIR', 'data/media-archive')
+DEDUP_CACHE_SIZE = 5000  # In-memory LRU of recent content hashes
+DEDUP_PREFIX_BYTES = 64 * 1024  # Non-image files are hashed on their first 64KB (+ size)
+DEDUP_MAX_IMAGE_BYTES = 8 * 1024 * 1024  # Images up to this size are hashed whole, larger ones by prefix
+DEDUP_TTL = 30 * 86400  # Hash docs expire 30 days after the last repost
+REPOST_EDIT_INTERVAL = 30  # Seconds between repost counter edits on log entries
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+DISPATCH_WINDOW = 1.5  # Seconds to wait for more embeds before sending a batch
+MAX_EMBEDS_PER_MESSAGE = 10  # Discord limits
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+CHANNEL_RATE = (5, 5.0)  # Messages per seconds, per channel bucket
+WEBHOOK_RATE = (5, 2.0)  # Webhook bucket
 
 class FiletypeToggleButton(Button):
     def __init__(self, ext: str, enabled: bool, parent_view: View):
@@ -205,6 +249,983 @@ class FiletypePaginator(View):
             return False
         return True
 
+# Filetype extensions are interned to small ints so per-user counters stay compact
+FILETYPE_IDS: Dict[str, int] = {}
+FILETYPE_NAMES: List[str] = []
+
+def filetype_id(ext: str) -> int:
+    type_id = FILETYPE_IDS.get(ext)
+    if type_id is None:
+        type_id = FILETYPE_IDS[ext] = len(FILETYPE_NAMES)
+        FILETYPE_NAMES.append(ext)
+    return type_id
+
+def filetype_field(type_id: int) -> str:
+    """Extension as a Mongo field name, dots are not allowed in update paths"""
+    return FILETYPE_NAMES[type_id].lstrip('.')
+
+class MediaFilter:
+    """Config compiled into frozen int sets and an extension table for on_message"""
+    __slots__ = ('log_channel_id', 'opt_in', 'ignored', 'tracked', 'extensions',
+                 'log_bot_media', 'force_enabled', 'dedup_enabled', 'archive_enabled')
+
+    def __init__(self, config: dict):
+        log_channel = config.get('log_channel')
+        self.log_channel_id = int(log_channel) if log_channel else 0
+        self.opt_in = config.get('channel_tracking', 'all') != 'all'
+        self.ignored = frozenset(int(c) for c in config.get('ignored_channels', []))
+        self.tracked = frozenset(int(c) for c in config.get('tracked_channels', []))
+        self.log_bot_media = config.get('log_bot_media', False)
+        self.force_enabled = config.get('force_enabled', False)
+        self.dedup_enabled = config.get('dedup_enabled', False)  # Opt-in, it suppresses log entries
+        self.archive_enabled = config.get('archive_enabled', False)
+
+        # Enabled extensions map straight to their stats type id, upper case included
+        # so the common spellings resolve without lowering the filename
+        extensions = {}
+        for ext, enabled in config.get('allowed_types', DEFAULT_MEDIA_TYPES).items():
+            if enabled:
+                ext = ext.lower()
+                extensions[ext] = extensions[ext.upper()] = filetype_id(ext)
+        self.extensions = extensions
+
+    def channel_allowed(self, channel_id: int) -> bool:
+        if channel_id == self.log_channel_id:
+            return False
+        if self.opt_in:
+            return channel_id in self.tracked
+        return channel_id not in self.ignored
+
+    def type_of(self, filename: str) -> Optional[int]:
+        """Stats type id of an allowed filename, None when it should not be logged"""
+        dot = filename.rfind('.')
+        if dot <= 0:  # No suffix, or a dotfile like Path().suffix treats it
+            return None
+        ext = filename[dot:]
+        type_id = self.extensions.get(ext)
+        if type_id is None and not ext.islower():
+            type_id = self.extensions.get(ext.lower())
+        return type_id
+
+class UserStats:
+    """Compact per-user upload record"""
+    __slots__ = ('uploads', 'deletes', 'last_upload', 'type_stats', 'channel_stats', 'loaded')
+
+    def __init__(self, last_upload: Optional[datetime]):
+        self.uploads = 0
+        self.deletes = 0
+        self.last_upload = last_upload
+        self.type_stats: Dict[int, int] = {}  # filetype id -> count
+        self.channel_stats: Dict[int, int] = {}  # channel id -> count
+        self.loaded = False  # True once merged with the user's DB document
+
+    def add_upload(self, type_id: int, channel_id: int):
+        self.type_stats[type_id] = self.type_stats.get(type_id, 0) + 1
+        self.channel_stats[channel_id] = self.channel_stats.get(channel_id, 0) + 1
+
+    def top_types(self, limit: int = 5) -> List[Tuple[str, int]]:
+        top = sorted(self.type_stats.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return [(FILETYPE_NAMES[type_id], count) for type_id, count in top]
+
+    def top_channels(self, limit: int = 5) -> List[Tuple[int, int]]:
+        return sorted(self.channel_stats.items(), key=lambda x: x[1], reverse=True)[:limit]
+
+    def to_doc(self) -> dict:
+        # Mongo keys must be strings
+        return {
+            'uploads': self.uploads,
+            'deletes': self.deletes,
+            'last_upload': self.last_upload,
+            'type_stats': {filetype_field(t): c for t, c in self.type_stats.items()},
+            'channel_stats': {str(ch): c for ch, c in self.channel_stats.items()}
+        }
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> 'UserStats':
+        record = cls(doc.get('last_upload'))
+        record.uploads = doc.get('uploads', 0)
+        record.deletes = doc.get('deletes', 0)
+        record.type_stats = {
+            filetype_id(ext if ext.startswith('.') else f'.{ext}'): c  # Legacy docs kept the dot
+            for ext, c in doc.get('type_stats', {}).items()
+        }
+        record.channel_stats = {int(ch): c for ch, c in doc.get('channel_stats', {}).items()}
+        return record
+
+class UserStatsDelta:
+    """Changes to one user's stats since the last flush"""
+    __slots__ = ('uploads', 'deletes', 'last_upload', 'type_stats', 'channel_stats')
+
+    def __init__(self):
+        self.uploads = 0
+        self.deletes = 0
+        self.last_upload: Optional[datetime] = None
+        self.type_stats: Dict[int, int] = {}
+        self.channel_stats: Dict[int, int] = {}
+
+    def to_update(self) -> dict:
+        """Mongo update that applies this delta with $inc/$max"""
+        inc = {}
+        if self.uploads:
+            inc['uploads'] = self.uploads
+        if self.deletes:
+            inc['deletes'] = self.deletes
+        for type_id, count in self.type_stats.items():
+            inc[f'type_stats.{filetype_field(type_id)}'] = count
+        for channel_id, count in self.channel_stats.items():
+            inc[f'channel_stats.{channel_id}'] = count
+
+        update = {'$set': {'type': 'user_stats'}}
+        if inc:
+            update['$inc'] = inc
+        if self.last_upload:
+            update['$max'] = {'last_upload': self.last_upload}
+        else:
+            update['$setOnInsert'] = {'last_upload': datetime.utcnow()}
+        return update
+
+    def apply_to(self, record: UserStats):
+        record.uploads += self.uploads
+        record.deletes += self.deletes
+        for type_id, count in self.type_stats.items():
+            record.type_stats[type_id] = record.type_stats.get(type_id, 0) + count
+        for channel_id, count in self.channel_stats.items():
+            record.channel_stats[channel_id] = record.channel_stats.get(channel_id, 0) + count
+        if self.last_upload and (not record.last_upload or self.last_upload > record.last_upload):
+            record.last_upload = self.last_upload
+
+    def merge_into(self, other: 'UserStatsDelta'):
+        """Fold this delta into a newer one"""
+        self.apply_to(other)
+
+class UserStatsTable:
+    """User stats kept in last-upload order, so eviction and pruning never scan
+
+    Every upload moves the user to the end of an OrderedDict; since upload
+    times only increase, the front is always the least recent uploader.
+    Insert, touch and evict are O(1), pruning is O(pruned).
+    """
+
+    def __init__(self, max_users: int = MAX_TRACKED_USERS):
+        self.max_users = max_users
+        self._users: 'OrderedDict[int, UserStats]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._users
+
+    def __iter__(self) -> Iterator[Tuple[int, UserStats]]:
+        return iter(self._users.items())
+
+    def get(self, user_id: int) -> Optional[UserStats]:
+        return self._users.get(user_id)
+
+    def touch(self, user_id: int, now: datetime) -> UserStats:
+        """Fetch or create a user's record and mark it most recent, evicting if full"""
+        record = self._users.get(user_id)
+        if record is None:
+            while len(self._users) >= self.max_users:
+                self._users.popitem(last=False)
+            record = self._users[user_id] = UserStats(now)
+        else:
+            self._users.move_to_end(user_id)
+        record.last_upload = now
+        return record
+
+    def replace(self, user_id: int, record: UserStats):
+        """Swap in a record for a tracked user without changing its position"""
+        if user_id in self._users:
+            self._users[user_id] = record
+
+    def prune(self, cutoff: datetime) -> int:
+        """Drop users whose last upload is older than cutoff"""
+        pruned = 0
+        while self._users:
+            user_id, record = next(iter(self._users.items()))
+            if record.last_upload >= cutoff:
+                break
+            del self._users[user_id]
+            pruned += 1
+        return pruned
+
+    def load(self, records: Dict[int, UserStats]):
+        """Replace contents, restoring last-upload order"""
+        ordered = sorted(records.items(), key=lambda x: x[1].last_upload)[-self.max_users:]
+        self._users = OrderedDict(ordered)
+
+    def clear(self):
+        self._users.clear()
+
+def benchmark_user_stats(sizes: Tuple[int, ...] = (1_000, 5_000), uploads: int = 1_000) -> List[dict]:
+    """Time uploads into a full table: legacy dict + min() eviction vs UserStatsTable
+
+    Defaults are kept small: this runs inside the live bot process, and the
+    thread it runs on still competes with the event loop for the GIL.
+    """
+    results = []
+    for size in sizes:
+        base = datetime.utcnow()
+        user_ids = [random.randrange(10 ** 17, 10 ** 18) for _ in range(size * 2)]
+        # Legacy runs get fewer uploads, each one is O(n) once full
+        legacy_uploads = max(50, uploads * 1000 // size)
+
+        legacy = {
+            str(uid): {'uploads': 1, 'deletes': 0, 'last_upload': base + timedelta(microseconds=i),
+                       'type_stats': defaultdict(int), 'channel_stats': defaultdict(int)}
+            for i, uid in enumerate(user_ids[:size])
+        }
+        start = time.perf_counter()
+        for i in range(legacy_uploads):
+            user_id = str(user_ids[size + i % size])
+            if len(legacy) >= size and user_id not in legacy:
+                oldest_user = min(legacy.items(), key=lambda x: x[1]['last_upload'])
+                del legacy[oldest_user[0]]
+            data = legacy.setdefault(user_id, {'uploads': 0, 'deletes': 0, 'last_upload': base,
+                                               'type_stats': defaultdict(int), 'channel_stats': defaultdict(int)})
+            data['type_stats']['.png'] += 1
+            data['channel_stats']['1'] += 1
+            data['uploads'] += 1
+            data['last_upload'] = base + timedelta(seconds=1, microseconds=i)
+        legacy_us = (time.perf_counter() - start) / legacy_uploads * 1e6
+
+        table = UserStatsTable(max_users=size)
+        for i, uid in enumerate(user_ids[:size]):
+            table.touch(uid, base + timedelta(microseconds=i))
+        png = filetype_id('.png')
+        start = time.perf_counter()
+        for i in range(uploads):
+            record = table.touch(user_ids[size + i % size], base + timedelta(seconds=1, microseconds=i))
+            record.add_upload(png, 1)
+            record.uploads += 1
+        table_us = (time.perf_counter() - start) / uploads * 1e6
+
+        results.append({
+            'users': size,
+            'legacy_us': legacy_us,
+            'table_us': table_us,
+            'speedup': legacy_us / table_us if table_us else 0
+        })
+    return results
+
+def benchmark_message_filter(channels: int = 400, iterations: int = 5_000) -> List[dict]:
+    """Time the on_message early exits: raw config lookups vs the compiled MediaFilter"""
+    channel_ids = [random.randrange(10 ** 17, 10 ** 18) for _ in range(channels)]
+    config = {
+        'log_channel': str(channel_ids[0]),
+        'channel_tracking': 'all',
+        'ignored_channels': [str(c) for c in channel_ids],
+        'tracked_channels': [],
+        'allowed_types': DEFAULT_MEDIA_TYPES
+    }
+    media_filter = MediaFilter(config)
+    open_channel = random.randrange(10 ** 17, 10 ** 18)
+    cases = [
+        ('Ignored channel', channel_ids[-1], 'photo.png'),
+        ('Disabled type', open_channel, 'notes.pdf'),
+        ('Logged upload', open_channel, 'Photo.PNG'),
+    ]
+
+    results = []
+    for name, channel_id, filename in cases:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            if channel_id == int(config['log_channel']):
+                continue
+            if config.get('channel_tracking', 'all') == 'all':
+                if str(channel_id) in config.get('ignored_channels', []):
+                    continue
+            elif str(channel_id) not in config.get('tracked_channels', []):
+                continue
+            allowed_types = config.get('allowed_types', DEFAULT_MEDIA_TYPES)
+            file_ext = Path(filename).suffix.lower()
+            if file_ext not in allowed_types or not allowed_types[file_ext]:
+                continue
+            filetype_id(Path(filename).suffix.lower())
+        legacy_ns = (time.perf_counter() - start) / iterations * 1e9
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            if not media_filter.channel_allowed(channel_id):
+                continue
+            media_filter.type_of(filename)
+        compiled_ns = (time.perf_counter() - start) / iterations * 1e9
+
+        results.append({
+            'case': name,
+            'legacy_ns': legacy_ns,
+            'compiled_ns': compiled_ns,
+            'speedup': legacy_ns / compiled_ns if compiled_ns else 0
+        })
+    return results
+
+class DownloadScheduler:
+    """Shared aiohttp session with bounded, per-host limited downloads"""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_DOWNLOADS, per_host: int = MAX_DOWNLOADS_PER_HOST):
+        self.per_host = per_host
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._global = asyncio.Semaphore(max_concurrent)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self.max_concurrent = max_concurrent
+
+        # Metrics
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Cog-lifetime session, keeps TCP+TLS connections to the CDN alive between downloads"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent,
+                limit_per_host=self.per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=120, sock_connect=10, sock_read=30)
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Wait for a global and a per-host download slot"""
+        host = urlsplit(url).hostname or ''
+        host_sem = self._hosts.get(host)
+        if host_sem is None:
+            host_sem = self._hosts[host] = asyncio.Semaphore(self.per_host)
+
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+        try:
+            await self._global.acquire()
+            try:
+                await host_sem.acquire()
+            except BaseException:
+                self._global.release()
+                raise
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            yield self.session
+            self.completed += 1
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            host_sem.release()
+            self._global.release()
+
+    async def fetch_head_bytes(self, url: str, size: int = SIGNATURE_BYTES) -> Optional[bytes]:
+        """Fetch only the first ``size`` bytes using a Range request"""
+        async with self.slot(url) as session:
+            async with session.get(url, headers={'Range': f'bytes=0-{size - 1}'}) as resp:
+                if resp.status not in (200, 206):
+                    return None
+                # Servers that ignore Range send 200, only read what we need either way
+                return await resp.content.read(size)
+
+    async def stream_to(self, url: str, write: Callable[[bytes], Any], max_bytes: int) -> Optional[int]:
+        """Hand a download to ``write`` chunk by chunk; returns its size, None on failure or past ``max_bytes``
+
+        ``write`` may be a coroutine function, e.g. one that moves disk writes off the loop.
+        """
+        async with self.slot(url) as session:
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    return None
+                size = 0
+                async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        return None
+                    result = write(chunk)
+                    if inspect.isawaitable(result):
+                        await result
+                return size
+
+    async def fetch_bytes(self, url: str, max_bytes: int) -> Optional[bytes]:
+        """Stream a whole file into memory, giving up once it exceeds ``max_bytes``"""
+        async with self.slot(url) as session:
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    return None
+                buffer = io.BytesIO()
+                async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    buffer.write(chunk)
+                    if buffer.tell() > max_bytes:
+                        return None
+                return buffer.getvalue()
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            'in_flight': self.in_flight,
+            'queued': self.queued,
+            'peak_queued': self.peak_queued,
+            'completed': self.completed,
+            'failed': self.failed
+        }
+
+@dataclass
+class LogItem:
+    channel: discord.abc.Messageable
+    embed: discord.Embed
+    fallback: Optional[str] = None
+    future: Optional[asyncio.Future] = None
+    queued_at: float = field(default_factory=time.monotonic)
+
+class LogDispatcher:
+    """Outbound queue that packs log embeds from many source messages into few sends
+
+    Embeds submitted within ``DISPATCH_WINDOW`` are sent together, up to ten per
+    message, paced per channel (or webhook) bucket so bursts queue here instead of
+    piling up 429s inside the listener.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.webhook: Optional[discord.Webhook] = None
+        self.webhook_channel_id: Optional[int] = None
+        self._sent_at: Dict[str, deque] = {}
+        self._worker: Optional[asyncio.Task] = None
+        self._holding: List[LogItem] = []  # Batch taken off the queue but not sent yet
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Metrics
+        self.peak_depth = 0
+        self.batches = 0
+        self.embeds_sent = 0
+        self.rate_limit_waits = 0
+        self.failures = 0
+        self.last_lag = 0.0  # Seconds the newest batch waited in the queue
+
+    def start(self):
+        if self._worker is None or self._worker.done():
+            self._worker = self.bot.loop.create_task(self._run())
+
+    async def close(self):
+        """Stop the worker and send whatever is still held or queued
+
+        Anything that still can't be sent has its future failed, so no caller
+        is left waiting on a log message that will never come.
+        """
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        leftover = [item for item in self._holding if not item.future.done()]
+        self._holding = []
+        leftover += self._drain(self.queue.qsize())
+        for start in range(0, len(leftover), MAX_EMBEDS_PER_MESSAGE):
+            batch = leftover[start:start + MAX_EMBEDS_PER_MESSAGE]
+            try:
+                await self._send_batch(batch)
+            except Exception as e:
+                print(f"Media log dispatcher failed to flush on close: {e}")
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(RuntimeError("Media log dispatcher closed before sending"))
+                    item.future.exception()  # Mark retrieved, nobody may be awaiting it
+
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Small session of its own, so webhook sends never queue behind media downloads"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30, sock_connect=10)
+            )
+        return self._session
+
+    def set_webhook(self, url: Optional[str], channel_id: Optional[int]):
+        """Route embeds for ``channel_id`` through a webhook, or back to the bot when url is None"""
+        if url:
+            self.webhook = discord.Webhook.from_url(url, session=self.session)
+            self.webhook_channel_id = channel_id
+        else:
+            self.webhook = None
+            self.webhook_channel_id = None
+
+    def submit(self, channel, embed: discord.Embed, fallback: Optional[str] = None) -> asyncio.Future:
+        """Queue an embed, the future resolves to (log message, embed index) once sent"""
+        item = LogItem(channel, embed, fallback, self.bot.loop.create_future())
+        self.queue.put_nowait(item)
+        self.peak_depth = max(self.peak_depth, self.queue.qsize())
+        return item.future
+
+    def _drain(self, limit: int) -> List[LogItem]:
+        items = []
+        while len(items) < limit and not self.queue.empty():
+            items.append(self.queue.get_nowait())
+        return items
+
+    async def _run(self):
+        while True:
+            try:
+                batch = self._holding = [await self.queue.get()]
+                # Give other source messages a moment to join this batch
+                if self.queue.qsize() < MAX_EMBEDS_PER_MESSAGE - 1:
+                    await asyncio.sleep(DISPATCH_WINDOW)
+                batch.extend(self._drain(MAX_EMBEDS_PER_MESSAGE - 1))
+                await self._send_batch(batch)
+                self._holding = []
+            except asyncio.CancelledError:
+                raise  # close() picks up the held batch
+            except Exception as e:
+                for item in self._holding:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                        item.future.exception()
+                self._holding = []
+                print(f"Media log dispatcher error: {e}")
+
+    async def _send_batch(self, items: List[LogItem]):
+        """Group by destination and split on Discord's per-message embed limits"""
+        by_channel: Dict[int, List[LogItem]] = defaultdict(list)
+        for item in items:
+            by_channel[item.channel.id].append(item)
+
+        for group in by_channel.values():
+            chunk, chars = [], 0
+            for item in group:
+                size = len(item.embed)
+                if chunk and chars + size > MAX_EMBED_CHARS_PER_MESSAGE:
+                    await self._send(chunk)
+                    chunk, chars = [], 0
+                chunk.append(item)
+                chars += size
+            if chunk:
+                await self._send(chunk)
+
+    async def _pace(self, bucket: str, rate: int, per: float):
+        """Client-side token bucket so we stay under the route limit instead of hitting it"""
+        sent = self._sent_at.setdefault(bucket, deque(maxlen=rate))
+        if len(sent) == rate:
+            wait = per - (time.monotonic() - sent[0])
+            if wait > 0:
+                self.rate_limit_waits += 1
+                await asyncio.sleep(wait)
+        sent.append(time.monotonic())
+
+    async def _deliver(self, channel, embeds: List[discord.Embed]) -> discord.Message:
+        if self.webhook and channel.id == self.webhook_channel_id:
+            await self._pace(f'webhook:{self.webhook.id}', *WEBHOOK_RATE)
+            return await self.webhook.send(
+                embeds=embeds,
+                username="Media Logger",
+                avatar_url=self.bot.user.display_avatar.url,
+                wait=True
+            )
+        await self._pace(f'channel:{channel.id}', *CHANNEL_RATE)
+        return await channel.send(embeds=embeds)
+
+    async def _send(self, items: List[LogItem]):
+        self.last_lag = time.monotonic() - items[0].queued_at
+        try:
+            log_message = await self._deliver(items[0].channel, [i.embed for i in items])
+        except discord.HTTPException as e:
+            if len(items) > 1:
+                # One bad embed shouldn't sink the whole batch
+                for item in items:
+                    await self._send([item])
+                return
+            await self._send_fallback(items[0], e)
+            return
+
+        self.batches += 1
+        self.embeds_sent += len(items)
+        for index, item in enumerate(items):
+            if not item.future.done():
+                item.future.set_result((log_message, index))
+
+    async def _send_fallback(self, item: LogItem, error: Exception):
+        """Fallback to simple text logging if the embed can't be sent"""
+        self.failures += 1
+        if item.fallback:
+            try:
+                await self._deliver_text(item.channel, item.fallback)
+            except discord.HTTPException:
+                print(f"Failed to log media: {error}")
+        if not item.future.done():
+            item.future.set_exception(error)
+            item.future.exception()  # Mark retrieved, nobody may be awaiting it
+
+    async def _deliver_text(self, channel, content: str):
+        await self._pace(f'channel:{channel.id}', *CHANNEL_RATE)
+        await channel.send(content)
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            'depth': self.queue.qsize(),
+            'peak_depth': self.peak_depth,
+            'batches': self.batches,
+            'embeds': self.embeds_sent,
+            'per_batch': round(self.embeds_sent / self.batches, 1) if self.batches else 0,
+            'waits': self.rate_limit_waits,
+            'failures': self.failures,
+            'lag': round(self.last_lag, 1)
+        }
+
+class MediaHashIndex:
+    """Content hash -> original log entry, bounded LRU in front of the plugin DB"""
+
+    def __init__(self, db, downloads: DownloadScheduler, max_size: int = DEDUP_CACHE_SIZE):
+        self.db = db
+        self.downloads = downloads
+        self.max_size = max_size
+        self._cache: OrderedDict = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.hash_failures = 0
+
+    async def compute_key(self, attachment: discord.Attachment) -> Optional[str]:
+        """Content key: size + SHA-256 of the whole image, or of the first bytes for everything else
+
+        Only exact matches collapse; a false match would hide content from the
+        moderation log.
+        """
+        try:
+            ext = Path(attachment.filename).suffix.lower()
+            if ext in IMAGE_EXTS and attachment.size <= DEDUP_MAX_IMAGE_BYTES:
+                data = await self.downloads.fetch_bytes(attachment.url, DEDUP_MAX_IMAGE_BYTES)
+                if data:
+                    digest = await asyncio.to_thread(lambda: hashlib.sha256(data).hexdigest())
+                    return f's:{len(data)}:{digest}'
+
+            prefix = await self.downloads.fetch_head_bytes(attachment.url, DEDUP_PREFIX_BYTES)
+            if prefix is None:
+                self.hash_failures += 1
+                return None
+            return f's:{attachment.size}:{hashlib.sha256(prefix).hexdigest()}'
+        except Exception:
+            self.hash_failures += 1
+            return None
+
+    def _remember(self, key: str, entry: dict):
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    async def lookup(self, key: str) -> Optional[dict]:
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+        else:
+            doc = await self.db.find_one({'_id': f'hash_{key}'})
+            if doc:
+                entry = {
+                    'channel_id': doc['channel_id'],
+                    'message_id': doc['message_id'],
+                    'embed_index': doc.get('embed_index', 0),
+                    'count': doc.get('count', 0)
+                }
+                self._remember(key, entry)
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def register(self, key: str, channel_id: int, message_id: int, embed_index: int = 0):
+        """Record the log entry that now represents this content"""
+        entry = {'channel_id': channel_id, 'message_id': message_id, 'embed_index': embed_index, 'count': 0}
+        self._remember(key, entry)
+        await self.db.update_one(
+            {'_id': f'hash_{key}'},
+            {'$set': {'type': 'media_hash', 'last_seen': datetime.utcnow(), **entry}},
+            upsert=True
+        )
+
+    async def bump(self, key: str, entry: dict):
+        """Count a repost against the original log entry"""
+        entry['count'] += 1
+        await self.db.update_one(
+            {'_id': f'hash_{key}'},
+            {'$inc': {'count': 1}, '$set': {'last_seen': datetime.utcnow()}}
+        )
+
+    def forget(self, key: str):
+        self._cache.pop(key, None)
+
+    def metrics(self) -> Dict[str, int]:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(100 * self.hits / total) if total else 0,
+            'cached': len(self._cache),
+            'failures': self.hash_failures
+        }
+
+class ArchiveStore:
+    """Where archived files end up, addressed by their content hash"""
+    name = 'none'
+
+    @staticmethod
+    def key_for(digest: str, ext: str) -> str:
+        # Fan out by hash prefix so no single directory grows huge
+        return f"{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+    def staging_dir(self) -> Optional[str]:
+        """Where downloads are spooled before ``put``, None for the system temp dir"""
+        return None
+
+    async def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    async def put(self, key: str, path: str, content_type: Optional[str]):
+        """Move a fully downloaded file into the store"""
+        raise NotImplementedError
+
+    def location(self, key: str) -> str:
+        raise NotImplementedError
+
+class LocalArchiveStore(ArchiveStore):
+    """Plain directory tree on the bot's filesystem"""
+    name = 'local'
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        # Staging inside the root keeps the final move a same-filesystem rename
+        self._staging = self.root / '.staging'
+        self._staging_ready = False
+
+    def staging_dir(self) -> Optional[str]:
+        # Created on the first archive write, not when the cog loads with archiving off
+        if not self._staging_ready:
+            self._staging.mkdir(parents=True, exist_ok=True)
+            self._staging_ready = True
+        return str(self._staging)
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread((self.root / key).exists)
+
+    async def put(self, key: str, path: str, content_type: Optional[str]):
+        target = self.root / key
+
+        def move():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, target)
+
+        await asyncio.to_thread(move)
+
+    def location(self, key: str) -> str:
+        return str(self.root / key)
+
+class S3ArchiveStore(ArchiveStore):
+    """S3-compatible bucket (AWS, MinIO, ...), uploads are multipart from the spooled file"""
+    name = 's3'
+
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None, region: Optional[str] = None,
+                 access_key: Optional[str] = None, secret_key: Optional[str] = None):
+        self.bucket = bucket
+        self._client = boto3.client(
+            's3',
+            endpoint_url=endpoint_url,
+            region_name=region,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key
+        )
+
+    async def exists(self, key: str) -> bool:
+        def head():
+            try:
+                self._client.head_object(Bucket=self.bucket, Key=key)
+                return True
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                    return False
+                raise
+
+        return await asyncio.to_thread(head)
+
+    async def put(self, key: str, path: str, content_type: Optional[str]):
+        extra = {'ContentType': content_type} if content_type else None
+        await asyncio.to_thread(self._client.upload_file, path, self.bucket, key, ExtraArgs=extra)
+
+    def location(self, key: str) -> str:
+        return f"s3://{self.bucket}/{key}"
+
+def archive_store_from_env() -> ArchiveStore:
+    """S3 store when MEDIALOG_S3_BUCKET is set and boto3 is installed, local directory otherwise"""
+    bucket = os.environ.get('MEDIALOG_S3_BUCKET')
+    if bucket:
+        if HAS_BOTO3:
+            return S3ArchiveStore(
+                bucket,
+                endpoint_url=os.environ.get('MEDIALOG_S3_ENDPOINT'),
+                region=os.environ.get('MEDIALOG_S3_REGION'),
+                access_key=os.environ.get('MEDIALOG_S3_ACCESS_KEY'),
+                secret_key=os.environ.get('MEDIALOG_S3_SECRET_KEY')
+            )
+        print("MEDIALOG_S3_BUCKET is set but boto3 is missing, archiving to the local store")
+    return LocalArchiveStore(ARCHIVE_DIR)
+
+@dataclass
+class ArchiveJob:
+    attachment: discord.Attachment
+    message_id: int
+    channel_id: int
+    guild_id: int
+    user_id: int
+
+class MediaArchiver:
+    """Bounded worker pool streaming accepted attachments into an ArchiveStore"""
+
+    def __init__(self, bot, db, downloads: DownloadScheduler, store: ArchiveStore,
+                 workers: int = ARCHIVE_WORKERS, queue_size: int = ARCHIVE_QUEUE_SIZE):
+        self.bot = bot
+        self.db = db
+        self.downloads = downloads
+        self.store = store
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._tasks: List[asyncio.Task] = []
+
+        # Metrics
+        self.active = 0
+        self.archived = 0
+        self.deduped = 0  # Content already in the store, only indexed
+        self.failed = 0
+        self.dropped = 0  # Queue was full
+        self.bytes_stored = 0
+
+    def start(self):
+        self._tasks = [t for t in self._tasks if not t.done()]
+        while len(self._tasks) < self.workers:
+            self._tasks.append(self.bot.loop.create_task(self._run()))
+
+    async def close(self, timeout: float = ARCHIVE_DRAIN_TIMEOUT):
+        """Give queued jobs a moment to finish, then stop the workers"""
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, job: ArchiveJob) -> bool:
+        """Queue a job without waiting, dropping it when the pool is saturated"""
+        try:
+            self.queue.put_nowait(job)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+
+    async def _run(self):
+        while True:
+            job = await self.queue.get()
+            self.active += 1
+            try:
+                await self._archive(job)
+            except Exception as e:
+                self.failed += 1
+                print(f"Failed to archive {job.attachment.filename}: {e}")
+            finally:
+                self.active -= 1
+                self.queue.task_done()
+
+    async def _archive(self, job: ArchiveJob):
+        """Spool the download to disk while hashing it, then file it under its hash"""
+        attachment = job.attachment
+        digest = hashlib.sha256()
+        fd, tmp_path = await asyncio.to_thread(
+            tempfile.mkstemp, suffix='.part', dir=self.store.staging_dir()
+        )
+        try:
+            with os.fdopen(fd, 'wb') as sink:
+                def write_sync(chunk: bytes):
+                    digest.update(chunk)
+                    sink.write(chunk)
+
+                async def write(chunk: bytes):
+                    # Disk writes and hashing stay off the event loop
+                    await asyncio.to_thread(write_sync, chunk)
+
+                size = await self.downloads.stream_to(attachment.url, write, MAX_ATTACHMENT_SIZE)
+            if size is None:
+                raise ValueError("download failed or exceeded the size limit")
+
+            sha256 = digest.hexdigest()
+            key = self.store.key_for(sha256, Path(attachment.filename).suffix.lower())
+            if await self.store.exists(key):
+                self.deduped += 1
+            else:
+                await self.store.put(key, tmp_path, attachment.content_type)
+                self.bytes_stored += size
+
+            await self.db.update_one(
+                {'_id': f'archive_{attachment.id}'},
+                {'$set': {
+                    'type': 'archive_entry',
+                    'sha256': sha256,
+                    'key': key,
+                    'store': self.store.name,
+                    'location': self.store.location(key),
+                    'filename': attachment.filename,
+                    'size': size,
+                    'content_type': attachment.content_type,
+                    'message_id': job.message_id,
+                    'channel_id': job.channel_id,
+                    'guild_id': job.guild_id,
+                    'user_id': job.user_id,
+                    'archived_at': datetime.utcnow()
+                }},
+                upsert=True
+            )
+            self.archived += 1
+        finally:
+            def cleanup():
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+            await asyncio.to_thread(cleanup)
+
+    async def find(self, query: dict, limit: int = 10) -> List[dict]:
+        """Newest index entries matching ``query``"""
+        cursor = self.db.find({'type': 'archive_entry', **query}).sort('archived_at', -1).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            'queued': self.queue.qsize(),
+            'active': self.active,
+            'archived': self.archived,
+            'deduped': self.deduped,
+            'failed': self.failed,
+            'dropped': self.dropped,
+            'bytes_stored': self.bytes_stored
+        }
+
 class MediaLogger(commands.Cog):
     """Advanced Modmail plugin for media logging with smart user tracking"""
 
@@ -212,31 +1233,101 @@ class MediaLogger(commands.Cog):
         self.bot = bot
         self.db = self.bot.plugin_db.get_partition(self)
         self.config_cache = None
+        self.media_filter = MediaFilter({})  # Compiled from config_cache on every load
         self._last_config_fetch = 0
         
         # Memory-optimized user stats
-        self.user_stats = {}  # {user_id: {uploads, deletes, last_upload, file_types}}
+        self.user_stats = UserStatsTable()  # {user_id: UserStats} in last-upload order
+        self._stats_deltas: Dict[int, UserStatsDelta] = {}  # Dirty users waiting for the next flush
+        self._stats_inflight: Dict[int, UserStatsDelta] = {}  # Deltas in the flush being written
         self.server_stats = {'total_uploads': 0, 'total_deletes': 0}
         self.stats_threshold = 1000  # Member count threshold for tracking
         
+        # Tracked messages {message_id: {'user_id', 'count'}}, one DB doc each, written behind
+        self.tracked_messages: Dict[int, dict] = {}
+        self._pending_tracked: Dict[int, dict] = {}  # Upserts waiting for the next flush
+        self._pending_untracked: Set[int] = set()  # Deletes waiting for the next flush
+
+        # Shared HTTP session and bounded attachment downloads
+        self.downloads = DownloadScheduler()
+
+        # Batched, rate-limit paced log output
+        self.dispatcher = LogDispatcher(self.bot)
+        self.dispatcher.start()
+
+        # Repost detection, {(log_message_id, embed_index): {'channel_id', 'key', 'count', 'last_url'}} awaiting an edit
+        self.hash_index = MediaHashIndex(self.db, self.downloads)
+        self._pending_reposts: Dict[tuple, dict] = {}
+
+        # Archival of accepted attachments into a local or S3-compatible store
+        self.archiver = MediaArchiver(self.bot, self.db, self.downloads, archive_store_from_env())
+        self.archiver.start()
+
         # Start background tasks
-        self.tracked_messages = set()
         self.clean_stats.start()
         self.save_stats_to_db.start()
+        self.flush_tracked_messages.start()
+        self.flush_repost_counters.start()
+        self.bot.loop.create_task(self._create_indexes())
+        # on_ready doesn't fire after a reload or hot install, so pick up the webhook sink now
+        self.bot.loop.create_task(self.apply_webhook_config())
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self.clean_stats.cancel()
         self.save_stats_to_db.cancel()
+        self.flush_tracked_messages.cancel()
+        self.flush_repost_counters.cancel()
+        await self._flush_user_stats()
+        await self._flush_tracked_messages()
+        await self._flush_repost_counters()
+        await self.dispatcher.close()
+        await self.archiver.close()
+        await self.downloads.close()
+
+    async def _create_indexes(self):
+        """TTL index so tracked message docs expire on their own"""
+        try:
+            await self.db.create_index(
+                'timestamp',
+                name='tracked_message_ttl',
+                expireAfterSeconds=TRACKED_MESSAGE_TTL,
+                partialFilterExpression={'type': 'tracked_message'}
+            )
+            await self.db.create_index(
+                'last_upload',
+                name='user_stats_ttl',
+                expireAfterSeconds=STATS_PRUNE_DAYS * 86400,
+                partialFilterExpression={'type': 'user_stats'}
+            )
+            await self.db.create_index(
+                'last_seen',
+                name='media_hash_ttl',
+                expireAfterSeconds=DEDUP_TTL,
+                partialFilterExpression={'type': 'media_hash'}
+            )
+            # Archive index lookups by uploader, message and content hash
+            for keys, name in (
+                ([('user_id', 1), ('archived_at', -1)], 'archive_user'),
+                ([('message_id', 1)], 'archive_message'),
+                ([('sha256', 1)], 'archive_sha256'),
+            ):
+                await self.db.create_index(
+                    keys, name=name, partialFilterExpression={'type': 'archive_entry'}
+                )
+        except PyMongoError as e:
+            print(f"Failed to create media-logger indexes: {e}")
 
     async def invalidate_config_cache(self):
-        """Force refresh config cache on next access"""
+        """Reload config and recompile the message filter right away"""
         self.config_cache = None
         self._last_config_fetch = 0
+        await self.get_config()
 
     async def get_config(self):
         """Get config with caching"""
         if not self.config_cache or time.time() - self._last_config_fetch > CACHE_TTL:
             self.config_cache = await self.db.find_one({'_id': 'config'}) or {}
+            self.media_filter = MediaFilter(self.config_cache)
             self._last_config_fetch = time.time()
         return self.config_cache
 
@@ -245,23 +1336,32 @@ class MediaLogger(commands.Cog):
         channel_id = config.get('log_channel')
         return self.bot.get_channel(int(channel_id)) if channel_id else None
 
+    async def apply_webhook_config(self):
+        """Point the dispatcher at the configured webhook sink, if any"""
+        try:
+            config = await self.get_config()
+        except PyMongoError as e:
+            print(f"Failed to load media-logger webhook config: {e}")
+            return
+        channel_id = config.get('log_channel')
+        self.dispatcher.set_webhook(
+            config.get('log_webhook_url'),
+            int(channel_id) if channel_id else None
+        )
+
     async def process_attachments(self, message: discord.Message, log_channel: discord.TextChannel):
         """Process and log valid attachments"""
-        config = await self.get_config()
-        allowed_types = config.get("allowed_types", DEFAULT_MEDIA_TYPES)
+        await self.get_config()
+        media_filter = self.media_filter
 
-        valid_attachments = [
-            att for att in message.attachments
-            if Path(att.filename).suffix.lower() in allowed_types
-            and allowed_types[Path(att.filename).suffix.lower()]
-        ]
+        valid_attachments = [att for att in message.attachments if media_filter.type_of(att.filename) is not None]
 
         if not valid_attachments:
             return
 
         # Update stats
-        if message.guild.member_count < self.stats_threshold or config.get("force_enabled", False):
-            await self.update_user_stats(str(message.author.id), message.channel, valid_attachments)
+        if message.guild.member_count < self.stats_threshold or media_filter.force_enabled:
+            await self.update_user_stats(message.author.id, message.channel, valid_attachments)
             self.server_stats['total_uploads'] += len(valid_attachments)
 
         # Log each attachment
@@ -281,21 +1381,14 @@ class MediaLogger(commands.Cog):
                 if attachment.filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
                     embed.set_thumbnail(url=attachment.url)
 
-                await log_channel.send(embed=embed)
+                self.dispatcher.submit(log_channel, embed)
 
             except discord.HTTPException as e:
                 print(f"Failed to log media: {e}")
 
     async def is_ignored(self, channel):
-        config = await self.get_config()
-        ignored_channels = config.get('ignored_channels', [])
-        tracked_channels = config.get('tracked_channels', [])
-        
-        # If channel tracking is opt-in and this channel isn't tracked
-        if config.get('channel_tracking') == 'opt-in' and str(channel.id) not in tracked_channels:
-            return True
-            
-        return str(channel.id) in ignored_channels
+        await self.get_config()
+        return not self.media_filter.channel_allowed(channel.id)
 
     async def validate_attachment(self, attachment: discord.Attachment, allowed_types: Dict[str, bool]) -> bool:
         """Validate attachment with header checks and size limits."""
@@ -311,14 +1404,9 @@ class MediaLogger(commands.Cog):
             return True
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(attachment.url) as resp:
-                    if resp.status != 200:
-                        return False
-                    
-                    # Read first 256 bytes for file signature
-                    chunk = await resp.content.read(256)
-                    return self.validate_file_signature(ext, chunk)
+            # Read first 256 bytes for file signature
+            chunk = await self.downloads.fetch_head_bytes(attachment.url)
+            return chunk is not None and self.validate_file_signature(ext, chunk)
         except Exception:
             return False
 
@@ -336,17 +1424,16 @@ class MediaLogger(commands.Cog):
         return ext not in signatures or header.startswith(signatures[ext])
 
     async def stream_attachment(self, attachment: discord.Attachment) -> Optional[discord.File]:
-        """Stream large attachments >5MB without full download."""
+        """Stream large attachments >5MB in chunks, spilling to disk instead of holding them in memory."""
+        buffer = tempfile.SpooledTemporaryFile(max_size=MAX_DIRECT_UPLOAD_SIZE)
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(attachment.url) as resp:
-                    if resp.status != 200:
-                        return None
-                    return discord.File(
-                        fp=resp.content,
-                        filename=attachment.filename
-                    )
+            if await self.downloads.stream_to(attachment.url, buffer.write, MAX_ATTACHMENT_SIZE) is None:
+                buffer.close()
+                return None
+            buffer.seek(0)
+            return discord.File(fp=buffer, filename=attachment.filename)
         except Exception:
+            buffer.close()
             return None
 
     async def handle_attachment(self, attachment: discord.Attachment) -> Optional[discord.File]:
@@ -355,31 +1442,174 @@ class MediaLogger(commands.Cog):
             return await attachment.to_file()
         return await self.stream_attachment(attachment)
 
-    async def update_user_stats(self, user_id: str, channel: discord.TextChannel, attachments: list):
-        """Update user stats with memory limits."""
-        if len(self.user_stats) >= MAX_TRACKED_USERS:
-            oldest_user = min(self.user_stats.items(), key=lambda x: x[1]['last_upload'])
-            del self.user_stats[oldest_user[0]]
+    async def collapse_duplicates(self, message: discord.Message, attachments: list):
+        """Split attachments into new content and reposts of already logged content.
 
-        if user_id not in self.user_stats:
-            self.user_stats[user_id] = {
-                'uploads': 0,
-                'deletes': 0,
-                'last_upload': datetime.utcnow(),
-                'type_stats': defaultdict(int),
-                'channel_stats': defaultdict(int)
-            }
+        Reposts only bump a counter on the original log entry; returns the new
+        attachments plus their content keys for registering once logged.
+        """
+        keys = await asyncio.gather(*(self.hash_index.compute_key(a) for a in attachments))
 
-        user_data = self.user_stats[user_id]
+        fresh, fresh_keys, seen = [], {}, set()
+        for attachment, key in zip(attachments, keys):
+            if key is None:
+                fresh.append(attachment)
+                continue
+            if key in seen:  # Same file twice in one message
+                continue
+            seen.add(key)
+
+            entry = await self.hash_index.lookup(key)
+            if entry is None:
+                fresh.append(attachment)
+                fresh_keys[attachment.id] = key
+                continue
+
+            await self.hash_index.bump(key, entry)
+            logger.debug(
+                f"media-logger: {attachment.filename} ({attachment.size} bytes) in message {message.id} "
+                f"collapsed into log message {entry['message_id']} (key {key})"
+            )
+            # Keyed per embed, a batched log message can hold several originals
+            pending = self._pending_reposts.setdefault(
+                (entry['message_id'], entry.get('embed_index', 0)),
+                {'channel_id': entry['channel_id'], 'key': key}
+            )
+            pending['count'] = entry['count']
+            pending['last_url'] = message.jump_url
+
+        return fresh, fresh_keys
+
+    async def _register_content(self, content_keys: Dict[int, str], logged_in: Dict[int, asyncio.Future]):
+        """Map content hashes to their log message after the batched send completes"""
+        for attachment_id, key in content_keys.items():
+            future = logged_in.get(attachment_id)
+            if not future:
+                continue
+            try:
+                log_message, embed_index = await future
+                await self.hash_index.register(key, log_message.channel.id, log_message.id, embed_index)
+            except discord.HTTPException:
+                continue  # Not logged as an embed, nothing to point reposts at
+            except PyMongoError as e:
+                print(f"Failed to store media hash: {e}")
+
+    async def _flush_repost_counters(self):
+        """Edit each original log message once with the latest repost counts"""
+        pending, self._pending_reposts = self._pending_reposts, {}
+        by_message: Dict[int, Dict[int, dict]] = defaultdict(dict)
+        for (message_id, embed_index), info in pending.items():
+            by_message[message_id][embed_index] = info
+
+        for message_id, updates in by_message.items():
+            channel = self.bot.get_channel(next(iter(updates.values()))['channel_id'])
+            if not channel:
+                continue
+            try:
+                log_message = await channel.fetch_message(message_id)
+                # Batched log messages carry several embeds, only touch the matching ones
+                embeds = log_message.embeds
+                for embed_index, info in updates.items():
+                    if embed_index >= len(embeds):
+                        continue
+                    embed = embeds[embed_index]
+                    value = f"**{info['count']}** time(s), latest [here]({info['last_url']})"
+                    for index, field in enumerate(embed.fields):
+                        if field.name == "🔁 Reposted":
+                            embed.set_field_at(index, name=field.name, value=value, inline=False)
+                            break
+                    else:
+                        embed.add_field(name="🔁 Reposted", value=value, inline=False)
+
+                if log_message.webhook_id:
+                    webhook = self.dispatcher.webhook
+                    if not webhook or webhook.id != log_message.webhook_id:
+                        continue
+                    await webhook.edit_message(message_id, embeds=embeds)
+                else:
+                    await log_message.edit(embeds=embeds)
+            except discord.NotFound:
+                # Original log entry is gone, the next repost gets logged fresh
+                for info in updates.values():
+                    self.hash_index.forget(info['key'])
+                    await self.db.delete_one({'_id': f"hash_{info['key']}"})
+            except discord.HTTPException as e:
+                print(f"Failed to update repost counter: {e}")
+
+    async def update_user_stats(self, user_id: int, channel: discord.TextChannel, attachments: list,
+                                type_ids: Optional[List[int]] = None):
+        """Update user stats with memory limits, evicting the least recent uploader in O(1)."""
+        if type_ids is None:
+            type_ids = [filetype_id(Path(a.filename).suffix.lower()) for a in attachments]
+        now = datetime.utcnow()
+        user_data = self.user_stats.touch(user_id, now)
+        delta = self._stats_deltas.get(user_id)
+        if delta is None:
+            delta = self._stats_deltas[user_id] = UserStatsDelta()
 
         # Process each attachment
-        for attachment in attachments:
-            filetype = Path(attachment.filename).suffix.lower()
-            user_data["type_stats"][filetype] += 1
-            user_data["channel_stats"][str(channel.id)] += 1
+        for type_id in type_ids:
+            user_data.add_upload(type_id, channel.id)
+            delta.type_stats[type_id] = delta.type_stats.get(type_id, 0) + 1
+            delta.channel_stats[channel.id] = delta.channel_stats.get(channel.id, 0) + 1
+
+        user_data.uploads += len(attachments)
+        delta.uploads += len(attachments)
+        delta.last_upload = now
+
+    def record_user_deletes(self, user_id: int, count: int):
+        """Count deleted uploads, even for users no longer held in memory"""
+        user_data = self.user_stats.get(user_id)
+        if user_data:
+            user_data.deletes += count
+        delta = self._stats_deltas.get(user_id)
+        if delta is None:
+            delta = self._stats_deltas[user_id] = UserStatsDelta()
+        delta.deletes += count
+
+    async def get_user_stats(self, user_id: int) -> Optional[UserStats]:
+        """Load a single user's stats on demand: DB document plus unflushed deltas"""
+        user_data = self.user_stats.get(user_id)
+        if user_data and user_data.loaded:
+            return user_data
+
+        doc = await self.db.find_one({'_id': f'user_{user_id}'})
+        if not doc and not user_data:
+            return None
 
-        user_data['uploads'] += len(attachments)
-        user_data['last_upload'] = datetime.utcnow()
+        merged = UserStats.from_doc(doc) if doc else UserStats(None)
+        for pending in (self._stats_inflight.get(user_id), self._stats_deltas.get(user_id)):
+            if pending:
+                pending.apply_to(merged)
+        merged.loaded = True
+
+        # Only cache users that are still active, don't let lookups evict uploaders
+        self.user_stats.replace(user_id, merged)
+        return merged
+
+    async def _flush_user_stats(self):
+        """Write dirty users' deltas as one unordered bulk of $inc upserts"""
+        if not self._stats_deltas:
+            return
+
+        self._stats_inflight, self._stats_deltas = self._stats_deltas, {}
+        operations = [
+            UpdateOne({'_id': f'user_{user_id}'}, delta.to_update(), upsert=True)
+            for user_id, delta in self._stats_inflight.items()
+        ]
+        try:
+            await self.db.bulk_write(operations, ordered=False)
+        except PyMongoError as e:
+            print(f"Failed to flush user stats: {e}")
+            # Fold the failed deltas back in so nothing is lost
+            for user_id, delta in self._stats_inflight.items():
+                newer = self._stats_deltas.get(user_id)
+                if newer:
+                    delta.merge_into(newer)
+                else:
+                    self._stats_deltas[user_id] = delta
+        finally:
+            self._stats_inflight = {}
 
     # ┌───────────────────────┬────────────┬───────────────────────┐
     # ├───────────────────────┤ TASKS.LOOP ├───────────────────────┤
@@ -389,48 +1619,152 @@ class MediaLogger(commands.Cog):
         """Prune old stats and enforce memory limits."""
         cutoff = datetime.utcnow() - timedelta(days=STATS_PRUNE_DAYS)
 
-        # Prune old user stats
-        for user_id in list(self.user_stats.keys()):
-            if self.user_stats[user_id]['last_upload'] < cutoff:
-                del self.user_stats[user_id]
+        # Prune old user stats, the table is ordered so this stops at the first recent user
+        # (max tracked users is enforced on insert)
+        self.user_stats.prune(cutoff)
 
-        # Enforce max tracked users
-        while len(self.user_stats) > MAX_TRACKED_USERS:
-            oldest_user = min(self.user_stats.items(), key=lambda x: x[1]['last_upload'])
-            del self.user_stats[oldest_user[0]]
+    # ┌───────────────────────┬────────────┬───────────────────────┐
+    # ├───────────────────────┤ TASKS.LOOP ├───────────────────────┤
+    # └───────────────────────┴────────────┴───────────────────────┘
+    @tasks.loop(seconds=REPOST_EDIT_INTERVAL)
+    async def flush_repost_counters(self):
+        """Coalesce repost counter edits on log entries."""
+        await self._flush_repost_counters()
 
     # ┌───────────────────────┬────────────┬───────────────────────┐
     # ├───────────────────────┤ TASKS.LOOP ├───────────────────────┤
     # └───────────────────────┴────────────┴───────────────────────┘
-    @tasks.loop(hours=6)
-    async def save_stats_to_db(self):
-        """Periodically save stats to database."""
-        if not self.user_stats:
-            return
+    @tasks.loop(seconds=TRACKED_FLUSH_INTERVAL)
+    async def flush_tracked_messages(self):
+        """Write-behind flush for tracked message docs."""
+        await self._flush_tracked_messages()
 
-        await self.db.find_one_and_update(
-            {'_id': 'user_stats'},
-            {'$set': {'data': self.user_stats}},
-            upsert=True
-        )
+    # ┌───────────────────────┬────────────┬───────────────────────┐
+    # ├───────────────────────┤ TASKS.LOOP ├───────────────────────┤
+    # └───────────────────────┴────────────┴───────────────────────┘
+    @tasks.loop(seconds=STATS_FLUSH_INTERVAL)
+    async def save_stats_to_db(self):
+        """Periodically flush dirty users' stats to database."""
+        await self._flush_user_stats()
 
     async def load_stats_from_db(self):
-        """Load stats from database on startup."""
+        """Migrate the legacy single stats doc; users are loaded lazily afterwards."""
         data = await self.db.find_one({'_id': 'user_stats'})
-        if data and 'data' in data:
-            self.user_stats = data['data']
+        if not data:
+            return
+
+        # Prune immediately on migration, the TTL index handles the rest
+        cutoff = datetime.utcnow() - timedelta(days=STATS_PRUNE_DAYS)
+        operations = [
+            UpdateOne(
+                {'_id': f'user_{k}'},
+                {'$setOnInsert': {'type': 'user_stats', **UserStats.from_doc(v).to_doc()}},
+                upsert=True
+            )
+            for k, v in data.get('data', {}).items()
+            if v.get('last_upload') and v['last_upload'] >= cutoff
+        ]
+        try:
+            if operations:
+                await self.db.bulk_write(operations, ordered=False)
+            await self.db.delete_one({'_id': 'user_stats'})
+        except PyMongoError as e:
+            print(f"Failed to migrate user stats: {e}")
+
+    def track_message(self, message_id: int, user_id: str, count: int, timestamp: datetime):
+        """Remember a logged message in memory and queue its DB upsert"""
+        entry = {'user_id': user_id, 'count': count}
+        self.tracked_messages[message_id] = entry
+        self._pending_untracked.discard(message_id)
+        self._pending_tracked[message_id] = {**entry, 'timestamp': timestamp}
+
+        # Dicts keep insertion order, so the first key is the oldest entry
+        while len(self.tracked_messages) > MAX_TRACKED_MESSAGES:
+            self.tracked_messages.pop(next(iter(self.tracked_messages)))
+
+    def untrack_message(self, message_id: int) -> Optional[dict]:
+        """Forget a tracked message, coalescing with a still-pending upsert"""
+        entry = self.tracked_messages.pop(message_id, None)
+        if entry is None:
+            return None  # Never tracked, nothing stored to delete
+        if self._pending_tracked.pop(message_id, None) is None:
+            self._pending_untracked.add(message_id)  # Already flushed, needs a DB delete
+        return entry
+
+    async def _flush_tracked_messages(self):
+        """Write all queued tracked-message changes in a single bulk operation"""
+        if not self._pending_tracked and not self._pending_untracked:
+            return
 
-            # Prune immediately on load
-            cutoff = datetime.utcnow() - timedelta(days=STATS_PRUNE_DAYS)
-            self.user_stats = {
-                k: v for k, v in self.user_stats.items()
-                if v['last_upload'] >= cutoff
-            }
+        tracked, self._pending_tracked = self._pending_tracked, {}
+        untracked, self._pending_untracked = self._pending_untracked, set()
+
+        operations = [
+            UpdateOne(
+                {'_id': f'msg_{message_id}'},
+                {'$set': {'type': 'tracked_message', 'message_id': message_id, **data}},
+                upsert=True
+            )
+            for message_id, data in tracked.items()
+        ]
+        operations.extend(DeleteOne({'_id': f'msg_{message_id}'}) for message_id in untracked)
+
+        try:
+            await self.db.bulk_write(operations, ordered=False)
+        except PyMongoError as e:
+            print(f"Failed to flush tracked messages: {e}")
+            # Requeue without clobbering anything that changed meanwhile
+            for message_id, data in tracked.items():
+                if message_id in self.tracked_messages:
+                    self._pending_tracked.setdefault(message_id, data)
+            self._pending_untracked.update(m for m in untracked if m not in self.tracked_messages)
 
     async def load_tracked_messages(self):
         """Load tracked messages from database on startup"""
-        data = await self.db.find_one({'_id': 'tracked_messages'}) or {}
-        self.tracked_messages = {int(k) for k in data.keys() if k != '_id'}
+        await self._migrate_tracked_messages()
+
+        cutoff = datetime.utcnow() - timedelta(seconds=TRACKED_MESSAGE_TTL)
+        cursor = self.db.find(
+            {'type': 'tracked_message', 'timestamp': {'$gte': cutoff}},
+            {'message_id': 1, 'user_id': 1, 'count': 1}
+        ).sort('timestamp', -1).limit(MAX_TRACKED_MESSAGES)
+
+        loaded = {}
+        async for doc in cursor:
+            loaded[doc['message_id']] = {'user_id': doc['user_id'], 'count': doc['count']}
+
+        # Oldest first so eviction order matches insertion order, keep anything tracked since startup
+        self.tracked_messages = {**dict(reversed(loaded.items())), **self.tracked_messages}
+
+    async def _migrate_tracked_messages(self):
+        """Split the legacy single 'tracked_messages' document into per-message docs"""
+        legacy = await self.db.find_one({'_id': 'tracked_messages'})
+        if not legacy:
+            return
+
+        cutoff = time.time() - TRACKED_MESSAGE_TTL
+        operations = [
+            UpdateOne(
+                {'_id': f'msg_{key}'},
+                {'$setOnInsert': {
+                    'type': 'tracked_message',
+                    'message_id': int(key),
+                    'user_id': data['user_id'],
+                    'count': data['count'],
+                    'timestamp': datetime.utcfromtimestamp(data['timestamp'])
+                }},
+                upsert=True
+            )
+            for key, data in legacy.items()
+            if key != '_id' and isinstance(data, dict) and data.get('timestamp', 0) >= cutoff
+        ]
+
+        try:
+            if operations:
+                await self.db.bulk_write(operations, ordered=False)
+            await self.db.delete_one({'_id': 'tracked_messages'})
+        except PyMongoError as e:
+            print(f"Failed to migrate tracked messages: {e}")
 
     # ┌──────────────────────┬──────────────┬──────────────────────┐
     # ├──────────────────────┤ COG_LISTENER ├──────────────────────┤
@@ -439,6 +1773,7 @@ class MediaLogger(commands.Cog):
     async def on_ready(self):
         await self.load_stats_from_db()
         await self.load_tracked_messages()
+        await self.apply_webhook_config()
 
     # ┌──────────────────────┬──────────────┬──────────────────────┐
     # ├──────────────────────┤ COG_LISTENER ├──────────────────────┤
@@ -449,81 +1784,72 @@ class MediaLogger(commands.Cog):
         Main event listener that handles media attachment logging
         according to configuration.
         """
+        # Skip messages without attachments, DMs and webhooks before anything else
+        if not message.attachments or not message.guild or message.webhook_id:
+            return
         # Ignore messages from the bot itself to prevent loops
         if message.author == self.bot.user:
             return
-        # Skip bots and webhooks entirely
-        config = await self.get_config()
-        log_bot_media = config.get("log_bot_media", False)  # Default False
-        if message.webhook_id:  # Always ignore webhooks
-            return
+        # Compiled config, only awaited when the cache has gone stale
+        if time.time() - self._last_config_fetch > CACHE_TTL:
+            await self.get_config()
+        media_filter = self.media_filter
         # Ignore bots only if config disabled
-        if message.author.bot and not log_bot_media:
+        if message.author.bot and not media_filter.log_bot_media:
             return
-        # Ignore DMs - only process guild messages
-        if not message.guild:
+        # Log channel itself, ignored channels, or untracked channels in opt-in mode
+        if not media_filter.log_channel_id or not media_filter.channel_allowed(message.channel.id):
             return
-        # Skip messages without attachments
-        if not message.attachments:
-            return
-        # Get current configuration
-        config = await self.get_config()
-        # Check if logging channel is set up
-        log_channel = await self.log_channel()
-        if not log_channel:
-            return
-        # IMPORTANT: Ignore messages in the log channel itself
-        if message.channel.id == log_channel.id:
-            return
-        # Check if we should ignore bots
-        if message.author.bot and not config.get("log_bot_media", False):
-            return
-        # Determine channel tracking mode
-        channel_tracking = config.get("channel_tracking", "all")
-        ignored_channels = config.get("ignored_channels", [])
-        tracked_channels = config.get("tracked_channels", [])
-
-        # Check if this channel should be processed based on tracking mode
-        if channel_tracking == "all":
-            # In 'all' mode, skip only explicitly ignored channels
-            if str(message.channel.id) in ignored_channels:
-                return
-        else:  # opt-in mode
-            # In 'opt-in' mode, process only explicitly tracked channels
-            if str(message.channel.id) not in tracked_channels:
-                return
 
-        # Get allowed file types
-        allowed_types = config.get("allowed_types", DEFAULT_MEDIA_TYPES)
         # Filter attachments by allowed types and size
         valid_attachments = []
+        type_ids = []
         for attachment in message.attachments:
-            # Check file extension
-            file_ext = Path(attachment.filename).suffix.lower()
-            if file_ext not in allowed_types or not allowed_types[file_ext]:
-                continue
-            # Check file size
-            if attachment.size > MAX_ATTACHMENT_SIZE:
+            type_id = media_filter.type_of(attachment.filename)
+            if type_id is None or attachment.size > MAX_ATTACHMENT_SIZE:
                 continue
-
             valid_attachments.append(attachment)
+            type_ids.append(type_id)
         # If no valid attachments, stop processing
         if not valid_attachments:
             return
 
+        # Check if logging channel is set up
+        log_channel = self.bot.get_channel(media_filter.log_channel_id)
+        if not log_channel:
+            return
+
         # Update statistics if tracking is enabled
-        if message.guild.member_count < self.stats_threshold or config.get("force_enabled", False):
-            await self.update_user_stats(str(message.author.id), message.channel, valid_attachments)
+        if message.guild.member_count < self.stats_threshold or media_filter.force_enabled:
+            await self.update_user_stats(message.author.id, message.channel, valid_attachments, type_ids)
             self.server_stats['total_uploads'] += len(valid_attachments)
+
+        # Reposts of already logged content only bump a counter on the original entry
+        to_log, content_keys = valid_attachments, {}
+        if media_filter.dedup_enabled:
+            try:
+                to_log, content_keys = await self.collapse_duplicates(message, valid_attachments)
+            except PyMongoError as e:
+                print(f"Dedup lookup failed, logging everything: {e}")
+        logged_in: Dict[int, asyncio.Future] = {}  # attachment id -> future log message
+
+        def fallback(files) -> str:
+            file_links = "• " + "\n• ".join(f"- {a.filename}: {a.url}" for a in files)
+            return (
+                f"📁 Files uploaded by {message.author} in {message.channel.mention}:\n"
+                f"{file_links}\n"
+                f"Original message: {message.jump_url}"
+            )
+
         # Prepare and send log messages
         try:
             # For multiple attachments, we'll group some types together
-            image_exts = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+            image_exts = IMAGE_EXTS
             document_exts = ('.pdf', '.txt', '.doc', '.docx', '.xls', '.xlsx')
             # Group attachments by type
-            images = [a for a in valid_attachments if a.filename.lower().endswith(image_exts)]
-            documents = [a for a in valid_attachments if a.filename.lower().endswith(document_exts)]
-            other_files = [a for a in valid_attachments if a not in images and a not in documents]
+            images = [a for a in to_log if a.filename.lower().endswith(image_exts)]
+            documents = [a for a in to_log if a.filename.lower().endswith(document_exts)]
+            other_files = [a for a in to_log if a not in images and a not in documents]
             # Create base embed
             embed = discord.Embed(
                 color=self.bot.main_color,
@@ -549,7 +1875,8 @@ class MediaLogger(commands.Cog):
                 if images[0].filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
                     image_embed.set_image(url=images[0].url)
 
-                await log_channel.send(embed=image_embed)
+                log_message = self.dispatcher.submit(log_channel, image_embed, fallback(images))
+                logged_in.update((img.id, log_message) for img in images)
             # Log documents in a single embed
             if documents:
                 doc_embed = embed.copy()
@@ -557,7 +1884,8 @@ class MediaLogger(commands.Cog):
                 doc_embed.description = "• " + "\n• ".join(
                     f"[{doc.filename}]({doc.url})" for doc in documents
                 )
-                await log_channel.send(embed=doc_embed)
+                log_message = self.dispatcher.submit(log_channel, doc_embed, fallback(documents))
+                logged_in.update((doc.id, log_message) for doc in documents)
             # Log other files individually
             for file in other_files:
                 file_embed = embed.copy()
@@ -567,36 +1895,29 @@ class MediaLogger(commands.Cog):
                 if file.filename.lower().endswith(('.mp4', '.mov', '.mp3', '.wav')):
                     file_embed.add_field(name="Type", value=file.filename.split('.')[-1].upper(), inline=True)
 
-                await log_channel.send(embed=file_embed)
+                logged_in[file.id] = self.dispatcher.submit(log_channel, file_embed, fallback([file]))
 
-        except discord.HTTPException as e:
-            # Fallback to simple text logging if embeds fail
-            try:
-                file_links = "• " + "\n• ".join(f"- {a.filename}: {a.url}" for a in valid_attachments)
-                await log_channel.send(
-                    f"📁 Files uploaded by {message.author} in {message.channel.mention}:\n"
-                    f"{file_links}\n"
-                    f"Original message: {message.jump_url}"
-                )
-            except discord.HTTPException:
-                print(f"Failed to log media from message {message.id}: {e}")
         except Exception as e:
             print(f"Unexpected error logging media: {e}")
 
+        # Remember where each new piece of content was logged, once the dispatcher has sent it
+        if content_keys:
+            self.bot.loop.create_task(self._register_content(content_keys, logged_in))
+
+        # Keep a copy of every accepted file, the CDN links in the log expire
+        if media_filter.archive_enabled:
+            for attachment in valid_attachments:
+                self.archiver.submit(ArchiveJob(
+                    attachment, message.id, message.channel.id, message.guild.id, message.author.id
+                ))
+
         if valid_attachments:
-            # Store message ID for deletion tracking
-            self.tracked_messages.add(message.id)
-            # Update database with message tracking
-            await self.db.find_one_and_update(
-                {'_id': 'tracked_messages'},
-                {'$set': {
-                    str(message.id): {
-                        'user_id': str(message.author.id),
-                        'count': len(valid_attachments),
-                        'timestamp': message.created_at.timestamp()
-                    }
-                }},
-                upsert=True
+            # Store message for deletion tracking, persisted by the write-behind flush
+            self.track_message(
+                message.id,
+                str(message.author.id),
+                len(valid_attachments),
+                message.created_at.replace(tzinfo=None)
             )
 
     # ┌──────────────────────┬──────────────┬──────────────────────┐
@@ -605,34 +1926,18 @@ class MediaLogger(commands.Cog):
     @commands.Cog.listener()
     async def on_message_delete(self, message):
         """Handle deleted messages with tracked attachments"""
-        if message.id not in self.tracked_messages:
+        # Resolved from memory, the DB delete is queued for the next flush
+        tracked = self.untrack_message(message.id)
+        if not tracked:
             return
 
-        # Get deletion data from database
-        tracked_data = await self.db.find_one(
-            {'_id': 'tracked_messages'},
-            {str(message.id): 1}
-        ) or {}
-
-        if not tracked_data.get(str(message.id)):
-            return
-
-        # Extract tracking info
-        user_id = tracked_data[str(message.id)]['user_id']
-        count = tracked_data[str(message.id)]['count']
+        user_id = tracked['user_id']
+        count = tracked['count']
 
         # Update statistics
         self.server_stats['total_deletes'] += count
 
-        if user_id in self.user_stats:
-            self.user_stats[user_id]['deletes'] += count
-
-        # Cleanup database
-        await self.db.find_one_and_update(
-            {'_id': 'tracked_messages'},
-            {'$unset': {str(message.id): ""}}
-        )
-        self.tracked_messages.discard(message.id)
+        self.record_user_deletes(int(user_id), count)
 
     # ╔════════════════════════════════════════════════════════════╗
     # ║░░░░░░░░░░░░░░░░░░░░ SETMEDIALOGCHANNEL ░░░░░░░░░░░░░░░░░░░░║
@@ -707,11 +2012,13 @@ class MediaLogger(commands.Cog):
             {'$set': {
                 'log_channel': str(channel.id), 
                 'ignored_channels': [], 
-                'allowed_types': DEFAULT_MEDIA_TYPES
+                'allowed_types': DEFAULT_MEDIA_TYPES,
+                'log_webhook_url': None  # A webhook belongs to the old channel
             }},
             upsert=True
         )
         await self.invalidate_config_cache()
+        await self.apply_webhook_config()
 
         await ctx.send(
             f"✅ **Media log channel** successfully set to {channel.mention} by **{ctx.author.display_name}**\n"
@@ -750,6 +2057,10 @@ class MediaLogger(commands.Cog):
         - `medialogtracking` — Set channel tracking mode
         - `medialogtypes` — Toggle which filetypes to log
         - `medialogtogglebots` — Log media from bots too?
+        - `medialogdedup` — Repost detection stats/toggle
+        - `medialogwebhook` — Log through a webhook
+        - `medialogarchive` — Archive stats/toggle
+        - `medialogarchived` — Find archived files
         - `medialogconfig` — Media logger configuration
           ├─ `enable` — Enable advanced tracking
           ├─ `disable` — Disable advanced tracking
@@ -801,6 +2112,40 @@ class MediaLogger(commands.Cog):
             inline=False
         )
 
+        downloads = self.downloads.metrics()
+        embed.add_field(
+            name="📡 Downloads",
+            value=(
+                f"**In flight:** {downloads['in_flight']}/{self.downloads.max_concurrent} • "
+                f"**Queued:** {downloads['queued']} (peak {downloads['peak_queued']})\n"
+                f"**Completed:** {downloads['completed']} • **Failed:** {downloads['failed']}"
+            ),
+            inline=False
+        )
+
+        dispatch = self.dispatcher.metrics()
+        embed.add_field(
+            name="📤 Log Dispatcher",
+            value=(
+                f"**Sink:** {'Webhook' if self.dispatcher.webhook else 'Bot'} • "
+                f"**Backlog:** {dispatch['depth']} (peak {dispatch['peak_depth']}, lag {dispatch['lag']}s)\n"
+                f"**Sent:** {dispatch['embeds']} embeds in {dispatch['batches']} messages "
+                f"({dispatch['per_batch']}/msg) • **Paced:** {dispatch['waits']} • **Failed:** {dispatch['failures']}"
+            ),
+            inline=False
+        )
+
+        if config.get("archive_enabled", False):
+            archive = self.archiver.metrics()
+            embed.add_field(
+                name="🗃️ Archive",
+                value=(
+                    f"**Store:** `{self.archiver.store.name}` • **Queued:** {archive['queued']} • "
+                    f"**Archived:** {archive['archived']} • **Failed:** {archive['failed']} • **Dropped:** {archive['dropped']}"
+                ),
+                inline=False
+            )
+
         if ctx.guild.member_count < self.stats_threshold:
             embed.add_field(
                 name="📊 Server Statistics",
@@ -828,6 +2173,203 @@ class MediaLogger(commands.Cog):
         await self.invalidate_config_cache()
         await ctx.send(f"🤖 Logging bot media is now {'enabled ✅' if not current else 'disabled ❎'}.")
 
+    # ╔════════════════════════════════════════════════════════════╗
+    # ║░░░░░░░░░░░░░░░░░░░░░ MEDIALOGWEBHOOK ░░░░░░░░░░░░░░░░░░░░░░║
+    # ╚════════════════════════════════════════════════════════════╝
+    @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
+    @commands.command()
+    @commands.guild_only()
+    async def medialogwebhook(self, ctx, toggle: bool):
+        """Send media logs through a webhook for higher throughput
+
+        The webhook has its own rate-limit bucket, so busy servers queue less.
+        Requires `Manage Webhooks` in the log channel.
+        """
+        config = await self.get_config()
+        log_channel = await self.log_channel()
+        if not log_channel:
+            return await ctx.send(f"❌ Set a log channel first with `{ctx.prefix}setmedialogchannel`.")
+
+        url = None
+        if toggle:
+            if not log_channel.permissions_for(ctx.guild.me).manage_webhooks:
+                return await ctx.send(f"❌ I need `Manage Webhooks` in {log_channel.mention}.")
+            try:
+                webhook = await log_channel.create_webhook(name="Media Logger", reason=f"Enabled by {ctx.author}")
+            except discord.HTTPException as e:
+                return await ctx.send(f"⚠️ Could not create webhook: `{e}`")
+            url = webhook.url
+        elif config.get('log_webhook_url'):
+            try:
+                await discord.Webhook.from_url(config['log_webhook_url'], session=self.dispatcher.session).delete()
+            except discord.HTTPException:
+                pass
+
+        await self.db.find_one_and_update(
+            {'_id': 'config'},
+            {'$set': {'log_webhook_url': url}},
+            upsert=True
+        )
+        await self.invalidate_config_cache()
+        await self.apply_webhook_config()
+        await ctx.send(f"🪝 Webhook logging is now {'enabled ✅' if toggle else 'disabled ❎'} for {log_channel.mention}.")
+
+    # ╔════════════════════════════════════════════════════════════╗
+    # ║░░░░░░░░░░░░░░░░░░░░░░ MEDIALOGDEDUP ░░░░░░░░░░░░░░░░░░░░░░░║
+    # ╚════════════════════════════════════════════════════════════╝
+    @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
+    @commands.command()
+    @commands.guild_only()
+    async def medialogdedup(self, ctx, toggle: Optional[bool] = None):
+        """Show repost detection stats, or turn it on/off
+
+        Reposted files are collapsed into a counter on the original log entry
+        instead of being logged again.
+        """
+        config = await self.get_config()
+        enabled = config.get("dedup_enabled", False)
+
+        if toggle is not None:
+            enabled = toggle
+            await self.db.find_one_and_update(
+                {'_id': 'config'},
+                {'$set': {'dedup_enabled': enabled}},
+                upsert=True
+            )
+            await self.invalidate_config_cache()
+
+        metrics = self.hash_index.metrics()
+        embed = discord.Embed(
+            title="🔁 Repost Detection",
+            description="✅ Enabled" if enabled else "❎ Disabled",
+            color=self.bot.main_color
+        )
+        embed.add_field(
+            name="📊 Since Startup",
+            value=(
+                f"**Reposts collapsed:** {metrics['hits']}\n"
+                f"**New content:** {metrics['misses']}\n"
+                f"**Hit rate:** {metrics['hit_rate']}%\n"
+                f"**Hash failures:** {metrics['failures']}"
+            ),
+            inline=True
+        )
+        embed.add_field(
+            name="🧠 Index",
+            value=(
+                f"**Cached hashes:** {metrics['cached']}/{self.hash_index.max_size}\n"
+                f"**Hashing:** exact SHA-256 (whole image up to {DEDUP_MAX_IMAGE_BYTES // (1024 * 1024)} MB, "
+                f"first {DEDUP_PREFIX_BYTES // 1024} KB otherwise)\n"
+                f"**Pending edits:** {len(self._pending_reposts)}"
+            ),
+            inline=True
+        )
+        await ctx.send(embed=embed)
+
+    # ╔════════════════════════════════════════════════════════════╗
+    # ║░░░░░░░░░░░░░░░░░░░░░ MEDIALOGARCHIVE ░░░░░░░░░░░░░░░░░░░░░░║
+    # ╚════════════════════════════════════════════════════════════╝
+    @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
+    @commands.command()
+    @commands.guild_only()
+    async def medialogarchive(self, ctx, toggle: Optional[bool] = None):
+        """Show archival stats, or turn it on/off
+
+        Archived files are copied to the configured store, so they outlive
+        Discord's expiring attachment links. Set `MEDIALOG_S3_BUCKET` (plus
+        endpoint/keys) to use an S3-compatible store instead of the local disk.
+        """
+        config = await self.get_config()
+        enabled = config.get("archive_enabled", False)
+
+        if toggle is not None:
+            enabled = toggle
+            await self.db.find_one_and_update(
+                {'_id': 'config'},
+                {'$set': {'archive_enabled': enabled}},
+                upsert=True
+            )
+            await self.invalidate_config_cache()
+
+        metrics = self.archiver.metrics()
+        store = self.archiver.store
+        embed = discord.Embed(
+            title="🗃️ Media Archive",
+            description="✅ Enabled" if enabled else "❎ Disabled",
+            color=self.bot.main_color
+        )
+        embed.add_field(
+            name="📊 Since Startup",
+            value=(
+                f"**Archived:** {metrics['archived']} ({metrics['deduped']} already stored)\n"
+                f"**Stored:** {metrics['bytes_stored'] / (1024 * 1024):,.1f} MB\n"
+                f"**Failed:** {metrics['failed']} • **Dropped:** {metrics['dropped']}"
+            ),
+            inline=True
+        )
+        embed.add_field(
+            name="🧰 Store",
+            value=(
+                f"**Backend:** `{store.name}`\n"
+                f"**Location:** `{store.location('')}`\n"
+                f"**Workers:** {metrics['active']}/{self.archiver.workers} busy • **Queued:** {metrics['queued']}"
+            ),
+            inline=True
+        )
+        await ctx.send(embed=embed)
+
+    # ╔════════════════════════════════════════════════════════════╗
+    # ║░░░░░░░░░░░░░░░░░░░░ MEDIALOGARCHIVED ░░░░░░░░░░░░░░░░░░░░░░║
+    # ╚════════════════════════════════════════════════════════════╝
+    @checks.has_permissions(PermissionLevel.MODERATOR)
+    @commands.command()
+    @commands.cooldown(1, 10, commands.BucketType.user)
+    @commands.guild_only()
+    async def medialogarchived(self, ctx, *, query: str):
+        """Look up archived files by user, message ID or content hash
+
+        Examples:
+        - `medialogarchived @user` — latest files from a user
+        - `medialogarchived 123456789012345678` — a message, attachment or user ID
+        - `medialogarchived 9f86d081` — files whose SHA-256 starts with this
+        """
+        query = query.strip()
+        mention = re.fullmatch(r'<@!?(\d+)>', query)
+        if mention:
+            lookup = {'user_id': int(mention.group(1))}
+        elif query.isdigit():
+            snowflake = int(query)
+            lookup = {'$or': [
+                {'message_id': snowflake},
+                {'user_id': snowflake},
+                {'_id': f'archive_{snowflake}'}
+            ]}
+        elif re.fullmatch(r'[0-9a-fA-F]{8,64}', query):
+            lookup = {'sha256': {'$regex': f'^{query.lower()}'}}
+        else:
+            return await ctx.send("❌ Give a user mention, a message/attachment/user ID or a SHA-256 prefix.")
+
+        entries = await self.archiver.find({'guild_id': ctx.guild.id, **lookup})
+        if not entries:
+            return await ctx.send("🗃️ No archived files found.")
+
+        embed = discord.Embed(
+            title=f"🗃️ Archived Files ({len(entries)})",
+            color=self.bot.main_color
+        )
+        for entry in entries:
+            embed.add_field(
+                name=f"📁 {entry['filename'][:200]}",
+                value=(
+                    f"<@{entry['user_id']}> in <#{entry['channel_id']}> • "
+                    f"{entry['size'] / 1024:,.0f} KB • <t:{int(entry['archived_at'].replace(tzinfo=timezone.utc).timestamp())}:R>\n"
+                    f"**SHA-256:** `{entry['sha256'][:16]}…`\n"
+                    f"**Stored at:** `{entry['location'][-200:]}`"
+                ),
+                inline=False
+            )
+        await ctx.send(embed=embed)
+
     # ╔════════════════════════════════════════════════════════════╗
     # ║░░░░░░░░░░░░░░░░░░░░░ MEDIALOGTOGTYPES ░░░░░░░░░░░░░░░░░░░░░║
     # ╚════════════════════════════════════════════════════════════╝
@@ -907,7 +2449,8 @@ class MediaLogger(commands.Cog):
     async def disable(self, ctx):
         """Disable advanced tracking"""
         await self._update_config(False, False)
-        self.user_stats = {}
+        self.user_stats.clear()
+        self._stats_deltas.clear()
         self.server_stats = {'total_uploads': 0, 'total_deletes': 0}
         await ctx.send("❎ Advanced tracking disabled by **{ctx.author.display_name}** using normal configuration.")
 
@@ -933,7 +2476,8 @@ class MediaLogger(commands.Cog):
     async def force_disable(self, ctx):
         """Force-disable advanced tracking"""
         await self._update_config(False, False)
-        self.user_stats = {}
+        self.user_stats.clear()
+        self._stats_deltas.clear()
         self.server_stats = {'total_uploads': 0, 'total_deletes': 0}
         await ctx.send("🛑 Advanced tracking force-disabled by **{ctx.author.display_name}**.")
 
@@ -965,28 +2509,18 @@ class MediaLogger(commands.Cog):
         if ctx.guild.member_count >= self.stats_threshold:
             return await ctx.send("ℹ️ Advanced statistics tracking is disabled for large servers.")
 
-        user_data = self.user_stats.get(str(target_user.id))
+        user_data = await self.get_user_stats(target_user.id)
         if not user_data:
             return await ctx.send(f"📊 No media statistics found for {target_user.display_name}.")
 
-        # Calculate top file types
-        top_types = sorted(
-            user_data['type_stats'].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
-
-        # Calculate top channels
-        top_channels = sorted(
-            user_data['channel_stats'].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
+        # Calculate top file types and channels
+        top_types = user_data.top_types()
+        top_channels = user_data.top_channels()
 
         # Create the embed
         embed = discord.Embed(
             title=f"📊 Media Statistics for {target_user.display_name}",
-            description=f"🛒 Total attachments sent: **{user_data.get('uploads', 0)}**",
+            description=f"🛒 Total attachments sent: **{user_data.uploads}**",
             color=self.bot.main_color
         )
 
@@ -1009,7 +2543,7 @@ class MediaLogger(commands.Cog):
         # Add activity info
         embed.add_field(
             name="⏱️ Last Activity",
-            value=f"<t:{int(user_data['last_upload'].timestamp())}:R>",
+            value=f"<t:{int(user_data.last_upload.replace(tzinfo=timezone.utc).timestamp())}:R>",
             inline=False
         )
 
@@ -1018,6 +2552,44 @@ class MediaLogger(commands.Cog):
         
         await ctx.send(embed=embed)
 
+    # ╔════════════════════════════════════════════════════════════╗
+    # ║░░░░░░░░░░░░░░░░░░░░░░ MEDIALOGBENCH ░░░░░░░░░░░░░░░░░░░░░░░║
+    # ╚════════════════════════════════════════════════════════════╝
+    @checks.has_permissions(PermissionLevel.OWNER)
+    @commands.command()
+    @commands.max_concurrency(1)
+    async def medialogbench(self, ctx):
+        """Benchmark the user stats table and the compiled on_message filter"""
+        async with ctx.typing():
+            results = await asyncio.to_thread(benchmark_user_stats)
+            filter_results = await asyncio.to_thread(benchmark_message_filter)
+
+        embed = discord.Embed(
+            title="⏱️ Media Logger Benchmark",
+            description="Cost per upload into a full user stats table",
+            color=self.bot.main_color
+        )
+        for result in results:
+            embed.add_field(
+                name=f"👥 {result['users']:,} users",
+                value=(
+                    f"**Legacy dict:** {result['legacy_us']:,.1f} µs\n"
+                    f"**Ordered table:** {result['table_us']:,.2f} µs\n"
+                    f"**Speedup:** {result['speedup']:,.0f}x"
+                ),
+                inline=True
+            )
+        embed.add_field(
+            name="🚦 on_message filter (400 ignored channels)",
+            value="\n".join(
+                f"**{result['case']}:** {result['legacy_ns']:,.0f} → {result['compiled_ns']:,.0f} ns "
+                f"({result['speedup']:,.1f}x)"
+                for result in filter_results
+            ),
+            inline=False
+        )
+        await ctx.send(embed=embed)
+
     # ╔════════════════════════════════════════════════════════════╗
     # ║░░░░░░░░░░░░░░░░░░░░░ MEDIALOGTRACKING ░░░░░░░░░░░░░░░░░░░░░║
     # ╚════════════════════════════════════════════════════════════╝
@@ -1075,14 +2647,25 @@ class MediaLogger(commands.Cog):
 
         ext_list = " ".join(f"`{ext}`" for ext in enabled_exts) if enabled_exts else "*(None configured yet)*"
 
+        if config.get("archive_enabled", False):
+            store = self.archiver.store.name
+            privacy_note = (
+                f"- Archiving is ON: copies of logged files are stored in the `{store}` archive "
+                "along with their metadata"
+            )
+        else:
+            privacy_note = (
+                "- Never stores file contents outside of Discord, it only saves "
+                "metadata in media-logger channel"
+            )
+
         embed = discord.Embed(
             title="📁 Media Logger — About",
             description=(
                 f"{__description__}. Advanced system to log attachments into "
                 f"a designated media-logger channel, {__original__}\n"
                 "```diff\n+ Privacy Note: Only monitors filetypes explicitly enabled\n"
-                "- Never stores file contents outside of Discord, it only saves "
-                "metadata in media-logger channel\n```"
+                f"{privacy_note}\n```"
                 f"**Currently logging:**\n{ext_list}"
             ),
             color=discord.Color.blurple()
@@ -1104,6 +2687,10 @@ class MediaLogger(commands.Cog):
             value=(
                 "`medialogtypes` — Toggle logged file extensions\n"
                 "`medialogtogglebots` — Enable bot media logging\n"
+                "`medialogdedup` — Repost detection stats/toggle\n"
+                "`medialogwebhook` — Log through a webhook\n"
+                "`medialogarchive` — Archive stats/toggle\n"
+                "`medialogarchived` — Find archived files\n"
                 "`medialogconfig` — Advanced tracking settings:\n"
                 "　├─ `enable`/`disable` — Basic toggle\n"
                 "　├─ `force_enable` — Ignore size limits\n"
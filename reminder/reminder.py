@@ -2,10 +2,10 @@
 import asyncio
 import logging
 import re
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
-import dateparser
 import pymongo
 import pytz
 from dateutil.relativedelta import relativedelta
@@ -17,7 +17,10 @@ from core import checks
 from core.models import PermissionLevel
 
 from .remindertimezone import ReminderTimezone, TimezoneConverter
-from .remindercore import ReminderPaginator, SnoozeView, RecurringView, DualDeliveryView
+from .remindercore import (
+    ReminderPaginator, SnoozeView, RecurringView, DualDeliveryView, ReminderScheduler, REFILL_INTERVAL,
+    parse_time_fast, parse_time_slow, benchmark_time_parser
+)
 
 log = logging.getLogger("Modmail")
 __version__ = "4.02"
@@ -25,6 +28,7 @@ logo = "https://i.imgur.com/677JpTl.png"
 
 # BUG FIX (🐛 Rigid Separator Flanking Space Rules)
 SEPARATOR_PATTERN = re.compile(r'\s*(?:\||-|/|>|\[|—)\s*')
+DELIVERY_WORKERS = 8  # destination channels served concurrently per due batch
 
 
 class Reminder(commands.Cog):
@@ -42,6 +46,7 @@ class Reminder(commands.Cog):
     - !remindadm -> Admin cmd group to manage the Reminder plugin system.
     - ├─ purge -> Purge all reminders from the plugin database partition.
     - |  └─ purge --drop -> Wipes ALL data, clean install.
+    - ├─ bench -> Benchmark the fast time parser against dateparser.
     - └─ view @member -> View and manage a specific user’s active reminders.
     - !reminders -> List your active reminders in a paginated embed to edit or delete.
     """
@@ -50,7 +55,9 @@ class Reminder(commands.Cog):
         self.bot = bot
         self.db = bot.plugin_db.get_partition(self)
         self.timezone_manager = ReminderTimezone(self.db)
-        self.reminder_loop.start()
+        self.scheduler = ReminderScheduler(self.db, self._deliver_due)
+        self.horizon_refill.start()
+        self.scheduler.start(self.bot.loop)
         self.bot.loop.create_task(self._create_indexes())
         self.checkmark_emoji = "☑️"
 
@@ -74,7 +81,8 @@ class Reminder(commands.Cog):
                 await asyncio.sleep(1)
 
     def cog_unload(self):
-        self.reminder_loop.cancel()
+        self.horizon_refill.cancel()
+        self.scheduler.close()
 
     async def get_user_timezone(self, user_id: int):
         return await self.timezone_manager.get_user_timezone(user_id)
@@ -163,37 +171,28 @@ class Reminder(commands.Cog):
     # |    @ Background Loop                                       |
     # +------------------------------------------------------------+
 
-    @tasks.loop(seconds=60.0)
-    async def reminder_loop(self):
-        """Check reminders every minute with batch processing"""
+    @tasks.loop(minutes=REFILL_INTERVAL)
+    async def horizon_refill(self):
+        """Reload the scheduler's horizon window; delivery itself is driven by the scheduler"""
         try:
-            await self.bot.wait_until_ready()
-            now = datetime.now(pytz.UTC)
-            async for batch in self._get_reminder_batches(now):
-                await self._process_reminder_batch(batch, now)
-            if now.minute == 0:
-                await self._clean_timezone_cache()
+            await self.scheduler.refill()
         except Exception as e:
-            log.error(f"Reminder loop error: {e}", exc_info=True)
+            log.error(f"Reminder horizon refill error: {e}", exc_info=True)
 
-    @reminder_loop.before_loop
-    async def before_reminder_loop(self):
+    @horizon_refill.before_loop
+    async def before_horizon_refill(self):
         await self.bot.wait_until_ready()
 
-    async def _get_reminder_batches(self, now: datetime):
-        """Yield batches of 50 reminders at a time"""
-        query = {"due": {"$lte": now}, "status": "active"}
-        # BUG FIX (🐛 Deadlock on MongoDB Driver Sorting Types): list-of-tuples
-        cursor = self.db.find(query).sort([("due", 1)]).batch_size(50)
-
-        while True:
-            batch = await cursor.to_list(length=50)
-            if not batch:
-                break
-            yield batch
+    async def _deliver_due(self, batch: list):
+        await self._process_reminder_batch(batch, datetime.now(pytz.UTC))
 
     async def _process_single_reminder(self, reminder: dict, now: datetime):
-        """Deliver a reminder to DM and originating channel with fallback"""
+        """Deliver a reminder to DM and originating channel with fallback.
+
+        Returns ``(write, followup)``: the pending DB update for this reminder and,
+        when it stays active, the document to put back on the scheduler. The
+        writes of a whole batch are applied together by ``_commit_deliveries``.
+        """
         try:
             user = self.bot.get_user(reminder["user_id"])
             if not user:
@@ -201,7 +200,8 @@ class Reminder(commands.Cog):
                     user = await self.bot.fetch_user(reminder["user_id"])
                 except discord.NotFound:
                     await self.db.delete_many({"user_id": reminder["user_id"], "status": "active"})
-                    return
+                    self.scheduler.unschedule_user(reminder["user_id"])
+                    return None
 
             time_str = await self.timezone_manager.format_time_with_timezone(
                 reminder["due"], reminder["user_id"]
@@ -236,44 +236,49 @@ class Reminder(commands.Cog):
             }
 
             # --- DM delivery ---
-            try:
-                # BUG FIX (🐛 Multi-View Instance Collision & State Fragmentation):
-                # Each send site now gets its own independent View instance.
-                dm_view = DualDeliveryView(self, reminder["_id"], reminder["user_id"])
-                dm_message = await user.send(embed=make_embed(), view=dm_view)
-                await dm_message.add_reaction(self.checkmark_emoji)
-                dm_view.message = dm_message  # needed for on_timeout cleanup
-                delivery_status["dm_success"] = True
-            except discord.Forbidden:
-                delivery_status["dm_error"] = "User disabled DMs"
-            except Exception as e:
-                delivery_status["dm_error"] = str(e)[:100]
+            async def deliver_dm():
+                try:
+                    # BUG FIX (🐛 Multi-View Instance Collision & State Fragmentation):
+                    # Each send site now gets its own independent View instance.
+                    dm_view = DualDeliveryView(self, reminder["_id"], reminder["user_id"])
+                    dm_message = await user.send(embed=make_embed(), view=dm_view)
+                    await dm_message.add_reaction(self.checkmark_emoji)
+                    dm_view.message = dm_message  # needed for on_timeout cleanup
+                    delivery_status["dm_success"] = True
+                except discord.Forbidden:
+                    delivery_status["dm_error"] = "User disabled DMs"
+                except Exception as e:
+                    delivery_status["dm_error"] = str(e)[:100]
 
             # --- Original channel delivery ---
-            try:
-                channel = self.bot.get_channel(reminder["channel_id"])
-                if not channel:
-                    channel = await self.bot.fetch_channel(reminder["channel_id"])
-
-                ch_view = DualDeliveryView(self, reminder["_id"], reminder["user_id"])
-
-                if isinstance(channel, (discord.DMChannel, discord.PartialMessageable)):
-                    ch_msg = await channel.send(f"{user.mention}", embed=make_embed(), view=ch_view)
-                    await ch_msg.add_reaction(self.checkmark_emoji)
-                    ch_view.message = ch_msg
-                else:
-                    ch_msg = await channel.send(f"{user.mention}", embed=make_embed(), view=ch_view)
-                    await ch_msg.add_reaction(self.checkmark_emoji)
-                    ch_view.message = ch_msg
-                    await ch_msg.delete(delay=60)
-
-                delivery_status["channel_success"] = True
-            except discord.Forbidden:
-                delivery_status["channel_error"] = "Missing permissions in channel"
-            except discord.NotFound:
-                delivery_status["channel_error"] = "Channel not found"
-            except Exception as e:
-                delivery_status["channel_error"] = str(e)[:100]
+            async def deliver_channel():
+                try:
+                    channel = self.bot.get_channel(reminder["channel_id"])
+                    if not channel:
+                        channel = await self.bot.fetch_channel(reminder["channel_id"])
+
+                    ch_view = DualDeliveryView(self, reminder["_id"], reminder["user_id"])
+
+                    if isinstance(channel, (discord.DMChannel, discord.PartialMessageable)):
+                        ch_msg = await channel.send(f"{user.mention}", embed=make_embed(), view=ch_view)
+                        await ch_msg.add_reaction(self.checkmark_emoji)
+                        ch_view.message = ch_msg
+                    else:
+                        ch_msg = await channel.send(f"{user.mention}", embed=make_embed(), view=ch_view)
+                        await ch_msg.add_reaction(self.checkmark_emoji)
+                        ch_view.message = ch_msg
+                        await ch_msg.delete(delay=60)
+
+                    delivery_status["channel_success"] = True
+                except discord.Forbidden:
+                    delivery_status["channel_error"] = "Missing permissions in channel"
+                except discord.NotFound:
+                    delivery_status["channel_error"] = "Channel not found"
+                except Exception as e:
+                    delivery_status["channel_error"] = str(e)[:100]
+
+            # DM and channel are separate rate-limit buckets, so both go out at once
+            await asyncio.gather(deliver_dm(), deliver_channel())
 
             # --- Fallback to first available guild channel ---
             if not delivery_status["dm_success"] and not delivery_status["channel_success"]:
@@ -299,48 +304,82 @@ class Reminder(commands.Cog):
 
             # --- Reschedule or mark completed ---
             if reminder.get("recurring"):
-                await self._reschedule_recurring(reminder)
-            else:
-                await self.db.update_one(
-                    {"_id": reminder["_id"]},
-                    {"$set": {"status": "completed", "delivered": now}}
-                )
+                return await self._reschedule_recurring(reminder)
+            return pymongo.UpdateOne(
+                {"_id": reminder["_id"]},
+                {"$set": {"status": "completed", "delivered": now}}
+            ), None
 
         except Exception as e:
             log.error(f"Failed to process reminder {reminder.get('_id')}: {e}")
             retry_count = reminder.get("retry_count", 0)
             if retry_count < 3:
-                await self.db.update_one(
+                # $inc does not apply to dates, so the retry time is set explicitly
+                retry_due = datetime.now(pytz.UTC) + timedelta(minutes=5)
+                return pymongo.UpdateOne(
                     {"_id": reminder["_id"]},
-                    {
-                        "$set": {"retry_count": retry_count + 1},
-                        "$inc": {"due": 300}
-                    }
-                )
-            else:
-                await self.db.update_one(
-                    {"_id": reminder["_id"]},
-                    {"$set": {"status": "failed", "error": str(e)[:200]}}
-                )
+                    {"$set": {"retry_count": retry_count + 1, "due": retry_due}}
+                ), {**reminder, "due": retry_due, "retry_count": retry_count + 1}
+            return pymongo.UpdateOne(
+                {"_id": reminder["_id"]},
+                {"$set": {"status": "failed", "error": str(e)[:200]}}
+            ), None
 
     async def _process_reminder_batch(self, batch: list, now: datetime):
+        """Deliver a batch with a bounded worker pool, then commit it in one bulk_write.
+
+        Reminders are grouped by destination channel and each group is handled by
+        a single worker, so sends into one channel stay sequential while
+        different channels are served concurrently.
+        """
+        await self.timezone_manager.warm(reminder["user_id"] for reminder in batch)
+
+        by_channel: Dict[int, list] = defaultdict(list)
         for reminder in batch:
+            by_channel[reminder.get("channel_id")].append(reminder)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for group in by_channel.values():
+            queue.put_nowait(group)
+
+        writes, followups = [], []
+
+        async def worker():
+            while not queue.empty():
+                group = queue.get_nowait()
+                for reminder in group:
+                    try:
+                        result = await self._process_single_reminder(reminder, now)
+                    except Exception as e:
+                        log.error(f"Error processing reminder {reminder.get('_id')}: {e}")
+                        continue
+                    if result:
+                        write, followup = result
+                        writes.append(write)
+                        if followup:
+                            followups.append(followup)
+
+        workers = min(DELIVERY_WORKERS, len(by_channel))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        await self._commit_deliveries(writes, followups)
+
+    async def _commit_deliveries(self, writes: list, followups: list):
+        """Apply a batch's completions and reschedules, then requeue what stays active"""
+        if writes:
             try:
-                await self._process_single_reminder(reminder, now)
+                await self.db.bulk_write(writes, ordered=False)
+            except pymongo.errors.BulkWriteError as e:
+                log.error(f"Reminder bulk update partially failed: {e.details.get('writeErrors', [])[:3]}")
             except Exception as e:
-                log.error(f"Error processing reminder {reminder.get('_id')}: {e}")
-
-    async def _clean_timezone_cache(self):
-        """Clean timezone cache for inactive users"""
-        active_users = set()
-        # BUG FIX (🐛 Dead Loop Execution on Uniterable Mongo Cursors)
-        docs = await self.db.find({"status": "active"}, {"user_id": 1}).to_list(None)
-        for reminder in docs:
-            active_users.add(reminder["user_id"])
-        self.timezone_manager.clean_cache(active_users)
+                # Nothing was recorded; the next horizon refill picks the reminders up again
+                log.error(f"Reminder bulk update failed: {e}")
+                return
+        for doc in followups:
+            self.scheduler.schedule(doc)
 
     async def _reschedule_recurring(self, reminder: dict):
-        """Reschedule recurring reminders maintaining original time-of-day"""
+        """Build the update that moves a recurring reminder to its next occurrence,
+        keeping the original time-of-day. Returns ``(write, followup)``."""
         try:
             frequency = reminder["recurring"]
             original_due = reminder["due"]
@@ -359,7 +398,7 @@ class Reminder(commands.Cog):
                 next_date = user_time + relativedelta(months=1)
             else:
                 log.error(f"Unknown recurring frequency: {frequency}")
-                return
+                return None
 
             # BUG FIX (🐛 Pytz Localization Crash on Pre-Localized Dates)
             naive_next = datetime(
@@ -369,20 +408,21 @@ class Reminder(commands.Cog):
             next_user_time = user_tz.localize(naive_next)
             next_due = next_user_time.astimezone(pytz.UTC)
 
-            await self.db.update_one(
+            rescheduled = {k: v for k, v in reminder.items() if k != "retry_count"}
+            return pymongo.UpdateOne(
                 {"_id": reminder["_id"]},
                 {
                     "$set": {"due": next_due, "status": "active"},
                     "$unset": {"retry_count": ""}
                 }
-            )
+            ), {**rescheduled, "due": next_due, "status": "active"}
 
         except Exception as e:
             log.error(f"Failed to reschedule recurring reminder {reminder.get('_id')}: {e}")
-            await self.db.update_one(
+            return pymongo.UpdateOne(
                 {"_id": reminder["_id"]},
                 {"$set": {"status": "failed", "error": "reschedule_failed"}}
-            )
+            ), None
 
     # +------------------------------------------------------------+
     # |    !remind                                                 |
@@ -419,19 +459,14 @@ class Reminder(commands.Cog):
 
             try:
                 user_tz = await self.timezone_manager.get_user_timezone(ctx.author.id)
-                settings = {
-                    'RELATIVE_BASE': datetime.now(user_tz),
-                    'TIMEZONE': str(user_tz),
-                    'TO_TIMEZONE': 'UTC',
-                    'PREFER_DATES_FROM': 'future'
-                }
-                due = dateparser.parse(time_part, settings=settings)
+                due = parse_time_fast(time_part, user_tz)
+                if due is None:
+                    # dateparser is slow and blocking, keep it off the event loop
+                    due = await asyncio.to_thread(parse_time_slow, time_part, user_tz)
 
                 if not due:
                     raise ValueError("Could not parse time")
 
-                due = pytz.UTC.localize(due) if due.tzinfo is None else due.astimezone(pytz.UTC)
-
                 if due <= datetime.now(pytz.UTC) + timedelta(seconds=10):
                     current_time_str = await self.timezone_manager.format_time_with_timezone(
                         datetime.now(pytz.UTC), ctx.author.id
@@ -704,6 +739,41 @@ class Reminder(commands.Cog):
             log.error(f"Admin view command failed for user {target.id}: {e}")
             await ctx.send("❌ Admin Error: Unable to safely generate user reminder display panel.", delete_after=10.0)
 
+    # +------------------------------------------------------------+
+    # |    !remindadm bench                                        |
+    # +------------------------------------------------------------+
+
+    @remindadm.command(name="bench")
+    @commands.guild_only()
+    @checks.has_permissions(PermissionLevel.ADMIN)
+    async def remindadm_bench(self, ctx: commands.Context):
+        """Benchmark the fast time parser against dateparser on the built-in corpus."""
+        async with ctx.typing():
+            stats = await asyncio.to_thread(benchmark_time_parser)
+
+        speedup = stats["dateparser_ms"] * 1000 / stats["fast_us"] if stats["fast_us"] else 0
+        embed = discord.Embed(
+            title="⏱️ Time Parser Benchmark",
+            description=(
+                f"**Inputs:** {stats['inputs']}\n"
+                f"**Fast-path hit rate:** {stats['hit_rate']:.0%} ({stats['hits']}/{stats['inputs']})\n"
+                f"**Fast path:** {stats['fast_us']:.1f} µs per input\n"
+                f"**dateparser:** {stats['dateparser_ms']:.2f} ms per input "
+                f"(first call {stats['dateparser_warmup_ms']:.0f} ms)\n"
+                f"**Speedup:** {speedup:,.0f}x\n"
+                f"**Agrees with dateparser:** {stats['agree']}/{stats['hits']}"
+            ),
+            color=discord.Color.blue()
+        )
+        if stats["misses"]:
+            embed.add_field(
+                name="Falls back to dateparser",
+                value=", ".join(f"`{text}`" for text in stats["misses"])[:1024],
+                inline=False
+            )
+        embed.set_thumbnail(url=logo)
+        await ctx.send(embed=embed)
+
     # +------------------------------------------------------------+
     # |    !remindadm purge                                        |
     # +------------------------------------------------------------+
@@ -747,6 +817,7 @@ class Reminder(commands.Cog):
                 await prompt_msg.edit(content="❌ **Purge Operation Aborted:** Confirmation timed out.", embed=None, view=None)
                 return
 
+            self.scheduler.clear()
             if flag == "--drop":
                 await self.db.drop()
                 await self._create_indexes()
@@ -1,9 +1,11 @@
 # remindercore.py
 import asyncio
+import heapq
 import logging
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Callable, Awaitable
+from typing import List, Dict, Optional, Callable, Awaitable, Set
 import re
 
 import pytz
@@ -18,6 +20,350 @@ from discord.ui import View, Button
 log = logging.getLogger("Modmail")
 logo = "https://i.imgur.com/677JpTl.png"
 
+HORIZON_HOURS = 6     # how far ahead active reminders are held in memory
+REFILL_INTERVAL = 15  # minutes between horizon refills from Mongo
+
+
+def due_timestamp(due: datetime) -> float:
+    """Epoch seconds for a due date (Mongo returns naive UTC datetimes)"""
+    if due.tzinfo is None:
+        due = due.replace(tzinfo=pytz.UTC)
+    return due.timestamp()
+
+
+class ReminderScheduler:
+    """In-memory min-heap of the reminders due within the next HORIZON_HOURS.
+
+    A single sleeper task waits until the earliest entry is due and hands every
+    due reminder to ``dispatch``. Mongo is only read by ``refill``; create,
+    snooze, shift and delete keep the heap in sync through ``schedule`` and
+    ``unschedule``. Stale heap entries are skipped lazily: an entry only fires
+    while its timestamp still matches ``self.due``.
+    """
+
+    def __init__(self, db, dispatch: Callable[[List[dict]], Awaitable[None]], horizon_hours: int = HORIZON_HOURS):
+        self.db = db
+        self.dispatch = dispatch
+        self.horizon = timedelta(hours=horizon_hours)
+        self.horizon_end = 0.0
+        self.heap: List[tuple] = []
+        self.docs: Dict[str, dict] = {}
+        self.due: Dict[str, float] = {}
+        self.inflight: Set[str] = set()
+        self._touched: Optional[Set[str]] = None
+        self._wakeup = asyncio.Event()
+        self._sleep_until = 0.0
+        self._task = None
+
+    def __len__(self):
+        return len(self.docs)
+
+    def start(self, loop):
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    # --- keeping the heap in sync ---
+
+    def schedule(self, doc: dict):
+        """Track an active reminder; anything past the horizon waits for a refill"""
+        reminder_id = doc["_id"]
+        ts = due_timestamp(doc["due"])
+        if ts > self.horizon_end:
+            self.unschedule(reminder_id)
+            return
+        if self._touched is not None:
+            self._touched.add(reminder_id)
+        self.docs[reminder_id] = doc
+        self.due[reminder_id] = ts
+        heapq.heappush(self.heap, (ts, reminder_id))
+        if ts < self._sleep_until:
+            self._wakeup.set()
+
+    async def reschedule(self, reminder_id: str, due: datetime):
+        """Move a reminder after a snooze or shift, loading it if it just entered the horizon"""
+        doc = self.docs.get(reminder_id)
+        if doc is None:
+            if due_timestamp(due) > self.horizon_end:
+                return
+            doc = await self.db.find_one({"_id": reminder_id, "status": "active"})
+            if not doc:
+                return
+        self.schedule({**doc, "due": due})
+
+    def unschedule(self, reminder_id: str):
+        if self._touched is not None:
+            self._touched.add(reminder_id)
+        self.docs.pop(reminder_id, None)
+        self.due.pop(reminder_id, None)
+
+    def unschedule_user(self, user_id: int):
+        for reminder_id in [rid for rid, doc in self.docs.items() if doc["user_id"] == user_id]:
+            self.unschedule(reminder_id)
+
+    def clear(self):
+        for reminder_id in list(self.docs):
+            self.unschedule(reminder_id)
+        self.heap.clear()
+
+    async def refill(self):
+        """Reload every active reminder due before the new horizon end"""
+        horizon_end = datetime.now(pytz.UTC) + self.horizon
+        self._touched = set()
+        try:
+            docs = await self.db.find(
+                {"status": "active", "due": {"$lte": horizon_end}}
+            ).sort([("due", 1)]).to_list(None)
+        finally:
+            touched, self._touched = self._touched, None
+
+        # Changes made while the query was in flight win over what it returned
+        fresh = {doc["_id"]: doc for doc in docs if doc["_id"] not in self.inflight}
+        for reminder_id in touched:
+            if reminder_id in self.docs:
+                fresh[reminder_id] = self.docs[reminder_id]
+            else:
+                fresh.pop(reminder_id, None)
+
+        self.horizon_end = horizon_end.timestamp()
+        self.docs = fresh
+        self.due = {rid: due_timestamp(doc["due"]) for rid, doc in fresh.items()}
+        self.heap = [(ts, rid) for rid, ts in self.due.items()]
+        heapq.heapify(self.heap)
+        self._wakeup.set()
+
+    # --- sleeper ---
+
+    def _pop_due(self, now: float) -> List[dict]:
+        ready = []
+        while self.heap and self.heap[0][0] <= now:
+            ts, reminder_id = heapq.heappop(self.heap)
+            if self.due.get(reminder_id) != ts:
+                continue
+            del self.due[reminder_id]
+            ready.append(self.docs.pop(reminder_id))
+        return ready
+
+    def _next_delay(self, now: float) -> float:
+        while self.heap and self.due.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+        # Capped so a wall-clock jump can never strand the sleeper for long
+        delay = REFILL_INTERVAL * 60
+        if self.heap:
+            delay = min(delay, max(self.heap[0][0] - now, 0))
+        return delay
+
+    async def _run(self):
+        while True:
+            try:
+                now = time.time()
+                ready = self._pop_due(now)
+                if ready:
+                    ids = {doc["_id"] for doc in ready}
+                    self.inflight |= ids
+                    try:
+                        await self.dispatch(ready)
+                    finally:
+                        self.inflight -= ids
+                    continue
+
+                delay = self._next_delay(now)
+                self._sleep_until = now + delay
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"Reminder scheduler error: {e}", exc_info=True)
+                await asyncio.sleep(5)
+
+
+# +------------------------------------------------------------+
+# |    Time expression parsing                                 |
+# +------------------------------------------------------------+
+
+# Compiled grammar for the inputs people actually type ("30m", "in 2 hours",
+# "tomorrow at 3pm", "friday 9am"). Anything it does not recognise goes to
+# dateparser, which is imported lazily because it is slow to load and to call.
+
+_UNIT_SECONDS = {
+    "s": 1, "sec": 1, "secs": 1, "second": 1, "seconds": 1,
+    "m": 60, "min": 60, "mins": 60, "minute": 60, "minutes": 60,
+    "h": 3600, "hr": 3600, "hrs": 3600, "hour": 3600, "hours": 3600,
+    "d": 86400, "day": 86400, "days": 86400,
+    "w": 604800, "wk": 604800, "wks": 604800, "week": 604800, "weeks": 604800,
+}
+_UNIT_MONTHS = {"mo": 1, "mos": 1, "month": 1, "months": 1, "y": 12, "yr": 12, "yrs": 12, "year": 12, "years": 12}
+_WEEKDAYS = {
+    "mon": 0, "monday": 0, "tue": 1, "tues": 1, "tuesday": 1, "wed": 2, "wednesday": 2,
+    "thu": 3, "thur": 3, "thurs": 3, "thursday": 3, "fri": 4, "friday": 4,
+    "sat": 5, "saturday": 5, "sun": 6, "sunday": 6,
+}
+
+_WEEKDAY_NAMES = "|".join(sorted(_WEEKDAYS, key=len, reverse=True))
+
+# Word amounts need a space and units run to the end of the word, which keeps the
+# repetition below from ever splitting one word several ways
+_DURATION_PART = r"(\d+(?:\.\d+)?(?=\s*[a-z])|(?:an?|one)(?=\s))\s*([a-z]+)(?![a-z])"
+DURATION_PART_RE = re.compile(_DURATION_PART)
+DURATION_RE = re.compile(
+    rf"(?:in\s+)?((?:{_DURATION_PART}(?:\s*,\s*|\s+and\s+|\s*))+?)(?:\s+(?:from\s+now|later))?"
+)
+_DAY = rf"(?P<day>today|tomorrow|tmrw?)|(?:next\s+|on\s+)?(?P<weekday>{_WEEKDAY_NAMES})"
+_CLOCK = r"(?P<at>(?:at|@)\s*)?(?:(?P<named>noon|midnight)|(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?(?:\s*(?P<ampm>[ap])\.?m?\.?)?)?"
+DAY_CLOCK_RE = re.compile(rf"(?:{_DAY})?\s*{_CLOCK}")
+CLOCK_DAY_RE = re.compile(rf"{_CLOCK}\s+(?:{_DAY})")
+
+
+def _parse_duration(text: str, now: datetime) -> Optional[datetime]:
+    match = DURATION_RE.fullmatch(text)
+    if not match:
+        return None
+    seconds, months = 0.0, 0
+    for amount, unit in DURATION_PART_RE.findall(match.group(1)):
+        value = 1.0 if amount in ("a", "an", "one") else float(amount)
+        if unit in _UNIT_SECONDS:
+            seconds += value * _UNIT_SECONDS[unit]
+        elif unit in _UNIT_MONTHS and value.is_integer():
+            months += int(value) * _UNIT_MONTHS[unit]
+        else:
+            return None
+    return now + timedelta(seconds=seconds) + relativedelta(months=months)
+
+
+def _parse_wall_clock(text: str, now: datetime, user_tz) -> Optional[datetime]:
+    match = DAY_CLOCK_RE.fullmatch(text) or CLOCK_DAY_RE.fullmatch(text)
+    if not match:
+        return None
+    day, weekday, named, hour = match.group("day", "weekday", "named", "hour")
+    if not (day or weekday or named or hour):
+        return None
+    if match.group("at") and not (named or hour):
+        return None
+
+    local_now = now.astimezone(user_tz)
+    date = local_now.date()
+    if day and day != "today":
+        date += timedelta(days=1)
+    elif weekday:
+        date += timedelta(days=(_WEEKDAYS[weekday] - date.weekday() - 1) % 7 + 1)
+
+    if named:
+        clock = (12, 0) if named == "noon" else (0, 0)
+    elif hour:
+        h, m, ampm = int(hour), int(match.group("minute") or 0), match.group("ampm")
+        # A bare number is only a time when it reads like one ("at 15", "15:30")
+        if not (ampm or match.group("minute") or match.group("at")):
+            return None
+        if ampm:
+            if not 1 <= h <= 12:
+                return None
+            h = h % 12 + (12 if ampm == "p" else 0)
+        if h > 23 or m > 59:
+            return None
+        clock = (h, m)
+    else:
+        clock = None
+
+    if clock is None:
+        naive = datetime.combine(date, local_now.time().replace(tzinfo=None))
+    else:
+        naive = datetime(date.year, date.month, date.day, *clock)
+    due = user_tz.localize(naive).astimezone(pytz.UTC)
+
+    # A bare time that already passed today means the next one
+    if not (day or weekday) and due <= now:
+        due = user_tz.localize(naive + timedelta(days=1)).astimezone(pytz.UTC)
+    return due
+
+
+def parse_time_fast(text: str, user_tz, now: Optional[datetime] = None) -> Optional[datetime]:
+    """Resolve common time expressions to an aware UTC datetime, or None to fall back"""
+    now = now or datetime.now(pytz.UTC)
+    text = " ".join(text.lower().split())
+    if not text or len(text) > 64:
+        return None
+    try:
+        return _parse_duration(text, now) or _parse_wall_clock(text, now, user_tz)
+    except (OverflowError, ValueError):
+        return None
+
+
+def dateparser_settings(user_tz, now: Optional[datetime] = None) -> dict:
+    return {
+        'RELATIVE_BASE': (now or datetime.now(pytz.UTC)).astimezone(user_tz),
+        'TIMEZONE': str(user_tz),
+        'TO_TIMEZONE': 'UTC',
+        'PREFER_DATES_FROM': 'future'
+    }
+
+
+def parse_time_slow(text: str, user_tz, now: Optional[datetime] = None) -> Optional[datetime]:
+    """dateparser fallback for everything the grammar does not cover (blocking)"""
+    import dateparser
+
+    due = dateparser.parse(text, settings=dateparser_settings(user_tz, now))
+    if not due:
+        return None
+    return pytz.UTC.localize(due) if due.tzinfo is None else due.astimezone(pytz.UTC)
+
+
+TIME_PARSE_CORPUS = [
+    "30m", "5 minutes", "in 5 minutes", "in 10 mins", "in 2 hours", "2h", "1h30m", "1h 30m",
+    "in 1 hour and 30 minutes", "in an hour", "in a day", "90 seconds", "3 days", "in 3 days",
+    "2 weeks", "in 1 week", "2 hours from now", "in 2 months", "45 min", "in 1.5 hours",
+    "tomorrow", "tomorrow at 3pm", "tomorrow 9am", "tmrw at 10:30", "today at 18:00",
+    "at 3pm", "at 15:30", "5pm", "7:45am", "noon", "at midnight", "friday", "next monday",
+    "monday at 9am", "next friday at noon", "sat 10am", "10am tomorrow", "at 8pm friday",
+    "next week", "in a fortnight", "december 25", "25/12 at 9am", "2026-12-31 18:00",
+    "end of the month", "this evening", "in half an hour",
+]
+
+
+def benchmark_time_parser(corpus: List[str] = TIME_PARSE_CORPUS, iterations: int = 2000, user_tz=None) -> dict:
+    """Time the fast path over the corpus and compare it with dateparser (blocking)"""
+    user_tz = user_tz or pytz.UTC
+    now = datetime.now(pytz.UTC)
+    hits = [text for text in corpus if parse_time_fast(text, user_tz, now)]
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in corpus:
+            parse_time_fast(text, user_tz, now)
+    fast_us = (time.perf_counter() - start) / (iterations * len(corpus)) * 1e6
+
+    start = time.perf_counter()
+    parse_time_slow(corpus[0], user_tz, now)  # first call pays for dateparser's import and data load
+    warmup_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    slow = {text: parse_time_slow(text, user_tz, now) for text in corpus}
+    slow_ms = (time.perf_counter() - start) / len(corpus) * 1000
+
+    # Fast-path answers that land within a minute of dateparser's
+    agree = sum(
+        1 for text in hits
+        if slow[text] and abs((parse_time_fast(text, user_tz, now) - slow[text]).total_seconds()) < 60
+    )
+    return {
+        "inputs": len(corpus),
+        "hits": len(hits),
+        "hit_rate": len(hits) / len(corpus),
+        "fast_us": fast_us,
+        "dateparser_ms": slow_ms,
+        "dateparser_warmup_ms": warmup_ms,
+        "agree": agree,
+        "misses": [text for text in corpus if text not in hits],
+    }
+
+
 class ReminderPaginator(View):
     """Enhanced paginator for reminder lists with delete functionality"""
 
@@ -174,6 +520,7 @@ class ReminderPaginator(View):
                     "❌ Reminder not found (may have been already deleted)", ephemeral=True
                 )
                 return
+            self.cog.scheduler.unschedule(reminder_id)
 
             del self.reminders[self.current_page]
             del self.embeds[self.current_page]
@@ -251,6 +598,7 @@ class SnoozeView(View):
                 )
 
                 if result.modified_count > 0:
+                    await self.cog.scheduler.reschedule(self.reminder_id, new_due)
                     time_str = await self.cog.timezone_manager.format_time_with_timezone(
                         new_due, self.user_id
                     )
@@ -349,6 +697,7 @@ class ShiftTimeSelect(discord.ui.Select):
                     ephemeral=True
                 )
                 return
+            await self.cog.scheduler.reschedule(self.reminder_id, new_due)
 
             time_str = await self.cog.timezone_manager.format_time_with_timezone(
                 new_due, self.user_id
@@ -437,6 +786,7 @@ class RecurringView(View):
                         "❌ Database error: Could not save reminder", ephemeral=True
                     )
                     return
+                self.cog.scheduler.schedule(reminder_doc)
 
                 time_str = await self.cog.timezone_manager.format_time_with_timezone(
                     self.reminder_data["due"], self.user_id
@@ -524,6 +874,7 @@ class DualDeliveryView(View):
                     {"_id": self.reminder_id},
                     {"$set": {"due": new_due}}
                 )
+                await self.cog.scheduler.reschedule(self.reminder_id, new_due)
 
                 time_str = await self.cog.timezone_manager.format_time_with_timezone(
                     new_due, self.user_id
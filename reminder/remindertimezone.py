@@ -1,7 +1,8 @@
 # remindertimezone.py
 import pytz
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Optional, Set
+from typing import Dict, Iterable, Optional
 import re
 import logging
 
@@ -11,36 +12,88 @@ from discord.ext import commands
 log = logging.getLogger("Modmail")
 
 UTC_OFFSET_PATTERN = re.compile(r'^UTC([+-])(\d{1,2})(?::(\d{2}))?$', re.IGNORECASE)
+TIMEZONE_CACHE_SIZE = 5000
+
+# Every user on the same zone shares one tz object, keyed by name or offset
+_interned_timezones: Dict[object, pytz.BaseTzInfo] = {}
+
+
+def intern_timezone(timezone_name: Optional[str] = None, offset_minutes: Optional[int] = None) -> pytz.BaseTzInfo:
+    key = timezone_name if timezone_name else offset_minutes
+    tz = _interned_timezones.get(key)
+    if tz is None:
+        if timezone_name:
+            tz = pytz.timezone(timezone_name)
+        elif offset_minutes is not None:
+            tz = pytz.FixedOffset(int(offset_minutes))
+        else:
+            return pytz.UTC
+        _interned_timezones[key] = tz
+    return tz
+
+
+def timezone_from_doc(user_data: Optional[dict]) -> pytz.BaseTzInfo:
+    """Timezone stored in a ``timezone_<user>`` doc; users without one are UTC"""
+    if not user_data:
+        return pytz.UTC
+    # BUG FIX (🐛 Database Deserialization Crash)
+    return intern_timezone(user_data.get("timezone_name"), user_data.get("offset_minutes"))
+
 
 class ReminderTimezone:
-    """Centralized timezone management for reminders"""
+    """Centralized timezone management for reminders.
 
-    def __init__(self, db_partition):
+    ``user_timezones`` is an LRU bounded to TIMEZONE_CACHE_SIZE users. Users
+    without a saved timezone are cached as UTC too, so a miss hits Mongo once.
+    """
+
+    def __init__(self, db_partition, max_size: int = TIMEZONE_CACHE_SIZE):
         self.db = db_partition
-        self.user_timezones: Dict[int, pytz.BaseTzInfo] = {}
+        self.max_size = max_size
+        self.user_timezones: "OrderedDict[int, pytz.BaseTzInfo]" = OrderedDict()
+
+    def _remember(self, user_id: int, tz: pytz.BaseTzInfo):
+        self.user_timezones[user_id] = tz
+        self.user_timezones.move_to_end(user_id)
+        while len(self.user_timezones) > self.max_size:
+            self.user_timezones.popitem(last=False)
 
     async def get_user_timezone(self, user_id: int) -> pytz.BaseTzInfo:
         """Get cached timezone or fetch from DB"""
-        if user_id in self.user_timezones:
-            return self.user_timezones[user_id]
+        tz = self.user_timezones.get(user_id)
+        if tz is not None:
+            self.user_timezones.move_to_end(user_id)
+            return tz
 
         try:
             user_data = await self.db.find_one({"_id": f"timezone_{user_id}"})
-            if user_data:
-                # BUG FIX (🐛 Database Deserialization Crash)
-                if user_data.get("timezone_name"):
-                    tz = pytz.timezone(user_data["timezone_name"])
-                elif user_data.get("offset_minutes") is not None:
-                    tz = pytz.FixedOffset(int(user_data["offset_minutes"]))
-                else:
-                    return pytz.UTC
-                self.user_timezones[user_id] = tz
-                return tz
+            tz = timezone_from_doc(user_data)
+            self._remember(user_id, tz)
+            return tz
         except Exception as e:
             log.error(f"Failed to fetch timezone for user {user_id}: {e}")
 
         return pytz.UTC
 
+    async def warm(self, user_ids: Iterable[int]):
+        """Load every uncached user in one ``$in`` query (e.g. all owners of a due batch)"""
+        missing = {user_id for user_id in user_ids if user_id not in self.user_timezones}
+        if not missing:
+            return
+        try:
+            docs = await self.db.find(
+                {"_id": {"$in": [f"timezone_{user_id}" for user_id in missing]}}
+            ).to_list(None)
+        except Exception as e:
+            log.error(f"Failed to preload timezones for {len(missing)} users: {e}")
+            return
+        found = {int(doc["_id"][len("timezone_"):]): doc for doc in docs}
+        for user_id in missing:
+            try:
+                self._remember(user_id, timezone_from_doc(found.get(user_id)))
+            except pytz.UnknownTimeZoneError as e:
+                log.error(f"Unknown stored timezone for user {user_id}: {e}")
+
     async def set_user_timezone(self, user_id: int, timezone_str: str) -> Optional[pytz.BaseTzInfo]:
         """Validate and set user's timezone, supporting UTC offsets and named timezones"""
         try:
@@ -58,7 +111,7 @@ class ReminderTimezone:
                 if sign == '-':
                     offset_minutes = -offset_minutes
 
-                timezone = pytz.FixedOffset(offset_minutes)
+                timezone = intern_timezone(offset_minutes=offset_minutes)
 
                 # BUG FIX (🐛 Dynamic DST Offset Shifts)
                 await self.db.update_one(
@@ -71,8 +124,8 @@ class ReminderTimezone:
                 )
             else:
                 # Named timezone path (e.g., America/New_York)
-                if timezone_str in pytz.all_timezones:
-                    timezone = pytz.timezone(timezone_str)
+                if timezone_str in pytz.all_timezones_set:
+                    timezone = intern_timezone(timezone_str)
                 else:
                     return None
 
@@ -86,19 +139,13 @@ class ReminderTimezone:
                     upsert=True
                 )
 
-            self.user_timezones[user_id] = timezone
+            self._remember(user_id, timezone)
             return timezone
 
         except Exception as e:
             log.error(f"Failed to set timezone for user {user_id}: {e}")
             return None
 
-    def clean_cache(self, active_user_ids: Set[int]):
-        """Remove cached timezones for inactive users"""
-        inactive_users = set(self.user_timezones.keys()) - active_user_ids
-        for user_id in inactive_users:
-            del self.user_timezones[user_id]
-
     async def format_time_with_timezone(self, dt: datetime, user_id: int) -> str:
         """Format time for display in user's timezone"""
         try:
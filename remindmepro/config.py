@@ -9,11 +9,13 @@ class ReminderConfig:
     REMINDER_CLEANUP_DAYS = 30
     
     # Task settings
-    PROCESSING_INTERVAL = 120.0  # seconds
+    PROCESSING_INTERVAL = 30.0  # seconds between drains once the backlog is empty
     BATCH_SIZE = 100
+    LEASE_SECONDS = 300  # a claimed reminder is retried by anyone once its lease expires
     
     # UI settings
     PAGINATOR_TIMEOUT = 120  # seconds
+    PAGE_SIZE = 10  # reminders fetched per keyset page
     VIEW_TIMEOUT = 180  # seconds
     REMINDER_ID_PREFIX_LENGTH = 13
     
@@ -4,6 +4,7 @@ from .schemas import Reminder  # Changed from .models
 from .storage import ReminderStorage
 from .utilities import parse_user_time, validate_future_time
 from .user_settings import UserSettings
+from .tz_index import TimezoneIndex, get_timezone_index
 
 __all__ = [
     'UserFriendlyTime',
@@ -11,5 +12,7 @@ __all__ = [
     'ReminderStorage',
     'parse_user_time',
     'validate_future_time',
-    'UserSettings'
+    'UserSettings',
+    'TimezoneIndex',
+    'get_timezone_index'
 ]
\ No newline at end of file
@@ -7,6 +7,7 @@ from datetime import datetime
 
 class Reminder(BaseModel):
     """Data model for reminder objects"""
+    id: Optional[str] = None
     user_id: int
     channel_id: Optional[int] = None
     text: str = Field(..., max_length=400)
@@ -14,9 +15,20 @@ class Reminder(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(pytz.UTC))
     recurring: Optional[Literal["daily", "weekly"]] = None
     timezone: str = "UTC"
-    status: Literal["active", "completed", "paused"] = "active"
+    status: Literal["active", "processing", "completed", "paused"] = "active"
     undelivered: bool = False
 
+    @classmethod
+    def from_doc(cls, doc: dict) -> "Reminder":
+        """Build from a stored document without re-running the input validators
+        (a due reminder is in the past by definition)"""
+        fields = {k: v for k, v in doc.items() if k in cls.__fields__}
+        for key in ("due", "created_at"):
+            # Mongo hands datetimes back as naive UTC
+            if isinstance(fields.get(key), datetime) and fields[key].tzinfo is None:
+                fields[key] = fields[key].replace(tzinfo=pytz.UTC)
+        return cls.construct(id=str(doc["_id"]), **fields)
+
     @validator('text', allow_reuse=True)
     def sanitize_text(cls, v):
         sanitized = re.sub(r'[^\p{L}\p{N}\s.,!?\-@#\U0001F300-\U0001F6FF]', '␀', v)
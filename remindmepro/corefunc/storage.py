@@ -1,58 +1,155 @@
 # modmail-plugins/remindmepro/corefunc/storage.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
+import os
+import socket
+import uuid
 import pytz
 from discord.ext.commands import Bot
 
 from .schemas import Reminder
+from ..config import ReminderConfig
 
 log = logging.getLogger("Modmail")
 
+# Claimed reminders are still pending for their owner
+LISTED_STATUSES = ["active", "processing"]
+
 class ReminderStorage:
     """Handles all database operations for reminders"""
     
     def __init__(self, bot: Bot):
         self.db = bot.plugin_db.get_partition(self)
+        # Identifies this bot process on the reminders it has claimed
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
 
     async def initialize(self):
         """Create indexes on startup"""
         await self.db.create_index("user_id")
         await self.db.create_index("due")
         await self.db.create_index([("status", 1), ("due", 1)])
+        await self.db.create_index([("status", 1), ("lease_until", 1)])
+        await self.db.create_index([("user_id", 1), ("status", 1), ("due", 1), ("_id", 1)])
 
     async def get_user_reminders(self, user_id: int, limit: int = 50) -> List[Reminder]:
         """Get active reminders for a user, sorted by due date"""
+        return await self.get_user_reminders_page(user_id, limit=limit)
+
+    async def get_user_reminders_page(self, user_id: int, after: Optional[Tuple[datetime, str]] = None,
+                                      before: Optional[Tuple[datetime, str]] = None,
+                                      limit: int = ReminderConfig.PAGE_SIZE) -> List[Reminder]:
+        """One page of a user's pending reminders in (due, _id) order.
+
+        Keyset pagination: pass the (due, id) of the last reminder shown as
+        ``after`` for the next page, or of the first one as ``before`` for the
+        previous page. Each page is a range scan on the
+        (user_id, status, due, _id) index, however deep the user pages.
+        """
+        query = {"user_id": user_id, "status": {"$in": LISTED_STATUSES}}
+        direction = 1
+        if after:
+            due, reminder_id = after
+            query["$or"] = [{"due": {"$gt": due}}, {"due": due, "_id": {"$gt": reminder_id}}]
+        elif before:
+            due, reminder_id = before
+            query["$or"] = [{"due": {"$lt": due}}, {"due": due, "_id": {"$lt": reminder_id}}]
+            direction = -1
+
         try:
-            cursor = self.db.find({
-                "user_id": user_id,
-                "status": "active"
-            })
-            reminders = await cursor.to_list(length=limit)
-            # Manual sorting since we can't chain .sort()
-            reminders.sort(key=lambda x: x["due"])
-            return [Reminder(**doc) for doc in reminders]
+            cursor = self.db.find(query).sort([("due", direction), ("_id", direction)]).limit(limit)
+            docs = await cursor.to_list(length=limit)
+            if direction == -1:
+                docs.reverse()
+            return [Reminder.from_doc(doc) for doc in docs]
         except Exception as e:
             log.error(f"Error getting reminders for user {user_id}: {str(e)}")
             return []
 
-    async def get_due_reminders(self, batch_size: int = 100) -> List[Reminder]:
-        """Get reminders that are due, for batch processing"""
+    async def count_user_reminders(self, user_id: int) -> int:
+        """Number of pending reminders a user has (for the paginator header)"""
+        try:
+            return await self.db.count_documents({"user_id": user_id, "status": {"$in": LISTED_STATUSES}})
+        except Exception as e:
+            log.error(f"Error counting reminders for user {user_id}: {str(e)}")
+            return 0
+
+    async def get_reminder(self, reminder_id: str) -> Optional[Reminder]:
+        doc = await self.db.find_one({"_id": reminder_id})
+        return Reminder.from_doc(doc) if doc else None
+
+    async def get_due_reminders(self, batch_size: int = 100, hours_ahead: int = 0) -> List[Reminder]:
+        """Read-only view of active reminders due within ``hours_ahead``, soonest first.
+        Delivery goes through ``claim_due_reminders`` instead."""
         try:
             cursor = self.db.find({
-                "due": {"$lte": datetime.now(pytz.UTC)},
+                "due": {"$lte": datetime.now(pytz.UTC) + timedelta(hours=hours_ahead)},
                 "status": "active"
-            })
+            }).sort([("due", 1)])
             reminders = await cursor.to_list(length=batch_size)
-            return [Reminder(**doc) for doc in reminders]
+            return [Reminder.from_doc(doc) for doc in reminders]
         except Exception as e:
             log.error(f"Error getting due reminders: {str(e)}")
             return []
 
+    @staticmethod
+    def _claimable(now: datetime) -> dict:
+        """Due and either waiting or held by a lease that has run out"""
+        return {
+            "due": {"$lte": now},
+            "$or": [
+                {"status": "active"},
+                {"status": "processing", "lease_until": {"$lte": now}}
+            ]
+        }
+
+    async def claim_due_reminders(self, batch_size: int = ReminderConfig.BATCH_SIZE,
+                                  lease_seconds: int = ReminderConfig.LEASE_SECONDS) -> List[Reminder]:
+        """Lease the oldest due reminders to this process, oldest first.
+
+        Candidates are picked from the (status, due) index, then flipped to
+        ``processing`` by an update that re-checks claimability per document, so
+        two bot instances racing for the same batch never both win a reminder.
+        Only the reminders this process actually leased are returned.
+        """
+        try:
+            now = datetime.now(pytz.UTC)
+            candidates = await self.db.find(
+                self._claimable(now), {"_id": 1}
+            ).sort([("due", 1)]).limit(batch_size).to_list(length=batch_size)
+            if not candidates:
+                return []
+
+            ids = [doc["_id"] for doc in candidates]
+            lease_until = now + timedelta(seconds=lease_seconds)
+            await self.db.update_many(
+                {"_id": {"$in": ids}, **self._claimable(now)},
+                {"$set": {"status": "processing", "lease_owner": self.owner, "lease_until": lease_until}}
+            )
+            claimed = await self.db.find(
+                {"_id": {"$in": ids}, "lease_owner": self.owner, "lease_until": lease_until}
+            ).sort([("due", 1)]).to_list(length=batch_size)
+            return [Reminder.from_doc(doc) for doc in claimed]
+        except Exception as e:
+            log.error(f"Error claiming due reminders: {str(e)}")
+            return []
+
+    async def finish_claim(self, reminder_id: str, update_data: dict) -> bool:
+        """Apply the outcome of a delivery and drop this process's lease"""
+        try:
+            result = await self.db.update_one(
+                {"_id": reminder_id, "lease_owner": self.owner},
+                {"$set": update_data, "$unset": {"lease_owner": "", "lease_until": ""}}
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            log.error(f"Error finishing claim on reminder {reminder_id}: {str(e)}")
+            return False
+
     async def create_reminder(self, reminder: Reminder) -> str:
         """Insert a new reminder and return its ID"""
         try:
-            data = reminder.dict()
+            data = reminder.dict(exclude={"id"})
             # Create a composite ID since we don't have ObjectId
             reminder_id = f"{data['user_id']}_{int(data['due'].timestamp())}"
             data["_id"] = reminder_id
@@ -0,0 +1,172 @@
+# modmail-plugins/remindmepro/corefunc/tz_index.py
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pytz
+
+# Ranks: exact key, prefix of a whole key, prefix of a later word, trigram match
+EXACT, PREFIX, WORD_PREFIX, FUZZY = range(4)
+PREFIX_SCAN_LIMIT = 200  # prefix matches looked at per query, keeps 1-letter queries cheap
+FUZZY_THRESHOLD = 0.5  # share of the query's trigrams a key must contain
+MIN_RESOLVE_PREFIX = 3  # shortest prefix resolve() accepts, and only when it names a single zone
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.replace("_", " ").replace("/", " ").casefold().split())
+
+
+def flag_emoji(country_code: str) -> str:
+    return "".join(chr(0x1F1E6 + ord(c) - ord("A")) for c in country_code.upper())
+
+
+def trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TimezoneIndex:
+    """Prefix and trigram index over IANA zone names, aliases, countries and flags.
+
+    Exact keys resolve through a dict (first source to claim a key wins),
+    prefixes through a sorted term list (one term per word start, so ``york``
+    finds ``America/New_York``), and queries with no exact or prefix match
+    through trigram postings, which catches typos such as ``sydny``.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        started = time.perf_counter()
+        self.exact: Dict[str, str] = {}
+        self.keys: List[Tuple[str, str]] = []
+        self._seen = set()
+        self.terms: List[Tuple[str, int, int]] = []
+        self.grams: Dict[str, List[int]] = defaultdict(list)
+
+        # Earlier sources win when two of them claim the same key
+        for key, zone in (aliases or {}).items():
+            self._add(key, zone)
+        for zone in pytz.all_timezones:
+            self._add(zone, zone)
+        for code, zones in pytz.country_timezones.items():
+            self._add(pytz.country_names.get(code, code), zones[0])
+            self._add(flag_emoji(code), zones[0])
+            self._add(code, zones[0])
+        for zone in pytz.all_timezones:
+            self._add(zone.rsplit("/", 1)[-1], zone)
+
+        self.terms.sort()
+        del self._seen
+        self.build_ms = (time.perf_counter() - started) * 1000
+
+    def _add(self, key: str, zone: str):
+        norm = normalize(key)
+        if not norm or (norm, zone) in self._seen:
+            return
+        self._seen.add((norm, zone))
+        self.exact.setdefault(norm, zone)
+        entry = len(self.keys)
+        self.keys.append((norm, zone))
+        words = norm.split(" ")
+        offset = 0
+        for position, word in enumerate(words):
+            self.terms.append((norm[offset:], PREFIX if position == 0 else WORD_PREFIX, entry))
+            offset += len(word) + 1
+        for gram in trigrams(norm):
+            self.grams[gram].append(entry)
+
+    def search(self, query: str, limit: int = 25) -> List[str]:
+        """Zones matching ``query``, best first"""
+        return [zone for zone, _ in self.ranked(query, limit)]
+
+    def ranked(self, query: str, limit: int = 25) -> List[Tuple[str, int]]:
+        q = normalize(query)
+        if not q:
+            return []
+        best: Dict[str, tuple] = {}
+
+        def offer(zone: str, score: tuple):
+            if zone not in best or score < best[zone]:
+                best[zone] = score
+
+        if q in self.exact:
+            offer(self.exact[q], (EXACT, 0))
+
+        start = bisect_left(self.terms, (q,))
+        for term, rank, entry in self.terms[start:start + PREFIX_SCAN_LIMIT]:
+            if not term.startswith(q):
+                break
+            norm, zone = self.keys[entry]
+            offer(zone, (rank, len(norm)))
+
+        if not best and len(q) >= 3:
+            wanted = trigrams(q)
+            hits: Dict[int, int] = defaultdict(int)
+            for gram in wanted:
+                for entry in self.grams.get(gram, ()):
+                    hits[entry] += 1
+            needed = FUZZY_THRESHOLD * len(wanted)
+            for entry, count in hits.items():
+                if count >= needed:
+                    norm, zone = self.keys[entry]
+                    offer(zone, (FUZZY, -count / len(wanted), len(norm)))
+
+        ordered = sorted(best.items(), key=lambda item: (item[1], item[0]))
+        return [(zone, score[0]) for zone, score in ordered[:limit]]
+
+    def resolve(self, query: str) -> Optional[str]:
+        """Zone for an exact place, alias, flag, code or zone name, or for an unambiguous prefix
+
+        Short or ambiguous input (``a``, ``Eur``) returns None; callers should
+        offer ``search`` results as suggestions instead of guessing.
+        """
+        ranked = self.ranked(query, limit=2)
+        if not ranked:
+            return None
+        zone, rank = ranked[0]
+        if rank == EXACT:
+            return zone
+        if rank < FUZZY and len(ranked) == 1 and len(normalize(query)) >= MIN_RESOLVE_PREFIX:
+            return zone
+        return None
+
+
+_index: Optional[TimezoneIndex] = None
+
+
+def get_timezone_index() -> TimezoneIndex:
+    """Shared index, built on first use"""
+    global _index
+    if _index is None:
+        # Imported here: handlers import corefunc, so a module-level import would be circular
+        from ..handlers.timezones_config import TIMEZONE_ALIASES
+        _index = TimezoneIndex(TIMEZONE_ALIASES)
+    return _index
+
+
+def benchmark_timezone_index(index: Optional[TimezoneIndex] = None, zones: Iterable[str] = None) -> dict:
+    """Search every zone by full name and by a 4-letter city prefix, against a linear substring scan"""
+    index = index or get_timezone_index()
+    zones = list(zones or pytz.all_timezones)
+    queries = [zone for zone in zones] + [zone.rsplit("/", 1)[-1][:4] for zone in zones]
+
+    started = time.perf_counter()
+    found = sum(1 for zone in zones if zone in index.search(zone, limit=5))
+    for query in queries:
+        index.search(query)
+    index_us = (time.perf_counter() - started) / (len(queries) + len(zones)) * 1e6
+
+    started = time.perf_counter()
+    for query in queries:
+        lowered = query.lower()
+        [zone for zone in zones if lowered in zone.lower()]
+    scan_us = (time.perf_counter() - started) / len(queries) * 1e6
+
+    return {
+        "zones": len(zones),
+        "keys": len(index.keys),
+        "queries": len(queries),
+        "build_ms": index.build_ms,
+        "index_us": index_us,
+        "scan_us": scan_us,
+        "full_name_hit_rate": found / len(zones) if zones else 0.0,
+    }
\ No newline at end of file
@@ -1,12 +1,14 @@
 # modmail-plugins/remindmepro/handlers/admin_commands.py
 from discord.ext import commands
 import discord
+import asyncio
 from typing import List, Optional
 from datetime import datetime
 
 from ..corefunc.schemas import Reminder
 from ..corefunc.storage import ReminderStorage
 from ..corefunc.time import UserFriendlyTime
+from ..corefunc.tz_index import benchmark_timezone_index
 from ..ui.paginator import ReminderPaginator
 
 from core import checks
@@ -17,9 +19,10 @@ from discord import utils
 class AdminCommands(commands.Cog):
     """Handles admin-only reminder commands"""
     
-    def __init__(self, bot, storage: ReminderStorage):
+    def __init__(self, bot, storage: ReminderStorage, service_task=None):
         self.bot = bot
         self.storage = storage
+        self.service_task = service_task
         self.cooldown = commands.CooldownMapping.from_cooldown(2, 30, commands.BucketType.user)
 
     @commands.group(name="remindersadmin", aliases=["ra"], invoke_without_command=True)
@@ -95,31 +98,72 @@ class AdminCommands(commands.Cog):
         message = await ctx.send(embed=embeds[0], view=paginator)
         paginator.message = message
 
+    @reminders_admin.command(name="service")
+    @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
+    async def admin_service_stats(self, ctx):
+        """Show delivery throughput of the reminder service"""
+        if not self.service_task:
+            return await ctx.send("Reminder service is not running.", delete_after=15)
+
+        cycle = self.service_task.last_cycle
+        totals = self.service_task.totals
+        embed = discord.Embed(title="⏰ Reminder Service", color=self.bot.main_color)
+        if cycle:
+            embed.add_field(
+                name="Last cycle",
+                value=(
+                    f"Claimed: **{cycle['claimed']}** in {cycle['batches']} batches\n"
+                    f"Delivered: **{cycle['delivered']}** • Undelivered: {cycle['undelivered']} • Errors: {cycle['errors']}\n"
+                    f"Took {cycle['seconds']:.2f}s ({cycle['per_second']:.1f} reminders/s), "
+                    f"{utils.format_dt(cycle['finished_at'], 'R')}"
+                ),
+                inline=False
+            )
+        embed.add_field(
+            name="Since load",
+            value=(
+                f"Cycles: {totals['cycles']} • Claimed: {totals['claimed']}\n"
+                f"Delivered: {totals['delivered']} • Undelivered: {totals['undelivered']} • Errors: {totals['errors']}"
+            ),
+            inline=False
+        )
+        embed.set_footer(text=f"Lease owner: {self.storage.owner}")
+        await ctx.send(embed=embed, delete_after=60)
+
+    @reminders_admin.command(name="tzbench")
+    @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
+    async def admin_tz_benchmark(self, ctx):
+        """Benchmark timezone search over the full zone list"""
+        stats = await asyncio.to_thread(benchmark_timezone_index)
+        embed = discord.Embed(
+            title="🌐 Timezone Index Benchmark",
+            description=(
+                f"Zones: **{stats['zones']}** • Indexed keys: {stats['keys']} • Queries: {stats['queries']}\n"
+                f"Build: {stats['build_ms']:.1f} ms (once, on first use)\n"
+                f"Index search: **{stats['index_us']:.1f} µs**/query\n"
+                f"Linear scan: {stats['scan_us']:.1f} µs/query\n"
+                f"Full names found in top 5: {stats['full_name_hit_rate']:.1%}"
+            ),
+            color=self.bot.main_color
+        )
+        await ctx.send(embed=embed, delete_after=60)
+
     @reminders_admin.command(name="user")
     @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
     async def admin_user_reminders(self, ctx, user: discord.User):
         """View all reminders for a specific user"""
-        reminders = await self.storage.get_user_reminders(user.id)
+        paginator = await ReminderPaginator.for_user(
+            self.bot, self.storage, user.id, self._create_admin_reminder_embed, is_admin=True
+        )
         
-        if not reminders:
+        if not paginator:
             embed = discord.Embed(
                 title=f'No reminders found for {user.display_name}',
                 color=self.bot.error_color
             )
             return await ctx.send(embed=embed, delete_after=30)
         
-        embeds = []
-        for reminder in reminders:
-            embeds.append(self._create_admin_reminder_embed(reminder))
-        
-        paginator = ReminderPaginator(
-            bot=self.bot,
-            embeds=embeds,
-            storage=self.storage,
-            is_admin=True
-        )
-        
-        message = await ctx.send(embed=embeds[0], view=paginator)
+        message = await ctx.send(embed=paginator.current_embed(), view=paginator)
         paginator.message = message
 
     def _create_admin_reminder_embed(self, reminder: Reminder) -> discord.Embed:
@@ -4,6 +4,7 @@ import discord
 import pytz
 
 from ..corefunc.user_settings import UserSettings
+from ..corefunc.tz_index import get_timezone_index
 from ..corefunc.utilities import SUPPORTED_LOCATIONS_URL
 
 class TimezoneCommands(commands.Cog):
@@ -42,7 +43,7 @@ class TimezoneCommands(commands.Cog):
         """List available timezones (optionally filtered by search)"""
         all_tz = pytz.all_timezones
         if search:
-            filtered = [tz for tz in all_tz if search.lower() in tz.lower()]
+            filtered = get_timezone_index().search(search, limit=25)
             if not filtered:
                 return await ctx.send("No matching timezones found")
             all_tz = filtered[:10]  # Limit to 25 results
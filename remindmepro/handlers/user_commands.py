@@ -11,6 +11,8 @@ from ..corefunc.schemas import Reminder
 from ..corefunc.storage import ReminderStorage
 from ..corefunc.utilities import parse_user_time, validate_future_time
 from ..corefunc.user_settings import UserSettings
+from ..corefunc.tz_index import get_timezone_index
+from ..ui.paginator import ReminderPaginator
 from .timezones_config import TIMEZONE_ALIASES
 
 log = logging.getLogger(__name__)
@@ -94,19 +96,36 @@ class UserCommands(commands.Cog):
         embed.add_field(name="📩 Direct Messages", value=dm_status, inline=False)
         return embed
 
+    def _create_list_embed(self, reminder: Reminder) -> discord.Embed:
+        """Create embed for one reminder in the reminders list"""
+        embed = discord.Embed(
+            title='⏰ Reminder',
+            description=f'**When:**\n{utils.format_dt(reminder.due, "f")} ({utils.format_dt(reminder.due, "R")})\n'
+                       f'**What:**\n```css\n{reminder.text}\n```',
+            color=discord.Color.blue()
+        )
+        if reminder.recurring:
+            embed.add_field(name="Recurring", value=f"Every {reminder.recurring}", inline=False)
+        embed.set_footer(text=f"Reminder ID: {reminder.id}")
+        return embed
+
     @commands.command(name="reminders", aliases=["listreminders", "lr"])
     @commands.guild_only()
     async def list_reminders(self, ctx):
         """List your active reminders"""
-        reminders = await self.storage.get_user_reminders(ctx.author.id)
+        paginator = await ReminderPaginator.for_user(
+            self.bot, self.storage, ctx.author.id, self._create_list_embed
+        )
         
-        if not reminders:
+        if not paginator:
             embed = discord.Embed(
                 title='No reminders found',
                 description="You don't have any active reminders yet!",
                 color=self.bot.error_color
             )
             return await ctx.send(embed=embed, delete_after=260)
+
+        paginator.message = await ctx.send(embed=paginator.current_embed(), view=paginator)
             
     @commands.group(name="time", aliases=["timezone", "tz"], invoke_without_command=True)
     async def time_group(self, ctx):
@@ -131,17 +150,23 @@ class UserCommands(commands.Cog):
                 timezone_input = user_tz
                 source = "your set timezone"
             else:
-                # Check if input is an alias
-                normalized_input = timezone_input.lower().strip()
-                tz_key = next(
-                    (k for k in self.timezone_aliases.keys() 
-                     if k.lower() == normalized_input or k == timezone_input),
-                    None
-                )
+                # Resolve aliases, countries, flags, codes and zone names through the index
+                index = get_timezone_index()
+                zone = index.resolve(timezone_input)
                 
-                if tz_key:
-                    timezone_input = self.timezone_aliases[tz_key]
-                    source = f"alias '{tz_key}'"
+                if zone and zone != timezone_input:
+                    source = f"'{timezone_input.strip()}'"
+                    timezone_input = zone
+                elif zone is None:
+                    # Ambiguous or partial input: suggest instead of picking one
+                    suggestions = index.search(timezone_input, limit=5)
+                    if suggestions:
+                        listed = "\n".join(f"- `{s}`" for s in suggestions)
+                        return await ctx.send(
+                            f"Ambiguous timezone `{timezone_input}`. Did you mean:\n{listed}",
+                            delete_after=30
+                        )
+                    source = "direct timezone"
                 else:
                     source = "direct timezone"
             
@@ -185,9 +210,8 @@ class UserCommands(commands.Cog):
     @time_group.command(name="list")
     async def list_timezones(self, ctx, search: Optional[str] = None):
         """List available timezones (optionally filtered by search)"""
-        all_zones = pytz.all_timezones
         if search:
-            filtered = [zone for zone in all_zones if search.lower() in zone.lower()]
+            filtered = get_timezone_index().search(search, limit=25)
             if not filtered:
                 return await ctx.send("No matching timezones found", delete_after=15)
             zones = filtered[:25]  # Limit to 25 results
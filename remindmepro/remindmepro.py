@@ -1,4 +1,5 @@
 # modmail-plugins/remindmepro/remindmepro.py
+import asyncio
 import logging
 from discord.ext import commands
 
@@ -29,14 +30,14 @@ class RemindMePro(commands.Cog):
         self.storage = ReminderStorage(self.bot)
         self.user_settings = UserSettings(self.bot)
         
+        # Background tasks
+        self.service_task = ReminderServiceTask(self.bot, self.storage)
+        
         # Handlers
         self.user_commands = UserCommands(self.bot, self.storage, self.user_settings)
-        self.admin_commands = AdminCommands(self.bot, self.storage)
+        self.admin_commands = AdminCommands(self.bot, self.storage, self.service_task)
         self.timezone_commands = TimezoneCommands(self.bot, self.user_settings)
         
-        # Background tasks
-        self.service_task = ReminderServiceTask(self.bot, self.storage)
-        
     async def cog_load(self):
         try:
             await self.storage.initialize()
@@ -1,13 +1,16 @@
 # modmail-plugins/remindmepro/tasks/service_task.py
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import List
 
 import discord
+import pytz
 from discord.ext import tasks
 from discord.ui import View
 
+from ..config import ReminderConfig
 from ..corefunc.schemas import Reminder
 from ..corefunc.storage import ReminderStorage
 from ..ui.views import ReminderControlsView
@@ -22,13 +25,15 @@ class ReminderServiceTask:
         self.storage = storage
         self._current_batch: List[Reminder] = []
         self._processing_lock = asyncio.Lock()
+        self.last_cycle: dict = {}
+        self.totals = {"cycles": 0, "claimed": 0, "delivered": 0, "undelivered": 0, "errors": 0}
         # self.reminder_loop.start()
 
-    @tasks.loop(seconds=120.0)
+    @tasks.loop(seconds=ReminderConfig.PROCESSING_INTERVAL)
     async def reminder_loop(self):
         """Main processing loop for reminders"""
         async with self._processing_lock:
-            await self.process_due_reminders()
+            await self.drain_due_reminders()
 
     @reminder_loop.before_loop
     async def before_reminder_loop(self):
@@ -41,58 +46,98 @@ class ReminderServiceTask:
         """Cleanup when loop stops"""
         log.info("Reminder service stopped")
 
-    async def process_due_reminders(self, batch_size: int = 100):
-        """Process a batch of due reminders"""
+    async def drain_due_reminders(self, batch_size: int = ReminderConfig.BATCH_SIZE):
+        """Claim and deliver due reminders batch after batch until none are left"""
+        started = time.perf_counter()
+        cycle = {"batches": 0, "claimed": 0, "delivered": 0, "undelivered": 0, "errors": 0}
         try:
-            self._current_batch = await self.storage.get_due_reminders(batch_size)
-            log.debug(f"Processing {len(self._current_batch)} due reminders")
-            
-            for reminder in self._current_batch:
-                await self.process_single_reminder(reminder)
-                
+            while True:
+                self._current_batch = await self.storage.claim_due_reminders(batch_size)
+                if not self._current_batch:
+                    break
+                cycle["batches"] += 1
+                cycle["claimed"] += len(self._current_batch)
+
+                for reminder in self._current_batch:
+                    outcome = await self.process_single_reminder(reminder)
+                    cycle[outcome] += 1
+
         except Exception as e:
             log.error(f"Error processing reminders batch:\n{str(e)}", exc_info=True)
+        finally:
+            self._current_batch = []
+            self._record_cycle(cycle, time.perf_counter() - started)
+
+    def _record_cycle(self, cycle: dict, elapsed: float):
+        cycle["seconds"] = elapsed
+        cycle["per_second"] = cycle["claimed"] / elapsed if elapsed > 0 else 0.0
+        cycle["finished_at"] = datetime.now(pytz.UTC)
+        self.last_cycle = cycle
+        self.totals["cycles"] += 1
+        for key in ("claimed", "delivered", "undelivered", "errors"):
+            self.totals[key] += cycle[key]
+        if cycle["claimed"]:
+            log.info(
+                f"Reminder cycle: {cycle['claimed']} claimed in {cycle['batches']} batches, "
+                f"{cycle['delivered']} delivered, {cycle['undelivered']} undelivered, "
+                f"{cycle['errors']} errors, {elapsed:.2f}s ({cycle['per_second']:.1f}/s)"
+            )
+
+    async def process_single_reminder(self, reminder: Reminder) -> str:
+        """Handle delivery and state update for a single claimed reminder.
 
-    async def process_single_reminder(self, reminder: Reminder):
-        """Handle delivery and state update for a single reminder"""
+        Returns ``delivered``, ``undelivered`` or ``errors``. Undelivered and
+        failed reminders keep their lease, so they are retried once it expires.
+        """
         try:
             # Handle recurring reminders first
             if reminder.recurring:
-                await self.handle_recurring_reminder(reminder)
-                return
+                return await self.handle_recurring_reminder(reminder)
                 
             # Try to deliver the reminder
             delivered = await self.deliver_reminder(reminder)
             
             if delivered:
-                await self.storage.mark_completed(str(reminder.id))
-            else:
-                await self.storage.update_reminder(
-                    str(reminder.id),
-                    {"undelivered": True}
-                )
+                await self.storage.finish_claim(reminder.id, {
+                    "status": "completed",
+                    "completed_at": datetime.now(pytz.UTC),
+                    "undelivered": False
+                })
+                return "delivered"
+
+            await self.storage.update_reminder(reminder.id, {"undelivered": True})
+            return "undelivered"
                 
         except Exception as e:
             log.error(f"Failed to process reminder {reminder.id}:\n{str(e)}", exc_info=True)
+            return "errors"
 
-    async def handle_recurring_reminder(self, reminder: Reminder):
+    async def handle_recurring_reminder(self, reminder: Reminder) -> str:
         """Process recurring reminders and schedule next occurrence"""
         try:
             # First deliver the current reminder
-            await self.deliver_reminder(reminder)
+            delivered = await self.deliver_reminder(reminder)
             
-            # Calculate and schedule next occurrence
-            user_tz = ZoneInfo(reminder.timezone)
-            local_due = reminder.due.astimezone(user_tz)
-            next_due = self.calculate_next_occurrence(local_due, reminder.recurring)
-            next_due_utc = user_tz.localize(next_due).astimezone(pytz.UTC)
-            await self.storage.update_reminder(
-                str(reminder.id),
-                {"due": next_due}
-            )
+            # Calculate and schedule next occurrence, keeping the local wall-clock time
+            user_tz = pytz.timezone(reminder.timezone)
+            step = timedelta(days=1) if reminder.recurring == "daily" else timedelta(weeks=1)
+            local_due = reminder.due.astimezone(user_tz).replace(tzinfo=None)
+            now = datetime.now(pytz.UTC)
+            next_due = reminder.due
+            while next_due <= now:
+                local_due += step
+                next_due = user_tz.localize(local_due).astimezone(pytz.UTC)
+
+            await self.storage.finish_claim(reminder.id, {
+                "status": "active",
+                "due": next_due,
+                "undelivered": not delivered
+            })
+            return "delivered" if delivered else "undelivered"
             
         except Exception as e:
             log.error(f"Failed to process recurring reminder {reminder.id}: {str(e)}")
+            return "errors"
 
     async def deliver_reminder(self, reminder: Reminder) -> bool:
         """Attempt to deliver reminder to user with channel fallback logic"""
@@ -6,6 +6,7 @@ from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
 
 from ..corefunc.schemas import Reminder
+from ..corefunc.tz_index import get_timezone_index
 
 class TimeService:
     """Service for time-related operations"""
@@ -67,9 +68,8 @@ class TimeService:
             formatted += f" ({self.format_relative_time(dt)})"
         return formatted
 
-    def get_timezone_choices(self, search: Optional[str] = None) -> List[str]:
-        """Get list of timezone choices, optionally filtered"""
-        all_zones = pytz.all_timezones
+    def get_timezone_choices(self, search: Optional[str] = None, limit: int = 25) -> List[str]:
+        """Get list of timezone choices, optionally filtered and ranked by the shared index"""
         if search:
-            return [zone for zone in all_zones if search.lower() in zone.lower()]
-        return all_zones
\ No newline at end of file
+            return get_timezone_index().search(search, limit=limit)
+        return pytz.all_timezones
\ No newline at end of file
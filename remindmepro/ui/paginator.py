@@ -1,17 +1,26 @@
 # modmail-plugins/remindmepro/ui/paginator.py
 from discord.ui import View, Button
 import discord
-from typing import List, Optional
+import logging
+from typing import Callable, List, Optional
 
+from ..config import ReminderConfig
 from ..corefunc.schemas import Reminder
 from ..corefunc.storage import ReminderStorage
 
+log = logging.getLogger("Modmail")
+
 class ReminderPaginator(View):
-    """Custom paginator with enhanced controls for reminders"""
+    """Custom paginator with enhanced controls for reminders
+
+    Either pages over a fixed list of ``embeds``, or (via ``for_user``) pulls a
+    user's reminders from storage one keyset page at a time as the buttons are
+    pressed, holding at most one page of reminders in memory.
+    """
     
     def __init__(self, bot, embeds: List[discord.Embed], storage: ReminderStorage, 
                  user_id: int = None, is_admin: bool = False):
-        super().__init__(timeout=120)
+        super().__init__(timeout=ReminderConfig.PAGINATOR_TIMEOUT)
         self.bot = bot
         self.embeds = embeds
         self.current_page = 0
@@ -19,8 +28,38 @@ class ReminderPaginator(View):
         self.user_id = user_id
         self.is_admin = is_admin
         self.message = None
+        # Keyset mode state
+        self.render: Optional[Callable[[Reminder], discord.Embed]] = None
+        self.page: List[Reminder] = []
+        self.index = 0
+        self.total = len(embeds)
         self.update_buttons()
 
+    @classmethod
+    async def for_user(cls, bot, storage: ReminderStorage, user_id: int,
+                       render: Callable[[Reminder], discord.Embed], is_admin: bool = False) -> Optional["ReminderPaginator"]:
+        """Paginator over a user's reminders, or None if they have none"""
+        page = await storage.get_user_reminders_page(user_id)
+        if not page:
+            return None
+        paginator = cls(bot, [], storage, user_id=user_id, is_admin=is_admin)
+        paginator.render = render
+        paginator.page = page
+        paginator.total = max(await storage.count_user_reminders(user_id), len(page))
+        paginator.update_buttons()
+        return paginator
+
+    @property
+    def keyset(self) -> bool:
+        return self.render is not None
+
+    def current_embed(self) -> discord.Embed:
+        if not self.keyset:
+            return self.embeds[self.current_page]
+        embed = self.render(self.page[self.index])
+        embed.set_author(name=f"Reminder {self.current_page + 1} of {self.total}")
+        return embed
+
     async def on_timeout(self):
         if self.message:
             try:
@@ -32,11 +71,15 @@ class ReminderPaginator(View):
         self.clear_items()
         
         # Page navigation
-        if len(self.embeds) > 1:
-            self.add_item(Button(emoji="⬅️", style=discord.ButtonStyle.blurple, 
-                               disabled=self.current_page == 0, row=0))
-            self.add_item(Button(emoji="➡️", style=discord.ButtonStyle.blurple,
-                               disabled=self.current_page == len(self.embeds) - 1, row=0))
+        if self.total > 1:
+            previous_button = Button(emoji="⬅️", style=discord.ButtonStyle.blurple,
+                                     disabled=self.current_page == 0, row=0)
+            previous_button.callback = self.previous_page
+            self.add_item(previous_button)
+            next_button = Button(emoji="➡️", style=discord.ButtonStyle.blurple,
+                                 disabled=self.current_page >= self.total - 1, row=0)
+            next_button.callback = self.next_page
+            self.add_item(next_button)
         
         # Action buttons
         action_row = 1
@@ -55,6 +98,45 @@ class ReminderPaginator(View):
         self.add_item(Button(emoji="❎", style=discord.ButtonStyle.grey, 
                            custom_id="close_message", row=action_row))
 
+    async def _step(self, forward: bool) -> bool:
+        """Move one reminder; in keyset mode crossing a page edge fetches the neighbouring page"""
+        if not self.keyset:
+            target = self.current_page + (1 if forward else -1)
+            if not 0 <= target < len(self.embeds):
+                return False
+            self.current_page = target
+            return True
+
+        if forward and self.index + 1 < len(self.page):
+            self.index += 1
+        elif not forward and self.index > 0:
+            self.index -= 1
+        else:
+            edge = self.page[-1] if forward else self.page[0]
+            key = (edge.due, edge.id)
+            page = await self.storage.get_user_reminders_page(
+                self.user_id, after=key if forward else None, before=None if forward else key
+            )
+            if not page:
+                if forward:
+                    # Reminders fired or were deleted since the count was taken
+                    self.total = self.current_page + 1
+                return False
+            self.page = page
+            self.index = 0 if forward else len(page) - 1
+        self.current_page += 1 if forward else -1
+        return True
+
+    async def previous_page(self, interaction: discord.Interaction):
+        await self._step(forward=False)
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.current_embed(), view=self)
+
+    async def next_page(self, interaction: discord.Interaction):
+        await self._step(forward=True)
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.current_embed(), view=self)
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Ensure only authorized users can interact"""
         if interaction.user.guild_permissions.manage_messages:
@@ -71,8 +153,11 @@ class ReminderPaginator(View):
         return False
 
     async def get_current_reminder(self) -> Optional[Reminder]:
-        """Extract reminder from current embed footer"""
+        """Current reminder: held directly in keyset mode, else read from the embed footer"""
         try:
+            if self.keyset:
+                return self.page[self.index] if self.page else None
+
             if not self.embeds or self.current_page >= len(self.embeds):
                 return None
                 
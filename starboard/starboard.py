@@ -18,58 +18,346 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import discord
+import hashlib
 import re
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from discord.ext import commands
+from pymongo import UpdateOne
 
-class Starboard(commands.Cog):
-    """A fully automated, configurable Starboard system that highlights popular messages in your Discord server"""
-    def __init__(self, bot):
-        self.bot = bot
-        self.starboard_channels = {}
-        self._load_default_settings()
-
-    def _load_default_settings(self):
-        """Set default values before channel settings are loaded"""
-        self.star_emoji = '⭐'
-        self.star_count = 1
-        self.ignored_channels = []  # channels that will be ignored now also loaded from channel.topic
-
-    async def _load_channel_settings(self, channel):
-        """Load settings from channel topic"""
-        if not channel.topic:
+DEFAULT_STAR_EMOJI = '⭐'
+DEFAULT_STAR_COUNT = 1
+STAR_INDEX_CACHE_SIZE = 2000  # Recently used original -> starboard entries kept in memory
+BACKFILL_PAGE_SIZE = 100  # Messages per history request, Discord's maximum
+STAR_DEBOUNCE_WINDOW = 3  # Seconds of reactions on one message coalesced into a single update
+STAR_RESYNC_AFTER = 600  # Seconds before a tally is checked against a real fetch again
+STAR_TALLY_CACHE_SIZE = 5000  # Messages whose star count is tracked in memory
+MAX_REUPLOAD_SIZE = 8_000_000  # 8MB limit per re-uploaded attachment
+FILES_PER_MESSAGE = 5  # Discord allows 10, but we'll limit to 5 for safety
+MAX_CONCURRENT_DOWNLOADS = 4
+DOWNLOAD_BYTE_BUDGET = 48_000_000  # Attachment bytes held in memory across all starboard posts
+JUMP_URL_RE = re.compile(r'/channels/\d+/(\d+)/(\d+)')
+
+def render_signature(content, attachment_ids, embeds):
+    """Short hash of everything a starboard post renders, embeds given as dicts"""
+    h = hashlib.blake2b(digest_size=8)
+    h.update((content or '').encode())
+    for attachment_id in attachment_ids:
+        h.update(b'\0a%d' % int(attachment_id))
+    for embed in embeds:
+        for part in (
+            embed.get('title'), embed.get('description'),
+            (embed.get('image') or {}).get('url'), (embed.get('thumbnail') or {}).get('url')
+        ):
+            h.update(b'\0e' + (part or '').encode())
+        for field in embed.get('fields', []):
+            h.update(b'\0f' + f"{field.get('name')}\0{field.get('value')}".encode())
+    return h.hexdigest()
+
+def message_signature(message):
+    return render_signature(
+        message.content, [a.id for a in message.attachments], [e.to_dict() for e in message.embeds]
+    )
+
+class StarIndex:
+    """Original message -> starboard message mapping, in the plugin DB with an LRU in front"""
+    def __init__(self, db, max_size=STAR_INDEX_CACHE_SIZE):
+        self.db = db
+        self.max_size = max_size
+        self._cache = OrderedDict()  # {original_id: entry dict, or None for "not starboarded"}
+        self.ids = set()  # Every starboarded original, so edits can be filtered without I/O
+        self.loaded = False
+
+    async def load_ids(self):
+        async for doc in self.db.find({'type': 'star_entry'}, {'_id': 1}):
+            self.ids.add(int(doc['_id'][len('star_'):]))
+        self.loaded = True
+
+    def __contains__(self, original_id):
+        # Until the ids are loaded, anything might be on the board
+        return not self.loaded or original_id in self.ids
+
+    def _remember(self, original_id, entry):
+        self._cache[original_id] = entry
+        self._cache.move_to_end(original_id)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    async def get(self, original_id):
+        """Entry for an original message, or None if it isn't on the starboard"""
+        if original_id in self._cache:
+            self._cache.move_to_end(original_id)
+            return self._cache[original_id]
+        entry = await self.db.find_one({'_id': f'star_{original_id}'})
+        self._remember(original_id, entry)
+        return entry
+
+    async def set(self, original_id, guild_id, channel_id, starboard_id, count, signature=None, attachments=None):
+        entry = {
+            '_id': f'star_{original_id}',
+            'type': 'star_entry',
+            'guild_id': guild_id,
+            'channel_id': channel_id,
+            'starboard_id': starboard_id,
+            'count': count,
+            'signature': signature,
+            'attachments': attachments or {}  # {original attachment id: board copy url}
+        }
+        self._remember(original_id, entry)
+        self.ids.add(original_id)
+        await self.db.replace_one({'_id': entry['_id']}, entry, upsert=True)
+        return entry
+
+    async def update(self, original_id, **fields):
+        entry = self._cache.get(original_id)
+        if entry:
+            entry.update(fields)
+        await self.db.update_one({'_id': f'star_{original_id}'}, {'$set': fields})
+
+    async def remove(self, original_id):
+        self._remember(original_id, None)
+        self.ids.discard(original_id)
+        await self.db.delete_one({'_id': f'star_{original_id}'})
+
+    async def bulk_set(self, entries):
+        """Upsert many entries at once, used by the backfill
+
+        Fields are merged, so a known post keeps its signature and board
+        attachment urls and isn't re-rendered on its next update.
+        """
+        if not entries:
             return
-            
+        await self.db.bulk_write([
+            UpdateOne({'_id': e['_id']}, {'$set': e}, upsert=True) for e in entries
+        ], ordered=False)
+        for e in entries:
+            original_id = int(e['_id'][len('star_'):])
+            self.ids.add(original_id)
+            cached = self._cache.get(original_id)
+            if cached:
+                cached.update(e)
+            elif original_id in self._cache:
+                self._cache[original_id] = dict(e)
+
+class StarTally:
+    """Star count of one message, kept up to date from raw reaction events"""
+    __slots__ = ('channel_id', 'count', 'synced_at')
+
+    def __init__(self, channel_id):
+        self.channel_id = channel_id
+        self.count = 0
+        self.synced_at = 0.0  # Never fetched
+
+    def needs_sync(self, now):
+        """First sight, an impossible count, or too long since the last real fetch"""
+        return not self.synced_at or self.count < 0 or now - self.synced_at > STAR_RESYNC_AFTER
+
+class AttachmentPipeline:
+    """Concurrent attachment downloads under a semaphore and a global in-memory byte budget"""
+    def __init__(self, max_concurrent=MAX_CONCURRENT_DOWNLOADS, byte_budget=DOWNLOAD_BYTE_BUDGET):
+        self.byte_budget = byte_budget
+        self.available = byte_budget
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._budget_changed = asyncio.Condition()
+
+    @asynccontextmanager
+    async def download(self, attachments):
+        """Yield (attachment, file) pairs; their bytes stay reserved until the block exits"""
+        # Reserve a whole post at once, partial reservations could deadlock each other
+        reserved = min(sum(a.size for a in attachments), self.byte_budget)
+        async with self._budget_changed:
+            await self._budget_changed.wait_for(lambda: self.available >= reserved)
+            self.available -= reserved
+        try:
+            files = await asyncio.gather(*(self._fetch(a) for a in attachments))
+            yield [(a, f) for a, f in zip(attachments, files) if f]
+        finally:
+            async with self._budget_changed:
+                self.available += reserved
+                self._budget_changed.notify_all()
+
+    async def _fetch(self, attachment):
+        async with self._semaphore:
+            try:
+                return await attachment.to_file()
+            except discord.HTTPException:
+                return None  # Skip if we can't process the file
+
+class GuildStarSettings:
+    """One guild's starboard settings, mirrored in its starboard channel topic"""
+    __slots__ = ('guild_id', 'channel_id', 'emoji', 'count', 'ignored_channels')
+
+    def __init__(self, guild_id, channel_id=None):
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.reset()
+
+    def reset(self):
+        self.emoji = DEFAULT_STAR_EMOJI
+        self.count = DEFAULT_STAR_COUNT
+        self.ignored_channels = set()
+
+    def load_topic(self, topic):
+        """Load settings from channel topic, anything missing falls back to defaults"""
+        self.reset()
+        if not topic:
+            return
+
         # Extract emoji from topic
-        emoji_match = re.search(r'default_emoji:(\S+)', channel.topic)
+        emoji_match = re.search(r'default_emoji:(\S+)', topic)
         if emoji_match:
-            self.star_emoji = emoji_match.group(1)
-            
+            self.emoji = emoji_match.group(1)
+
         # Extract star count from topic
-        count_match = re.search(r'default_count:(\d+)', channel.topic)
+        count_match = re.search(r'default_count:(\d+)', topic)
         if count_match:
-            self.star_count = int(count_match.group(1))
+            self.count = int(count_match.group(1))
 
         # Extract ignored channels from topic
-        ignored_match = re.search(r'ignored_channels:\(([\d,\s]+)\)', channel.topic)
+        ignored_match = re.search(r'ignored_channels:\(([\d,\s]+)\)', topic)
         if ignored_match:
-            self.ignored_channels = [int(cid.strip()) for cid in ignored_match.group(1).split(',')]
+            self.ignored_channels = {int(cid.strip()) for cid in ignored_match.group(1).split(',') if cid.strip()}
 
-    async def _update_channel_topic(self, channel):
-        """Update channel topic with current settings"""
+    def to_topic(self, current_topic):
+        """Channel topic holding the current settings"""
         parts = []
-        if channel.topic and not channel.topic.startswith("Starboard channel"):
-            parts.append(channel.topic.split('\n')[0])
-        
-        parts.append(f"default_emoji:{self.star_emoji}")
-        parts.append(f"default_count:{self.star_count}")
-        
+        if current_topic and not current_topic.startswith("Starboard channel"):
+            parts.append(current_topic.split('\n')[0])
+
+        parts.append(f"default_emoji:{self.emoji}")
+        parts.append(f"default_count:{self.count}")
+
         if self.ignored_channels:
-            ignored_str = ",".join(str(cid) for cid in self.ignored_channels)
+            ignored_str = ",".join(str(cid) for cid in sorted(self.ignored_channels))
             parts.append(f"ignored_channels:({ignored_str})")
-        
-        new_topic = "Starboard channel\n" + " ".join(parts)
-        await channel.edit(topic=new_topic)
+
+        return "Starboard channel\n" + " ".join(parts)
+
+    def to_doc(self):
+        return {
+            '_id': f'settings_{self.guild_id}',
+            'type': 'guild_settings',
+            'channel_id': self.channel_id,
+            'emoji': self.emoji,
+            'count': self.count,
+            'ignored_channels': sorted(self.ignored_channels)
+        }
+
+    @classmethod
+    def from_doc(cls, guild_id, doc):
+        settings = cls(guild_id, doc.get('channel_id'))
+        settings.emoji = doc.get('emoji', DEFAULT_STAR_EMOJI)
+        settings.count = doc.get('count', DEFAULT_STAR_COUNT)
+        settings.ignored_channels = set(doc.get('ignored_channels', []))
+        return settings
+
+class Starboard(commands.Cog):
+    """A fully automated, configurable Starboard system that highlights popular messages in your Discord server"""
+    def __init__(self, bot):
+        self.bot = bot
+        self.db = bot.plugin_db.get_partition(self)
+        self.settings = {}  # {guild_id: GuildStarSettings}, loaded once per guild
+        self.index = StarIndex(self.db)
+        self.attachments = AttachmentPipeline()
+        self._locks = weakref.WeakValueDictionary()  # Per original message, so one star burst posts once
+        self.tallies = OrderedDict()  # {message_id: StarTally}, least recently starred first
+        self._flushes = {}  # {message_id: (guild_id, debounce task)}
+        self.board_embeds = OrderedDict()  # {original_id: embed last sent to its board post}
+        self.bot.loop.create_task(self.index.load_ids())
+
+    async def cog_unload(self):
+        # Apply star changes still waiting out their debounce window instead of dropping them
+        pending = list(self._flushes.items())
+        self._flushes.clear()
+        for message_id, (guild_id, task) in pending:
+            task.cancel()
+            try:
+                async with self._message_lock(message_id):
+                    await self._flush_stars(guild_id, message_id)
+            except Exception as e:
+                print(f"Error updating starboard entry on unload: {e}")
+
+    def _message_lock(self, message_id):
+        lock = self._locks.get(message_id)
+        if lock is None:
+            lock = self._locks[message_id] = asyncio.Lock()
+        return lock
+
+    def _remember_embed(self, original_id, embed):
+        self.board_embeds[original_id] = embed
+        self.board_embeds.move_to_end(original_id)
+        while len(self.board_embeds) > STAR_INDEX_CACHE_SIZE:
+            self.board_embeds.popitem(last=False)
+
+    async def get_settings(self, guild):
+        """Cached settings for a guild, read from the DB or the channel topic the first time"""
+        settings = self.settings.get(guild.id)
+        if settings:
+            return settings
+
+        doc = await self.db.find_one({'_id': f'settings_{guild.id}'})
+        if doc:
+            settings = GuildStarSettings.from_doc(guild.id, doc)
+        else:
+            # First run on this guild, take over whatever the topic says
+            settings = GuildStarSettings(guild.id)
+            channel = discord.utils.get(guild.text_channels, name="starboard")
+            if channel:
+                settings.channel_id = channel.id
+                settings.load_topic(channel.topic)
+            await self._persist_settings(settings)
+        self.settings[guild.id] = settings
+        return settings
+
+    async def _settings_for(self, guild_id):
+        """Settings on the event hot path, only awaiting a load on a guild's first event"""
+        settings = self.settings.get(guild_id)
+        if settings is None:
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                return None
+            settings = await self.get_settings(guild)
+        return settings
+
+    async def _persist_settings(self, settings):
+        await self.db.replace_one({'_id': f'settings_{settings.guild_id}'}, settings.to_doc(), upsert=True)
+
+    async def save_settings(self, settings, channel):
+        """Store settings in the DB and mirror them in the channel topic"""
+        await self._persist_settings(settings)
+        await channel.edit(topic=settings.to_topic(channel.topic))
+
+    # +------------------------------------------------------------+
+    # |             LISTENER:  CHANNEL UPDATE / DELETE             |
+    # +------------------------------------------------------------+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        """Pick up hand edits of the starboard channel topic"""
+        settings = self.settings.get(after.guild.id)
+        if settings is None or after.id != settings.channel_id:
+            return
+        topic = getattr(after, 'topic', None)
+        if topic == getattr(before, 'topic', None):
+            return
+        settings.load_topic(topic)
+        await self._persist_settings(settings)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        settings = self.settings.get(channel.guild.id)
+        if settings is None:
+            # Settings not loaded yet, clear the stored board id without loading them
+            await self.db.update_one(
+                {'_id': f'settings_{channel.guild.id}', 'channel_id': channel.id},
+                {'$set': {'channel_id': None}}
+            )
+        elif channel.id == settings.channel_id:
+            settings.channel_id = None
+            await self._persist_settings(settings)
 
     # +------------------------------------------------------------+
     # |             CMD:  IGNORE GROUP                             |
@@ -87,14 +375,13 @@ class Starboard(commands.Cog):
     @ignored.command(name='list')
     async def ignored_list(self, ctx):
         """List all ignored channels"""
-        starboard_channel = await self.ensure_starboard_channel(ctx.guild)
-        await self._load_channel_settings(starboard_channel)
+        settings = await self.get_settings(ctx.guild)
         
-        if not self.ignored_channels:
+        if not settings.ignored_channels:
             return await ctx.send("No channels are currently ignored.")
             
         channels = []
-        for channel_id in self.ignored_channels:
+        for channel_id in sorted(settings.ignored_channels):
             channel = ctx.guild.get_channel(channel_id)
             channels.append(f"{channel.mention if channel else 'Deleted Channel'} (`{channel_id}`)")
             
@@ -112,16 +399,16 @@ class Starboard(commands.Cog):
     async def ignored_add(self, ctx, channel: discord.TextChannel):
         """Add a channel to the ignored list"""
         starboard_channel = await self.ensure_starboard_channel(ctx.guild)
-        await self._load_channel_settings(starboard_channel)
+        settings = await self.get_settings(ctx.guild)
         
-        if channel.id in self.ignored_channels:
+        if channel.id in settings.ignored_channels:
             return await ctx.send(f"{channel.mention} is already ignored.")
             
         if channel.id == starboard_channel.id:
             return await ctx.send("Cannot ignore the starboard channel itself.")
             
-        self.ignored_channels.append(channel.id)
-        await self._update_channel_topic(starboard_channel)
+        settings.ignored_channels.add(channel.id)
+        await self.save_settings(settings, starboard_channel)
         await ctx.send(f"✅ Added {channel.mention} to ignored channels.")
 
     # +------------------------------------------------------------+
@@ -131,13 +418,13 @@ class Starboard(commands.Cog):
     async def ignored_remove(self, ctx, channel: discord.TextChannel):
         """Remove a channel from the ignored list"""
         starboard_channel = await self.ensure_starboard_channel(ctx.guild)
-        await self._load_channel_settings(starboard_channel)
+        settings = await self.get_settings(ctx.guild)
         
-        if channel.id not in self.ignored_channels:
+        if channel.id not in settings.ignored_channels:
             return await ctx.send(f"{channel.mention} wasn't in the ignored list.")
             
-        self.ignored_channels.remove(channel.id)
-        await self._update_channel_topic(starboard_channel)
+        settings.ignored_channels.discard(channel.id)
+        await self.save_settings(settings, starboard_channel)
         await ctx.send(f"✅ Removed {channel.mention} from ignored channels.")
 
     # +------------------------------------------------------------+
@@ -147,13 +434,13 @@ class Starboard(commands.Cog):
     async def ignored_clear(self, ctx):
         """Clear all ignored channels"""
         starboard_channel = await self.ensure_starboard_channel(ctx.guild)
-        await self._load_channel_settings(starboard_channel)
+        settings = await self.get_settings(ctx.guild)
         
-        if not self.ignored_channels:
+        if not settings.ignored_channels:
             return await ctx.send("No channels were ignored to begin with.")
             
-        self.ignored_channels.clear()
-        await self._update_channel_topic(starboard_channel)
+        settings.ignored_channels.clear()
+        await self.save_settings(settings, starboard_channel)
         await ctx.send("✅ Cleared all ignored channels.")
 
     # +------------------------------------------------------------+
@@ -170,41 +457,38 @@ class Starboard(commands.Cog):
         ?starconfig reset     - Reset to defaults
         """
         channel = await self.ensure_starboard_channel(ctx.guild)
+        settings = await self.get_settings(ctx.guild)
         
         if emoji and str(emoji).lower() == 'reset':
             new_topic = "Starboard channel - Reset to defaults"
-            self._load_default_settings()
+            settings.reset()
+            await self._persist_settings(settings)
             await channel.edit(topic=new_topic)
-            return await ctx.send("✅ Reset starboard default reactions **(⭐ 1)**")
-            
-        # Build new topic string in Starboard channel
-        parts = []
-        if channel.topic and not channel.topic.startswith("Starboard channel"):
-            parts.append(channel.topic.split('\n')[0])
+            return await ctx.send(f"✅ Reset starboard default reactions **({DEFAULT_STAR_EMOJI} {DEFAULT_STAR_COUNT})**")
             
         if emoji:
-            parts.append(f"default_emoji:{emoji}")
-            self.star_emoji = emoji
+            settings.emoji = emoji
             
         if count:
-            parts.append(f"default_count:{count}")
-            self.star_count = count
+            settings.count = count
             
-        new_topic = "Starboard channel\n" + " ".join(parts)
-        await channel.edit(topic=new_topic)
+        await self.save_settings(settings, channel)
         
         # Show current settings
-        settings = []
+        changed = []
         if emoji:
-            settings.append(f"Emoji: {self.star_emoji}")
+            changed.append(f"Emoji: {settings.emoji}")
         if count:
-            settings.append(f"Required stars: {self.star_count}")
+            changed.append(f"Required stars: {settings.count}")
             
-        await ctx.send(f"✅ Updated starboard settings: {' '.join(settings)}")
+        await ctx.send(f"✅ Updated starboard settings: {' '.join(changed)}")
 
     async def ensure_starboard_channel(self, guild):
-        """Find or create starboard channel and load settings"""
-        channel = discord.utils.get(guild.text_channels, name="starboard")
+        """Find or create starboard channel"""
+        settings = await self.get_settings(guild)
+        channel = guild.get_channel(settings.channel_id) if settings.channel_id else None
+        if not channel:
+            channel = discord.utils.get(guild.text_channels, name="starboard")
         
         if not channel:
             # Create the channel
@@ -258,19 +542,23 @@ class Starboard(commands.Cog):
             await channel.send("# ⭐ **Welcome to the Starboard!** ⭐\n\n"
                              "Messages that get enough star reactions will appear here.")
         
-        await self._load_channel_settings(channel)
-        self.starboard_channels[guild.id] = channel.id
+        if settings.channel_id != channel.id:
+            settings.channel_id = channel.id
+            await self._persist_settings(settings)
         return channel
         
-    async def get_star_reaction(self, message):
+    async def get_star_reaction(self, message, emoji):
         """Helper to get the star reaction from a message"""
         for reaction in message.reactions:
-            if str(reaction.emoji) == self.star_emoji:
+            if str(reaction.emoji) == emoji:
                 return reaction
         return None
 
-    def create_starboard_embed(self, message):
-        """Create an embed for the starboard that handles all content types"""
+    def create_starboard_embed(self, message, emoji, attachment_urls=None):
+        """Create an embed for the starboard that handles all content types
+
+        ``attachment_urls`` maps attachment ids to their re-uploaded copies on the board.
+        """
         embed = discord.Embed(
             description=message.content if message.content else None,
             color=discord.Color.gold(),
@@ -281,19 +569,20 @@ class Starboard(commands.Cog):
             icon_url=message.author.display_avatar.url
         )
         embed.add_field(name="Original", value=f"[Jump!]({message.jump_url})")
-        embed.add_field(name="Stars", value=f"1{self.star_emoji}")
+        embed.add_field(name="Stars", value=f"1{emoji}")
         embed.set_footer(text=f"Starboard ID: {message.id}")
 
         # Handle attachments (images, videos, files)
         if message.attachments:
             first_attachment = message.attachments[0]
+            url = (attachment_urls or {}).get(str(first_attachment.id), first_attachment.url)
             if first_attachment.content_type:
                 if first_attachment.content_type.startswith('image/'):
-                    embed.set_image(url=first_attachment.url)
+                    embed.set_image(url=url)
                 elif first_attachment.content_type.startswith('video/'):
-                    embed.add_field(name="Video", value=f"[Click to view]({first_attachment.url})")
+                    embed.add_field(name="Video", value=f"[Click to view]({url})")
                 else:
-                    embed.add_field(name="Attachment", value=f"[{first_attachment.filename}]({first_attachment.url})")
+                    embed.add_field(name="Attachment", value=f"[{first_attachment.filename}]({url})")
 
         # Handle embeds from the original message
         if message.embeds:
@@ -310,18 +599,56 @@ class Starboard(commands.Cog):
 
         return embed
 
-    async def update_starboard_message(self, starboard_message, star_count):
+    async def update_starboard_message(self, starboard_message, star_count, emoji):
         """Update an existing starboard message"""
         embed = starboard_message.embeds[0]
-        embed.set_field_at(1, name="Stars", value=f"{star_count}{self.star_emoji}")
+        embed.set_field_at(1, name="Stars", value=f"{star_count}{emoji}")
         await starboard_message.edit(embed=embed)
 
     async def find_starboard_message(self, channel, original_message_id):
-        """Find existing starboard message for a given original message"""
-        async for message in channel.history(limit=200):
-            if message.embeds and message.embeds[0].footer.text == f"Starboard ID: {original_message_id}":
-                return message
-        return None
+        """Find existing starboard message for a given original message through the index"""
+        entry = await self.index.get(original_message_id)
+        if not entry:
+            return None
+        try:
+            return await channel.fetch_message(entry['starboard_id'])
+        except discord.NotFound:
+            # Board post was deleted by hand, forget it so it can be posted again
+            await self.index.remove(original_message_id)
+            return None
+
+    @staticmethod
+    def parse_starboard_post(message):
+        """Index entry fields from a starboard post, or None if it isn't one"""
+        if not message.embeds:
+            return None
+        embed = message.embeds[0]
+        footer = embed.footer.text or ''
+        if not footer.startswith("Starboard ID: "):
+            return None
+        try:
+            original_id = int(footer[len("Starboard ID: "):])
+        except ValueError:
+            return None
+
+        channel_id, count = None, 0
+        for field in embed.fields:
+            if field.name == "Original":
+                jump = JUMP_URL_RE.search(field.value or '')
+                if jump:
+                    channel_id = int(jump.group(1))
+            elif field.name == "Stars":
+                digits = re.match(r'\d+', field.value or '')
+                if digits:
+                    count = int(digits.group())
+        return {
+            '_id': f'star_{original_id}',
+            'type': 'star_entry',
+            'guild_id': message.guild.id,
+            'channel_id': channel_id,
+            'starboard_id': message.id,
+            'count': count
+        }
 
     # +------------------------------------------------------------+
     # |             LISTENER:  RAW REACTION ADD                    |
@@ -329,86 +656,32 @@ class Starboard(commands.Cog):
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload):
         """Handle when a reaction is added"""
-        # Ignore if not our star emoji or in DMs
-        if str(payload.emoji) != self.star_emoji or not payload.guild_id:
-            return
-            
-        guild = self.bot.get_guild(payload.guild_id)
-        if guild is None:
-            return
-            
-        try:
-            starboard_channel = await self.ensure_starboard_channel(guild)
-        except commands.BotMissingPermissions:
+        # Ignore DMs
+        if not payload.guild_id:
             return
 
-        # Ignore reactions in ignored_channels
-        if payload.channel_id in self.ignored_channels:
-            return
-            
-        # Ignore reactions in starboard_channel
-        if payload.channel_id == starboard_channel.id:
+        settings = await self._settings_for(payload.guild_id)
+        # Ignore if not our star emoji, in ignored_channels or in starboard_channel
+        if settings is None or str(payload.emoji) != settings.emoji:
             return
-            
-        channel = self.bot.get_channel(payload.channel_id)
-        if not channel:
+        if payload.channel_id in settings.ignored_channels or payload.channel_id == settings.channel_id:
             return
-            
-        try:
-            message = await channel.fetch_message(payload.message_id)
-        except discord.NotFound:
-            return
-        except discord.Forbidden:
-            return
-        except discord.HTTPException:
-            return
-            
+
+        # Only the first star in a guild without a board needs to create it
+        if settings.channel_id is None:
+            try:
+                await self.ensure_starboard_channel(self.bot.get_guild(payload.guild_id))
+            except (commands.BotMissingPermissions, discord.Forbidden):
+                return
+
         # Ignore bot's own reactions or self-starring
         #if payload.user_id == message.author.id or payload.user_id == self.bot.user.id:
         #    return
-            
-        star_reaction = await self.get_star_reaction(message)
-        if not star_reaction or star_reaction.count < self.star_count:
-            return
-            
-        # Check if message is already in starboard
-        existing_message = await self.find_starboard_message(starboard_channel, message.id)
-        if existing_message:
-            await self.update_starboard_message(existing_message, star_reaction.count)
-            return
-                
-        # Create new starboard entry
-        try:
-            embed = self.create_starboard_embed(message)
-            files = []
-            
-            # Handle all attachments (including non-image files)
-            for attachment in message.attachments:
-                if not attachment.is_spoiler() and attachment.size < 8_000_000:  # 8MB limit
-                    try:
-                        files.append(await attachment.to_file())
-                    except:
-                        continue  # Skip if we can't process the file
-            
-            # Send message with embed and files
-            if files:
-                # If we have multiple files, we need to handle them carefully
-                # Discord allows up to 10 files per message, but we'll limit to 5 for safety
-                for i in range(0, len(files), 5):
-                    batch = files[i:i+5]
-                    if i == 0:
-                        # First batch includes the embed
-                        starboard_msg = await starboard_channel.send(embed=embed, files=batch)
-                    else:
-                        # Subsequent batches are just files
-                        await starboard_channel.send(files=batch)
-            else:
-                starboard_msg = await starboard_channel.send(embed=embed)
-                
-            await starboard_msg.add_reaction(self.star_emoji)
-        except Exception as e:
-            print(f"Error creating starboard entry: {e}")
 
+        # Count from the payload, a fresh tally gets its real count from one fetch on flush
+        tally = self._tally(payload.channel_id, payload.message_id)
+        tally.count += 1
+        self._schedule_flush(payload.guild_id, payload.message_id)
 
     # +------------------------------------------------------------+
     # |             LISTENER:  RAW REACTION REMOVE                 |
@@ -416,41 +689,185 @@ class Starboard(commands.Cog):
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload):
         """Handle when a reaction is removed"""
-        if str(payload.emoji) != self.star_emoji or not payload.guild_id:
-            return
-            
-        guild = self.bot.get_guild(payload.guild_id)
-        if guild is None:
+        if not payload.guild_id:
             return
-            
-        starboard_channel = self.bot.get_channel(self.starboard_channels.get(guild.id))
-        if not starboard_channel:
-            starboard_channel = discord.utils.get(guild.text_channels, name="starboard")
-            if not starboard_channel:
-                return
-            self.starboard_channels[guild.id] = starboard_channel.id
-            
-        if payload.channel_id == starboard_channel.id:
+
+        settings = await self._settings_for(payload.guild_id)
+        if settings is None or str(payload.emoji) != settings.emoji or payload.channel_id == settings.channel_id:
             return
-            
-        channel = self.bot.get_channel(payload.channel_id)
-        if not channel:
+
+        # Losing a star only matters for messages already on the board
+        if payload.message_id not in self.tallies and not await self.index.get(payload.message_id):
             return
-            
-        try:
-            message = await channel.fetch_message(payload.message_id)
-        except discord.NotFound:
+
+        tally = self._tally(payload.channel_id, payload.message_id)
+        tally.count -= 1
+        self._schedule_flush(payload.guild_id, payload.message_id)
+
+    # +------------------------------------------------------------+
+    # |             LISTENER:  RAW REACTION CLEAR                  |
+    # +------------------------------------------------------------+
+    @commands.Cog.listener()
+    async def on_raw_reaction_clear(self, payload):
+        """All reactions removed, the star count is exactly zero"""
+        await self._stars_cleared(payload)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_clear_emoji(self, payload):
+        """One emoji cleared from a message"""
+        settings = self.settings.get(payload.guild_id)
+        if settings and str(payload.emoji) == settings.emoji:
+            await self._stars_cleared(payload)
+
+    async def _stars_cleared(self, payload):
+        if payload.guild_id not in self.settings:
             return
-            
-        star_reaction = await self.get_star_reaction(message)
-        existing_message = await self.find_starboard_message(starboard_channel, message.id)
-        if not existing_message:
+        if payload.message_id not in self.tallies and not await self.index.get(payload.message_id):
             return
-            
-        if star_reaction and star_reaction.count >= self.star_count:
-            await self.update_starboard_message(existing_message, star_reaction.count)
+        tally = self._tally(payload.channel_id, payload.message_id)
+        tally.count = 0
+        tally.synced_at = time.monotonic()
+        self._schedule_flush(payload.guild_id, payload.message_id)
+
+    def _tally(self, channel_id, message_id):
+        """Star tally for a message, creating an unsynced one on first sight"""
+        tally = self.tallies.get(message_id)
+        if tally is None:
+            tally = self.tallies[message_id] = StarTally(channel_id)
+            while len(self.tallies) > STAR_TALLY_CACHE_SIZE:
+                self.tallies.popitem(last=False)
         else:
-            await existing_message.delete()
+            self.tallies.move_to_end(message_id)
+        return tally
+
+    def _schedule_flush(self, guild_id, message_id):
+        """Coalesce reaction bursts on a message into one starboard update per window"""
+        if message_id not in self._flushes:
+            self._flushes[message_id] = (guild_id, self.bot.loop.create_task(self._flush_later(guild_id, message_id)))
+
+    async def _flush_later(self, guild_id, message_id):
+        await asyncio.sleep(STAR_DEBOUNCE_WINDOW)
+        # Reactions arriving from here on schedule the next window
+        self._flushes.pop(message_id, None)
+        try:
+            async with self._message_lock(message_id):
+                await self._flush_stars(guild_id, message_id)
+        except Exception as e:
+            print(f"Error updating starboard entry: {e}")
+
+    async def _flush_stars(self, guild_id, message_id):
+        """Apply a message's tally to the starboard, fetching only to resync or to post"""
+        tally = self.tallies.get(message_id)
+        settings = self.settings.get(guild_id)
+        if tally is None or settings is None:
+            return
+        starboard_channel = self.bot.get_channel(settings.channel_id) if settings.channel_id else None
+        if not starboard_channel:
+            # Board deleted while offline or before settings loaded, find or recreate it
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                return
+            settings.channel_id = None
+            try:
+                starboard_channel = await self.ensure_starboard_channel(guild)
+            except (commands.BotMissingPermissions, discord.Forbidden):
+                return
+
+        message = None
+        if tally.needs_sync(time.monotonic()):
+            message = await self._fetch_original(tally.channel_id, message_id)
+            if message is None:
+                self.tallies.pop(message_id, None)
+                return
+            star_reaction = await self.get_star_reaction(message, settings.emoji)
+            tally.count = star_reaction.count if star_reaction else 0
+            tally.synced_at = time.monotonic()
+
+        entry = await self.index.get(message_id)
+        if tally.count >= settings.count:
+            if entry and entry['count'] == tally.count:
+                return
+            await self._post_or_update(starboard_channel, settings, message_id, tally, message)
+        elif entry:
+            existing_message = await self.find_starboard_message(starboard_channel, message_id)
+            if existing_message:
+                await existing_message.delete()
+            self.board_embeds.pop(message_id, None)
+            await self.index.remove(message_id)
+
+    async def _fetch_original(self, channel_id, message_id):
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            return None
+        try:
+            return await channel.fetch_message(message_id)
+        except discord.HTTPException:
+            return None
+
+    async def _post_or_update(self, starboard_channel, settings, message_id, tally, message=None):
+        """Update the existing starboard post, or create one and index it"""
+        star_count = tally.count
+        entry = await self.index.get(message_id)
+        if entry:
+            embed = self.board_embeds.get(message_id)
+            if embed is None and message is not None:
+                embed = self.create_starboard_embed(message, settings.emoji, entry.get('attachments'))
+            try:
+                if embed is None:
+                    # Nothing rendered for this post since startup, read it once
+                    embed = (await starboard_channel.fetch_message(entry['starboard_id'])).embeds[0]
+                embed.set_field_at(1, name="Stars", value=f"{star_count}{settings.emoji}")
+                # Partial message, the board post itself doesn't need fetching
+                await starboard_channel.get_partial_message(entry['starboard_id']).edit(embed=embed)
+            except discord.NotFound:
+                # Board post was deleted by hand, forget it and post again
+                self.board_embeds.pop(message_id, None)
+                await self.index.remove(message_id)
+            else:
+                self._remember_embed(message_id, embed)
+                await self.index.update(message_id, count=star_count)
+                return
+
+        if message is None:
+            message = await self._fetch_original(tally.channel_id, message_id)
+            if message is None:
+                return
+
+        # Create new starboard entry
+        try:
+            embed = self.create_starboard_embed(message, settings.emoji)
+            embed.set_field_at(1, name="Stars", value=f"{star_count}{settings.emoji}")
+
+            # The embed already shows one image straight from the CDN, only re-upload the rest
+            shown = embed.image.url
+            to_upload = [
+                a for a in message.attachments
+                if not a.is_spoiler() and a.size < MAX_REUPLOAD_SIZE and a.url != shown
+            ]
+
+            attachment_urls = {}
+            async with self.attachments.download(to_upload) as downloaded:
+                # Send message with embed and files, first batch includes the embed
+                starboard_msg = None
+                for i in range(0, max(len(downloaded), 1), FILES_PER_MESSAGE):
+                    batch = downloaded[i:i + FILES_PER_MESSAGE]
+                    kwargs = {'files': [f for _, f in batch]} if batch else {}
+                    if starboard_msg is None:
+                        sent = starboard_msg = await starboard_channel.send(embed=embed, **kwargs)
+                    else:
+                        sent = await starboard_channel.send(**kwargs)
+                    # Remember the board-hosted copies so re-renders never download again
+                    for (original, _), uploaded in zip(batch, sent.attachments):
+                        attachment_urls[str(original.id)] = uploaded.url
+
+            await self.index.set(
+                message.id, message.guild.id, message.channel.id, starboard_msg.id, star_count,
+                message_signature(message), attachment_urls
+            )
+            self._remember_embed(message.id, embed)
+            await starboard_msg.add_reaction(settings.emoji)
+        except Exception as e:
+            print(f"Error creating starboard entry: {e}")
 
     # +------------------------------------------------------------+
     # |             LISTENER:  RAW EDIT                            |
@@ -458,40 +875,86 @@ class Starboard(commands.Cog):
     @commands.Cog.listener()
     async def on_raw_message_edit(self, payload):
         """Handle when a message is edited"""
-        if not payload.guild_id:
-            return
-            
-        guild = self.bot.get_guild(payload.guild_id)
-        if guild is None:
+        # Almost every edit is for a message that was never starboarded
+        if payload.message_id not in self.index or not payload.guild_id:
             return
-            
-        starboard_channel = self.bot.get_channel(self.starboard_channels.get(guild.id))
-        if not starboard_channel:
-            starboard_channel = discord.utils.get(guild.text_channels, name="starboard")
-            if not starboard_channel:
-                return
-            self.starboard_channels[guild.id] = starboard_channel.id
-            
-        channel = self.bot.get_channel(payload.channel_id)
-        if not channel or channel.id == starboard_channel.id:
-            return
-            
-        try:
-            message = await channel.fetch_message(payload.message_id)
-        except discord.NotFound:
+
+        entry = await self.index.get(payload.message_id)
+        if not entry:
             return
-            
-        star_reaction = await self.get_star_reaction(message)
-        if not star_reaction:
+
+        # Edits that don't touch what the post shows (pins, flags, ...) need no work
+        data = payload.data
+        if 'content' in data and entry.get('signature') == render_signature(
+            data['content'], [a['id'] for a in data.get('attachments', [])], data.get('embeds', [])
+        ):
             return
-            
-        existing_message = await self.find_starboard_message(starboard_channel, message.id)
-        if not existing_message:
+
+        settings = await self._settings_for(payload.guild_id)
+        starboard_channel = self.bot.get_channel(settings.channel_id) if settings else None
+        if not starboard_channel:
             return
-            
-        embed = self.create_starboard_embed(message)
-        embed.set_field_at(1, name="Stars", value=f"{star_reaction.count}{self.star_emoji}")
-        await existing_message.edit(embed=embed)
+
+        async with self._message_lock(payload.message_id):
+            message = await self._fetch_original(payload.channel_id, payload.message_id)
+            if message is None:
+                return
+
+            signature = message_signature(message)
+            if signature == entry.get('signature'):
+                return
+
+            tally = self.tallies.get(message.id)
+            star_count = tally.count if tally and tally.synced_at else entry['count']
+            embed = self.create_starboard_embed(message, settings.emoji, entry.get('attachments'))
+            embed.set_field_at(1, name="Stars", value=f"{star_count}{settings.emoji}")
+            try:
+                # Partial message, the board post itself doesn't need fetching
+                await starboard_channel.get_partial_message(entry['starboard_id']).edit(embed=embed)
+            except discord.NotFound:
+                self.board_embeds.pop(message.id, None)
+                await self.index.remove(message.id)
+                return
+            self._remember_embed(message.id, embed)
+            await self.index.update(message.id, signature=signature)
+
+    # +------------------------------------------------------------+
+    # |             CMD:  starbackfill                             |
+    # +------------------------------------------------------------+
+    @commands.command(no_pm=True)
+    @commands.has_permissions(manage_guild=True)
+    @commands.max_concurrency(1, commands.BucketType.guild)
+    async def starbackfill(self, ctx):
+        """Index every existing starboard post
+
+        Run once after installing this version, so posts older than the
+        last few hundred keep getting star updates instead of being reposted.
+        """
+        channel = await self.ensure_starboard_channel(ctx.guild)
+        progress = await ctx.send(f"⏳ Scanning {channel.mention}...")
+
+        scanned = indexed = 0
+        before = None
+        seen = set()
+        while True:
+            page = [m async for m in channel.history(limit=BACKFILL_PAGE_SIZE, before=before)]
+            if not page:
+                break
+            # History runs newest first, keep the newest post of an original posted more than once
+            entries = []
+            for entry in map(self.parse_starboard_post, page):
+                if entry and entry['_id'] not in seen:
+                    seen.add(entry['_id'])
+                    entries.append(entry)
+            await self.index.bulk_set(entries)
+
+            scanned += len(page)
+            indexed += len(entries)
+            before = page[-1]
+            if scanned % (BACKFILL_PAGE_SIZE * 10) == 0:
+                await progress.edit(content=f"⏳ Scanned {scanned} messages, indexed {indexed} posts...")
+
+        await progress.edit(content=f"✅ Scanned {scanned} messages, indexed {indexed} starboard posts.")
 
     # +------------------------------------------------------------+
     # |             CMD:  check_starboard_perms                    |
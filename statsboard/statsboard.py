@@ -30,6 +30,8 @@ import discord
 import psutil
 from discord.ext import commands, tasks
 
+from .statscore import GuildCounters, MetricHistory, parse_range, sparkline
+
 logger = logging.getLogger("Modmail")
 __version__ = "2.06"
 
@@ -41,15 +43,23 @@ class StatsBoard(commands.Cog):
         self.process = psutil.Process()
         self.stats_message = None
         self.stats_channel = None
-        self.commands_used = defaultdict(int)
-        self.messages_sent = 0
         self.config_file = Path('data/stats_config.json')
+
+        # Time-series history, also carries command/message totals across restarts
+        self.history = MetricHistory(Path('data/stats_history.bin'))
+        self.history.load()
+        self.commands_used = defaultdict(int, self.history.totals.get('commands_used', {}))
+        self.messages_sent = self.history.totals.get('messages_sent', 0)
+        self._last_command_total = sum(self.commands_used.values())
+        self._last_messages_sent = self.messages_sent
+        self._history_samples = 0
         self.config = self.load_config()
         self.initialized = False
         self._initialization_lock = asyncio.Lock()
         self._uptime = datetime.datetime.utcnow()
         self._last_embed_hash = None  # For change detection
         self._guild_id = None  # Store target guild ID
+        self.counters: Optional[GuildCounters] = None  # Event-fed stats for the target guild
 
         # Emoji status indicators
         self.status_emojis = {
@@ -65,6 +75,8 @@ class StatsBoard(commands.Cog):
         self.bot_restarts = 0
         self.last_restart = None
 
+        self.record_history.start()
+
     # region Core Functions
     def _validate_config(self):
         """Validate and fix configuration issues"""
@@ -140,6 +152,12 @@ class StatsBoard(commands.Cog):
         try:
             if hasattr(self, 'update_stats') and self.update_stats.is_running():
                 self.update_stats.cancel()
+            if self.counter_drift_check.is_running():
+                self.counter_drift_check.cancel()
+            if self.record_history.is_running():
+                self.record_history.cancel()
+            self._sync_history_totals()
+            self.history.save()
         except Exception as e:
             logger.error(f"Error stopping stats task: {e}")
 
@@ -196,6 +214,21 @@ class StatsBoard(commands.Cog):
         except discord.HTTPException as e:
             logger.error(f"Failed to create stats channel: {e}")
             return None
+
+    def rebuild_counters(self, guild: discord.Guild) -> GuildCounters:
+        """Rebuild the event-driven counters from a full guild scan"""
+        if not self.counters or self.counters.guild_id != guild.id:
+            self.counters = GuildCounters(guild.id)
+        self.counters.rebuild(guild)
+        if not self.counter_drift_check.is_running():
+            self.counter_drift_check.start()
+        return self.counters
+
+    def _counters_for(self, guild: Optional[discord.Guild]) -> Optional[GuildCounters]:
+        """Return the counters if they track this guild, else None"""
+        if guild and self.counters and self.counters.guild_id == guild.id:
+            return self.counters
+        return None
     # endregion
 
     # region Event Listeners
@@ -223,6 +256,9 @@ class StatsBoard(commands.Cog):
                     logger.warning("No target guild found for auto-start")
                     return
 
+                # Single full scan per session, listeners keep it current afterwards
+                self.rebuild_counters(guild)
+
                 # Get the stats channel
                 self.stats_channel = await self.get_stats_channel()
                 if not self.stats_channel:
@@ -265,6 +301,70 @@ class StatsBoard(commands.Cog):
         """Track message statistics"""
         if not message.author.bot:
             self.messages_sent += 1
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        """Count new members"""
+        counters = self._counters_for(member.guild)
+        if counters:
+            counters.member_join(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        """Uncount departing members"""
+        counters = self._counters_for(member.guild)
+        if counters:
+            counters.member_remove(member)
+
+    @commands.Cog.listener()
+    async def on_presence_update(self, before, after):
+        """Move members between status buckets"""
+        counters = self._counters_for(after.guild)
+        if counters:
+            counters.presence_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member, before, after):
+        """Track voice channel occupancy"""
+        counters = self._counters_for(member.guild)
+        if counters:
+            counters.voice_state_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        counters = self._counters_for(channel.guild)
+        if counters:
+            counters.channel_create(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        counters = self._counters_for(channel.guild)
+        if counters:
+            counters.channel_delete(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        counters = self._counters_for(after.guild)
+        if counters:
+            counters.channel_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role):
+        counters = self._counters_for(role.guild)
+        if counters:
+            counters.role_changed(role.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        counters = self._counters_for(role.guild)
+        if counters:
+            counters.role_changed(role.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before, after):
+        counters = self._counters_for(after.guild)
+        if counters and (before.hoist != after.hoist or before.position != after.position or before.name != after.name):
+            counters.role_changed(after.guild)
     # endregion
 
     # region Stats Generation
@@ -286,6 +386,10 @@ class StatsBoard(commands.Cog):
 
     def get_voice_stats(self, guild: discord.Guild) -> Dict[str, int]:
         """Get comprehensive voice channel statistics"""
+        counters = self._counters_for(guild)
+        if counters:
+            return counters.voice_stats()
+
         voice_channels = [c for c in guild.channels if isinstance(c, discord.VoiceChannel)]
         active_channels = [c for c in voice_channels if len(c.members) > 0]
         total_voice_members = sum(len(c.members) for c in voice_channels)
@@ -299,9 +403,12 @@ class StatsBoard(commands.Cog):
 
     def get_role_stats(self, guild: discord.Guild) -> Dict[str, Any]:
         """Get role statistics with safety checks"""
-        roles = guild.roles
-        bot_member = guild.get_member(self.bot.user.id)
+        bot_member = guild.me
+        counters = self._counters_for(guild)
+        if counters:
+            return {**counters.role_stats(), 'bot_role': bot_member.top_role.name if bot_member else 'None'}
 
+        roles = guild.roles
         return {
             'total_roles': len(roles),
             'highest_role': roles[-1].name if roles else 'None',
@@ -311,6 +418,10 @@ class StatsBoard(commands.Cog):
 
     def get_channel_stats(self, guild: discord.Guild) -> Dict[str, int]:
         """Get comprehensive channel statistics"""
+        counters = self._counters_for(guild)
+        if counters:
+            return counters.channel_stats()
+
         channels_by_type = defaultdict(int)
         for channel in guild.channels:
             channels_by_type[type(channel).__name__] += 1
@@ -328,6 +439,10 @@ class StatsBoard(commands.Cog):
 
     def get_member_stats(self, guild: discord.Guild) -> Dict[str, Any]:
         """Get detailed member statistics with online status"""
+        counters = self._counters_for(guild)
+        if counters:
+            return counters.member_stats()
+
         members = guild.members
         if not members:  # Fallback for large guilds
             return {
@@ -651,6 +766,78 @@ class StatsBoard(commands.Cog):
         """Wait for bot to be ready before starting updates"""
         await self.bot.wait_until_ready()
 
+    @tasks.loop(minutes=15)
+    async def counter_drift_check(self):
+        """Rescan the guild only when the counters disagree with Discord's totals or are stale"""
+        guild = self.target_guild
+        if not guild:
+            return
+
+        try:
+            counters = self._counters_for(guild)
+            if not counters:
+                self.rebuild_counters(guild)
+                return
+
+            age = datetime.datetime.utcnow() - counters.last_rebuild
+            if counters.drifted(guild):
+                logger.info("StatsBoard counters drifted from guild totals, rebuilding")
+                counters.rebuild(guild)
+            elif age > datetime.timedelta(hours=6):  # Presence changes can't be checked cheaply
+                counters.rebuild(guild)
+        except Exception as e:
+            logger.error(f"Counter drift check failed: {e}")
+
+    def _sync_history_totals(self):
+        """Copy the running command/message totals into the persisted history header"""
+        self.history.totals['commands_used'] = dict(self.commands_used)
+        self.history.totals['messages_sent'] = self.messages_sent
+
+    @tasks.loop(seconds=MetricHistory.TIERS[0][1])
+    async def record_history(self):
+        """Sample metrics into the history rings, saving to disk every 5 minutes"""
+        try:
+            # Only sample guild metrics from live counters; never fall back to a member scan here
+            counters = self._counters_for(self.target_guild)
+            member_stats = self.get_member_stats(self.target_guild) if counters else None
+            voice_stats = self.get_voice_stats(self.target_guild) if counters else None
+            system_stats = self.get_system_stats()
+
+            command_total = system_stats['total_commands']
+            sample = {
+                'cpu': system_stats['cpu_percent'],
+                'memory': system_stats['memory_mb'],
+                'commands': command_total - self._last_command_total,
+                'messages': self.messages_sent - self._last_messages_sent,
+            }
+            self._last_command_total = command_total
+            self._last_messages_sent = self.messages_sent
+
+            if member_stats:
+                sample['members'] = member_stats['total']
+                sample.update(member_stats['status'])
+            if voice_stats:
+                sample['voice'] = voice_stats['voice_members']
+
+            self.history.record(sample)
+            self._history_samples += 1
+
+            if self._history_samples % 10 == 0 and self.history.dirty:
+                self._sync_history_totals()
+                await asyncio.to_thread(self.history.save)
+        except Exception as e:
+            logger.error(f"Failed to record stats history: {e}")
+
+    @record_history.before_loop
+    async def before_record_history(self):
+        """Wait for bot to be ready before sampling"""
+        await self.bot.wait_until_ready()
+
+    @counter_drift_check.before_loop
+    async def before_counter_drift_check(self):
+        """Wait for bot to be ready before checking counters"""
+        await self.bot.wait_until_ready()
+
     def _restart_task_with_interval(self):
         """Restart the task with new interval"""
         if self.update_stats.is_running():
@@ -680,7 +867,8 @@ class StatsBoard(commands.Cog):
                     "`toggle` - Enable/disable stats updates\n"
                     "`refresh` - Manually update stats\n"
                     "`config` - View current configuration\n"
-                    "`interval <seconds>` - Set update interval"
+                    "`interval <seconds>` - Set update interval\n"
+                    "`history <metric> <range>` - Show metric history"
                 ),
                 inline=False
             )
@@ -710,6 +898,9 @@ class StatsBoard(commands.Cog):
                 if not self.stats_channel:
                     return await ctx.send("❌ Failed to create stats channel. Check bot permissions.")
 
+                if not self._counters_for(self.target_guild):
+                    self.rebuild_counters(self.target_guild)
+
                 # Create initial message
                 embed = self.create_stats_embed()
                 if not embed:
@@ -766,6 +957,9 @@ class StatsBoard(commands.Cog):
             if not self.stats_channel:
                 return await ctx.send("❌ Failed to get/create stats channel. Check bot permissions.")
 
+            if not self._counters_for(self.target_guild):
+                self.rebuild_counters(self.target_guild)
+
             # Try to get existing message first
             if self.config['message_id']:
                 try:
@@ -879,7 +1073,8 @@ class StatsBoard(commands.Cog):
             value=(
                 f"**Commands Tracked:** {len(self.commands_used)}\n"
                 f"**Total Commands:** {sum(self.commands_used.values())}\n"
-                f"**Uptime:** {self.format_uptime()}"
+                f"**Uptime:** {self.format_uptime()}\n"
+                f"**Counters Rebuilt:** {f'<t:{int(self.counters.last_rebuild.replace(tzinfo=datetime.timezone.utc).timestamp())}:R>' if self.counters and self.counters.last_rebuild else 'Never'}"
             ),
             inline=False
         )
@@ -908,6 +1103,62 @@ class StatsBoard(commands.Cog):
         )
         await ctx.send(embed=embed)
 
+    @statsboard_group.command(name="history", aliases=['graph'])
+    @commands.has_permissions(manage_guild=True)
+    async def show_history(self, ctx, metric: str = None, time_range: str = '1h'):
+        """Show a metric's history over a range like 30m, 6h, 7d or 1y"""
+        metrics = ', '.join(f'`{m}`' for m in MetricHistory.METRICS)
+        if not metric or metric.lower() not in MetricHistory.METRICS:
+            return await ctx.send(f"❌ Choose a metric: {metrics}")
+
+        try:
+            seconds = parse_range(time_range)
+        except ValueError as e:
+            return await ctx.send(f"❌ {e}")
+
+        metric = metric.lower()
+        ring, points = self.history.query(metric, seconds)
+        if not points:
+            return await ctx.send(f"📭 No `{metric}` history recorded for the last `{time_range}` yet.")
+
+        averages = [avg for _, avg, _, _ in points]
+        if metric in MetricHistory.SUMMED:
+            # Bucket totals, so min/max must be over totals too, not over single samples
+            low, high = min(averages), max(averages)
+            total = f"**Total:** {sum(averages):,.0f}\n"
+        else:
+            low = min(p[2] for p in points)
+            high = max(p[3] for p in points)
+            total = ""
+        mean = sum(averages) / len(averages)
+        resolution = {30: '30s', 60: '1 minute', 3600: '1 hour'}.get(ring.resolution, f'{ring.resolution}s')
+
+        embed = discord.Embed(
+            title=f"📈 {metric.title()} • last {time_range}",
+            description=f"```\n{sparkline(averages)}\n```",
+            color=discord.Color.blurple()
+        )
+        embed.add_field(
+            name="Summary",
+            value=(
+                f"{total}"
+                f"**Latest:** {averages[-1]:,.1f}\n"
+                f"**Average:** {mean:,.1f}\n"
+                f"**Min / Max:** {low:,.1f} / {high:,.1f}"
+            ),
+            inline=True
+        )
+        embed.add_field(
+            name="Coverage",
+            value=(
+                f"**Buckets:** {len(points):,}\n"
+                f"**Resolution:** {resolution}\n"
+                f"**From:** <t:{points[0][0]}:R>"
+            ),
+            inline=True
+        )
+        await ctx.send(embed=embed)
+
     @statsboard_group.command(name="reset")
     @commands.has_permissions(manage_guild=True)
     async def reset_stats(self, ctx):
@@ -915,8 +1166,11 @@ class StatsBoard(commands.Cog):
         # Stop task
         if self.update_stats.is_running():
             self.update_stats.cancel()
+        if self.counter_drift_check.is_running():
+            self.counter_drift_check.cancel()
 
         # Reset variables
+        self.counters = None
         self.stats_message = None
         self.stats_channel = None
         self.initialized = False
@@ -0,0 +1,412 @@
+# statscore.py
+import datetime
+import json
+import logging
+import math
+import os
+import time
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger("Modmail")
+
+
+class GuildCounters:
+    """Event-driven counters for a single guild
+
+    Built once from a full scan (``rebuild``) and then kept current by the
+    cog's gateway listeners, so reading the stats never walks members or channels.
+    """
+
+    STATUSES = ('online', 'idle', 'dnd', 'offline')
+
+    def __init__(self, guild_id: int):
+        self.guild_id = guild_id
+        self.last_rebuild: Optional[datetime.datetime] = None
+        self._reset()
+
+    def _reset(self):
+        # Members
+        self.members_cached = False
+        self.total = 0
+        self.bots = 0
+        self.status = dict.fromkeys(self.STATUSES, 0)
+
+        # Channels
+        self.channel_count = 0
+        self.channel_types = defaultdict(int)
+        self.text_channels = 0
+        self.nsfw_channels = 0
+        self.voice_occupancy: Dict[int, int] = {}  # voice channel id -> connected members
+        self.voice_members = 0
+
+        # Roles
+        self.total_roles = 0
+        self.hoisted_roles = 0
+        self.highest_role = 'None'
+
+    @staticmethod
+    def _status_key(member: discord.Member) -> str:
+        status = str(member.status)
+        return 'offline' if status == 'invisible' or status not in GuildCounters.STATUSES else status
+
+    # region Full scan
+    def rebuild(self, guild: discord.Guild):
+        """Recount everything from the guild cache (O(members + channels))"""
+        started = datetime.datetime.utcnow()
+        self._reset()
+
+        members = guild.members
+        if members:
+            self.members_cached = True
+            for member in members:
+                self.total += 1
+                if member.bot:
+                    self.bots += 1
+                self.status[self._status_key(member)] += 1
+        else:  # Fallback for large guilds without the members intent
+            self.total = guild.member_count or 0
+
+        for channel in guild.channels:
+            self._add_channel(channel)
+            if isinstance(channel, discord.VoiceChannel) and channel.members:
+                self.voice_occupancy[channel.id] = len(channel.members)
+                self.voice_members += len(channel.members)
+
+        self._recount_roles(guild)
+        self.last_rebuild = datetime.datetime.utcnow()
+        elapsed = (self.last_rebuild - started).total_seconds() * 1000
+        logger.info(f"StatsBoard counters rebuilt for guild {guild.id} in {elapsed:.1f}ms")
+
+    def drifted(self, guild: discord.Guild) -> bool:
+        """Cheap O(1) comparison against totals Discord already maintains"""
+        if self.members_cached and guild.member_count is not None and guild.member_count != self.total:
+            return True
+        if len(guild.channels) != self.channel_count:
+            return True
+        if len(guild.roles) != self.total_roles:
+            return True
+        return False
+    # endregion
+
+    # region Member events
+    def member_join(self, member: discord.Member):
+        self.total += 1
+        if not self.members_cached:
+            return
+        if member.bot:
+            self.bots += 1
+        self.status[self._status_key(member)] += 1
+
+    def member_remove(self, member: discord.Member):
+        self.total = max(0, self.total - 1)
+        if not self.members_cached:
+            return
+        if member.bot:
+            self.bots = max(0, self.bots - 1)
+        key = self._status_key(member)
+        self.status[key] = max(0, self.status[key] - 1)
+
+    def presence_update(self, before: discord.Member, after: discord.Member):
+        if not self.members_cached:
+            return
+        old, new = self._status_key(before), self._status_key(after)
+        if old != new:
+            self.status[old] = max(0, self.status[old] - 1)
+            self.status[new] += 1
+
+    def voice_state_update(self, before: discord.VoiceState, after: discord.VoiceState):
+        if before.channel == after.channel:
+            return
+        if isinstance(before.channel, discord.VoiceChannel) and before.channel.id in self.voice_occupancy:
+            self.voice_members = max(0, self.voice_members - 1)
+            remaining = self.voice_occupancy.get(before.channel.id, 0) - 1
+            if remaining > 0:
+                self.voice_occupancy[before.channel.id] = remaining
+            else:
+                self.voice_occupancy.pop(before.channel.id, None)
+        if isinstance(after.channel, discord.VoiceChannel):
+            self.voice_occupancy[after.channel.id] = self.voice_occupancy.get(after.channel.id, 0) + 1
+            self.voice_members += 1
+    # endregion
+
+    # region Channel events
+    def _add_channel(self, channel: discord.abc.GuildChannel, delta: int = 1):
+        self.channel_count += delta
+        self.channel_types[type(channel).__name__] += delta
+        if isinstance(channel, discord.TextChannel):
+            self.text_channels += delta
+            if getattr(channel, 'nsfw', False):
+                self.nsfw_channels += delta
+
+    def channel_create(self, channel: discord.abc.GuildChannel):
+        self._add_channel(channel)
+
+    def channel_delete(self, channel: discord.abc.GuildChannel):
+        self._add_channel(channel, -1)
+        self.voice_members = max(0, self.voice_members - self.voice_occupancy.pop(channel.id, 0))
+
+    def channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        if type(before) is not type(after) or getattr(before, 'nsfw', False) != getattr(after, 'nsfw', False):
+            self._add_channel(before, -1)
+            self._add_channel(after)
+    # endregion
+
+    # region Role events
+    def _recount_roles(self, guild: discord.Guild):
+        # Role events are rare and role lists are small, so a recount is fine here
+        roles = guild.roles
+        self.total_roles = len(roles)
+        self.hoisted_roles = sum(1 for r in roles if r.hoist)
+        self.highest_role = roles[-1].name if roles else 'None'
+
+    def role_changed(self, guild: discord.Guild):
+        self._recount_roles(guild)
+    # endregion
+
+    # region Snapshots
+    def member_stats(self) -> Dict[str, Any]:
+        if not self.members_cached:
+            return {
+                'total': self.total,
+                'bots': 0,
+                'humans': self.total,
+                'status': dict.fromkeys(self.STATUSES, 0)
+            }
+        return {
+            'total': self.total,
+            'bots': self.bots,
+            'humans': self.total - self.bots,
+            'status': dict(self.status)
+        }
+
+    def voice_stats(self) -> Dict[str, int]:
+        return {
+            'total_voice': self.channel_types.get('VoiceChannel', 0),
+            'active_voice': len(self.voice_occupancy),
+            'voice_members': self.voice_members,
+            'stage_channels': self.channel_types.get('StageChannel', 0)
+        }
+
+    def channel_stats(self) -> Dict[str, int]:
+        return {
+            'total_text': self.text_channels,
+            'total_voice': self.channel_types.get('VoiceChannel', 0),
+            'total_stage': self.channel_types.get('StageChannel', 0),
+            'total_forum': self.channel_types.get('ForumChannel', 0),
+            'total_categories': self.channel_types.get('CategoryChannel', 0),
+            'nsfw_channels': self.nsfw_channels
+        }
+
+    def role_stats(self) -> Dict[str, Any]:
+        return {
+            'total_roles': self.total_roles,
+            'highest_role': self.highest_role,
+            'hoisted_roles': self.hoisted_roles
+        }
+    # endregion
+
+
+class RollupRing:
+    """Fixed-size ring of time buckets with running sum/count/min/max per metric
+
+    Slot ``i`` holds bucket ``start // resolution`` where ``start % capacity == i``,
+    so inserting is O(1) and old buckets are overwritten in place. Metrics
+    missing from a sample are skipped rather than recorded as 0, so each
+    metric keeps its own sample count. Metrics in ``summed`` are per-sample
+    deltas and report the bucket total instead of the bucket average.
+    """
+
+    def __init__(self, resolution: int, capacity: int, metrics: Tuple[str, ...], summed: Tuple[str, ...] = ()):
+        self.resolution = resolution
+        self.capacity = capacity
+        self.metrics = metrics
+        self.summed = frozenset(summed)
+        self.starts = array('q', [0]) * capacity
+        self.counts = array('I', [0]) * capacity
+        self.metric_counts = {m: array('I', [0]) * capacity for m in metrics}
+        self.sums = {m: array('d', [0.0]) * capacity for m in metrics}
+        self.mins = {m: array('f', [0.0]) * capacity for m in metrics}
+        self.maxs = {m: array('f', [0.0]) * capacity for m in metrics}
+
+    @property
+    def span(self) -> int:
+        return self.resolution * self.capacity
+
+    def add(self, ts: int, values: Dict[str, float]):
+        bucket = ts // self.resolution
+        slot = bucket % self.capacity
+        start = bucket * self.resolution
+
+        if self.starts[slot] != start:
+            # Slot belongs to an older bucket, recycle it
+            self.starts[slot] = start
+            self.counts[slot] = 0
+            for m in self.metrics:
+                self.metric_counts[m][slot] = 0
+                self.sums[m][slot] = 0.0
+
+        self.counts[slot] += 1
+        for m in self.metrics:
+            if m not in values:
+                continue
+            value = float(values[m])
+            first = self.metric_counts[m][slot] == 0
+            self.metric_counts[m][slot] += 1
+            self.sums[m][slot] += value
+            if first or value < self.mins[m][slot]:
+                self.mins[m][slot] = value
+            if first or value > self.maxs[m][slot]:
+                self.maxs[m][slot] = value
+
+    def query(self, metric: str, since: int, until: int) -> List[Tuple[int, float, float, float]]:
+        """Return (start, value, min, max) for every filled bucket in [since, until], oldest first
+
+        ``value`` is the bucket average, or the bucket total for summed metrics.
+        """
+        points = []
+        summed = metric in self.summed
+        first_bucket = max(since // self.resolution, until // self.resolution - self.capacity + 1)
+        for bucket in range(first_bucket, until // self.resolution + 1):
+            slot = bucket % self.capacity
+            start = bucket * self.resolution
+            count = self.metric_counts[metric][slot]
+            if self.starts[slot] != start or not count:
+                continue
+            value = self.sums[metric][slot] if summed else self.sums[metric][slot] / count
+            points.append((start, value, self.mins[metric][slot], self.maxs[metric][slot]))
+        return points
+
+    def arrays(self) -> List[array]:
+        """All backing arrays in a stable order, used for (de)serialisation"""
+        out = [self.starts, self.counts]
+        for m in self.metrics:
+            out.extend((self.metric_counts[m], self.sums[m], self.mins[m], self.maxs[m]))
+        return out
+
+
+class MetricHistory:
+    """Downsampled time-series store for StatsBoard metrics
+
+    Every sample is folded into three rings at once: raw (30s buckets for an
+    hour), 1-minute rollups for a day and hourly rollups for a year. Queries
+    read the coarsest ring that still covers the requested range, so raw data
+    is never rescanned. Persisted as a JSON header followed by the raw arrays.
+    """
+
+    METRICS = ('members', 'online', 'idle', 'dnd', 'offline', 'voice', 'cpu', 'memory', 'commands', 'messages')
+    SUMMED = ('commands', 'messages')  # Deltas per sample, rolled up as totals
+    TIERS = (
+        ('raw', 30, 120),        # 30s samples for 1 hour
+        ('minute', 60, 1440),    # 1 minute rollups for 1 day
+        ('hour', 3600, 8760),    # 1 hour rollups for 1 year
+    )
+    FORMAT_VERSION = 2  # 2: per-metric sample counts
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rings = {name: RollupRing(res, cap, self.METRICS, self.SUMMED) for name, res, cap in self.TIERS}
+        self.totals: Dict[str, Any] = {'commands_used': {}, 'messages_sent': 0}
+        self.dirty = False
+
+    def record(self, values: Dict[str, float], ts: Optional[int] = None):
+        """Fold one sample into every tier"""
+        ts = int(ts if ts is not None else time.time())
+        for ring in self.rings.values():
+            ring.add(ts, values)
+        self.dirty = True
+
+    def ring_for(self, seconds: int) -> RollupRing:
+        """Pick the finest ring whose span covers the range"""
+        for name, _, _ in self.TIERS:
+            ring = self.rings[name]
+            if seconds <= ring.span:
+                return ring
+        return self.rings[self.TIERS[-1][0]]
+
+    def query(self, metric: str, seconds: int, now: Optional[int] = None) -> Tuple[RollupRing, List[Tuple[int, float, float, float]]]:
+        if metric not in self.METRICS:
+            raise KeyError(metric)
+        now = int(now if now is not None else time.time())
+        ring = self.ring_for(seconds)
+        return ring, ring.query(metric, now - seconds, now)
+
+    # region Persistence
+    def save(self):
+        """Write header + arrays atomically"""
+        header = {
+            'version': self.FORMAT_VERSION,
+            'metrics': list(self.METRICS),
+            'tiers': [[name, res, cap] for name, res, cap in self.TIERS],
+            'totals': self.totals,
+        }
+        tmp = self.path.with_suffix('.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                raw = json.dumps(header).encode()
+                f.write(len(raw).to_bytes(4, 'little'))
+                f.write(raw)
+                for name, _, _ in self.TIERS:
+                    for arr in self.rings[name].arrays():
+                        arr.tofile(f)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            logger.error(f"Failed to save stats history: {e}")
+
+    def load(self):
+        """Restore from disk; a missing or incompatible file starts a fresh history"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                size = int.from_bytes(f.read(4), 'little')
+                header = json.loads(f.read(size))
+                layout = [[name, res, cap] for name, res, cap in self.TIERS]
+                if (header.get('version') != self.FORMAT_VERSION or header.get('metrics') != list(self.METRICS)
+                        or header.get('tiers') != layout):
+                    logger.warning("Stats history layout changed, starting fresh")
+                    return
+                for name, _, cap in self.TIERS:
+                    for arr in self.rings[name].arrays():
+                        del arr[:]
+                        arr.fromfile(f, cap)
+                self.totals.update(header.get('totals', {}))
+        except (OSError, EOFError, ValueError) as e:
+            logger.error(f"Failed to load stats history: {e}. Starting fresh.")
+            self.rings = {name: RollupRing(res, cap, self.METRICS, self.SUMMED) for name, res, cap in self.TIERS}
+    # endregion
+
+
+SPARK_CHARS = '▁▂▃▄▅▆▇█'
+
+
+def sparkline(values: List[float], width: int = 40) -> str:
+    """Render values as a unicode sparkline, averaging down to ``width`` columns"""
+    if not values:
+        return ''
+    if len(values) > width:
+        step = len(values) / width
+        values = [
+            sum(chunk) / len(chunk)
+            for chunk in (values[int(i * step):max(int((i + 1) * step), int(i * step) + 1)] for i in range(width))
+        ]
+    low, high = min(values), max(values)
+    if math.isclose(low, high):
+        return SPARK_CHARS[0] * len(values)
+    scale = (len(SPARK_CHARS) - 1) / (high - low)
+    return ''.join(SPARK_CHARS[int((v - low) * scale)] for v in values)
+
+
+def parse_range(text: str) -> int:
+    """Parse ranges like ``30m``, ``6h``, ``7d``, ``4w`` or ``1y`` into seconds"""
+    units = {'m': 60, 'h': 3600, 'd': 86400, 'w': 604800, 'y': 31536000}
+    text = text.strip().lower()
+    if not text or text[-1] not in units or not text[:-1].isdigit() or int(text[:-1]) <= 0:
+        raise ValueError(f"Invalid range `{text}`, use e.g. 30m, 6h, 7d, 4w or 1y")
+    return int(text[:-1]) * units[text[-1]]
@@ -18,16 +18,112 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import discord, traceback, asyncio
+import discord, traceback, asyncio, time
 
+from bisect import bisect_left
 from datetime import datetime
-from pytz import timezone
+from pytz import timezone, all_timezones, country_names, country_timezones
 from discord.ext import commands
 
 dev_list = [
     ('WebKide', 323578534763298816)
 ]
 
+# Names, abbreviations, codes and flags people actually type; these win over pytz's own country data
+ALIASES = {
+    'australia': 'Australia/Sydney', 'brazil': 'America/Sao_Paulo', 'brasil': 'America/Sao_Paulo',
+    'china': 'Asia/Shanghai', 'germany': 'Europe/Berlin', 'india': 'Asia/Calcutta', 'ist': 'Asia/Calcutta',
+    'sri lanka': 'Asia/Colombo', 'ireland': 'Europe/Dublin', 'israel': 'Asia/Jerusalem',
+    'gmt': 'Europe/London', 'england': 'Europe/London', 'london': 'Europe/London', 'uk': 'Europe/London',
+    'nepal': 'Asia/Katmandu', 'new zealand': 'Pacific/Auckland', 'panama': 'America/Panama',
+    'est': 'America/New_York', 'hst': 'Pacific/Honolulu', 'pst': 'America/Los_Angeles',
+    'mst': 'America/Denver', 'cst': 'America/Chicago', 'peru': 'America/Lima', 'philippines': 'Asia/Manila',
+    'argentina': 'America/Argentina/Buenos_Aires', 'bolivia': 'America/La_Paz', 'bot': 'America/La_Paz',
+    'mexico': 'America/Mexico_City', 'italy': 'Europe/Rome',
+    'cr': 'America/Costa_Rica', 'fr': 'Europe/Paris', 'gb': 'Europe/London', 'de': 'Europe/Berlin',
+    'es': 'Europe/Madrid', 'in': 'Asia/Calcutta', 'bo': 'America/La_Paz',
+    '🇦🇺': 'Australia/Sydney', '🇧🇷': 'America/Sao_Paulo', '🇦🇷': 'America/Argentina/Buenos_Aires',
+    '🇲🇽': 'America/Mexico_City', '🇮🇳': 'Asia/Calcutta', '🇧🇴': 'America/La_Paz',
+}
+
+
+def _normalize(text):
+    return ' '.join(text.replace(':', ' ').replace('_', ' ').replace('/', ' ').casefold().split())
+
+
+def _flag(code):
+    return ''.join(chr(0x1F1E6 + ord(c) - ord('A')) for c in code.upper())
+
+
+class TimezoneIndex:
+    """Exact dict plus a sorted prefix list over aliases, countries, flags, codes and zone names,
+    built once so a lookup is a dict hit or a bisect instead of a chain of str.replace calls"""
+    def __init__(self, aliases=None):
+        started = time.perf_counter()
+        self.exact = {}
+        self.terms = []
+        for key, zone in (aliases or {}).items():
+            self._add(key, zone)
+        for zone in all_timezones:
+            self._add(zone, zone)
+        for code, zones in country_timezones.items():
+            for key in (country_names.get(code, code), _flag(code), f'flag {code}', code):
+                self._add(key, zones[0])
+        for zone in all_timezones:
+            self._add(zone.rsplit('/', 1)[-1], zone)
+        self.terms.sort()
+        self.build_ms = (time.perf_counter() - started) * 1000
+
+    def _add(self, key, zone):
+        norm = _normalize(key)
+        if not norm:
+            return
+        self.exact.setdefault(norm, zone)
+        # One term per word start, so "york" finds America/New_York
+        offset = 0
+        for position, word in enumerate(norm.split(' ')):
+            self.terms.append((norm[offset:], position > 0, len(norm), zone))
+            offset += len(word) + 1
+
+    def search(self, query, limit=10):
+        q = _normalize(query)
+        if not q:
+            return []
+        found = [self.exact[q]] if q in self.exact else []
+        start = bisect_left(self.terms, (q,))
+        matches = []
+        for term, later_word, length, zone in self.terms[start:start + 200]:
+            if not term.startswith(q):
+                break
+            matches.append((later_word, length, zone))
+        for _, _, zone in sorted(matches):
+            if zone not in found:
+                found.append(zone)
+        return found[:limit]
+
+    def resolve(self, query):
+        """Zone for an exact key, or for a prefix of 3+ characters that names only one zone"""
+        q = _normalize(query)
+        if q in self.exact:
+            return self.exact[q]
+        found = self.search(query, limit=2)
+        return found[0] if len(found) == 1 and len(q) >= 3 else None
+
+    def benchmark(self):
+        """Time a search for every zone and zone-name prefix against a linear scan"""
+        queries = list(all_timezones) + [z.rsplit('/', 1)[-1][:4] for z in all_timezones]
+        started = time.perf_counter()
+        found = sum(1 for z in all_timezones if z in self.search(z, limit=5))
+        for q in queries:
+            self.search(q)
+        index_us = (time.perf_counter() - started) / (len(queries) + len(all_timezones)) * 1e6
+        started = time.perf_counter()
+        for q in queries:
+            lowered = q.lower()
+            [z for z in all_timezones if lowered in z.lower()]
+        scan_us = (time.perf_counter() - started) / len(queries) * 1e6
+        return index_us, scan_us, found / len(all_timezones)
+
 
 class TimeZone(commands.Cog):
     """(∩｀-´)⊃━☆ﾟ.*･｡ﾟ Timezone command
@@ -35,6 +131,7 @@ class TimeZone(commands.Cog):
     """
     def __init__(self, bot):
         self.bot = bot
+        self.index = TimezoneIndex(ALIASES)
 
     @commands.command(description='Command to get time across the world', aliases=['timezone'])
     async def tz(self, ctx, *, flag_country: str = None):
@@ -47,10 +144,9 @@ class TimeZone(commands.Cog):
         Mexico, Nepal, New Zealand, Panama,
         Peru, Philippines, Sri Lanka, BOT,
         GMT, PST, MST, CST, EST, HST, IST
+
+        Any country, city or IANA zone name also works, e.g. Tokyo or Europe/Oslo
         """
-        countries = ['argentina', 'australia', 'bolivia', 'brazil', 'china', 'india', 'ireland', 'israel', 'italy',
-                     'mexico', 'nepal', 'new zealand', 'panama', 'peru', 'philippines', 'sri lanka',
-                     'bot', 'ist', 'gmt', 'england', 'london', 'est', 'hst', 'pst', 'mst', 'cst', 'germany']
         m = ctx.message
         msg = f'**Usage:** `{ctx.prefix}{ctx.invoked_with} [:flag_gb: / country]`\n\n' \
               f'**Available countries:** Argentina, Australia, Brasil, Bolivia, China, India, Ireland, Israel, ' \
@@ -59,147 +155,45 @@ class TimeZone(commands.Cog):
         if not flag_country:
             return await ctx.send(msg, delete_after=23)
 
-        if flag_country:
-            if any(x in m.content.lower() for x in countries):
-                try:
-                    flag_country = flag_country.lower()
-                    place = flag_country.replace('australia', 'Australia/Sydney') \
-                                        .replace('brazil', 'America/Sao_Paulo') \
-                                        .replace('china', 'Asia/Shanghai') \
-                                        .replace('germany', 'Europe/Berlin') \
-                                        .replace('india', 'Asia/Calcutta') \
-                                        .replace('ist', 'Asia/Calcutta') \
-                                        .replace('sri lanka', 'Asia/Colombo') \
-                                        .replace('ireland', 'Europe/Dublin') \
-                                        .replace('israel', 'Asia/Jerusalem') \
-                                        .replace('gmt', 'Europe/London') \
-                                        .replace('england', 'Europe/London') \
-                                        .replace('london', 'Europe/London') \
-                                        .replace('nepal', 'Asia/Katmandu') \
-                                        .replace('new zealand', 'Pacific/Auckland') \
-                                        .replace('panama', 'America/Panama') \
-                                        .replace('est', 'America/New_York') \
-                                        .replace('hst', 'Pacific/Honolulu') \
-                                        .replace('pst', 'America/Los_Angeles') \
-                                        .replace('mst', 'America/Denver') \
-                                        .replace('cst', 'America/Chicago') \
-                                        .replace('peru', 'America/Lima') \
-                                        .replace('philippines', 'Asia/Manila') \
-                                        .replace('argentina', 'America/Argentina/Buenos_Aires') \
-                                        .replace('bolivia', 'America/La_Paz') \
-                                        .replace('bot', 'America/La_Paz')
-                    k = place.split()
-                    zone_c = str(k).strip('[').strip(']').strip('\'').strip(' ')
-                    title_c = zone_c.replace('/', ', ').replace('_', ' ')
-                    z_1 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                    try:
-                        flag_title = flag_country.title()
-                        e_1 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_1, color=0x7289da)
-                        s = await ctx.send(embed=e_1)
-                        await asyncio.sleep(1)
-                        z_2 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                        e_2 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_2, color=0xed791d)
-                        await s.edit(embed=e_2)
-                        await asyncio.sleep(2)
-                        z_3 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                        e_3 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_3, color=0x7289da)
-                        await s.edit(embed=e_3)
-                        await asyncio.sleep(3)
-                        z_4 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                        e_4 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_4, color=0xed791d)
-                        await s.edit(embed=e_4)
-                        await asyncio.sleep(5)
-                        z_5 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                        e_5 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_5, color=0x7289da)
-                        return await s.edit(embed=e_5)
-
-                    except discord.Forbidden:  # FORBIDDEN (status code: 403): Missing Permissions
-                        return await ctx.send(f'{title_c}\n{z_1}')
-
-                except Exception as e:
-                    if ctx.author.id in (dev[1] for dev in dev_list):
-                        if m.guild.id == 540072370527010841:
-                            tb = traceback.format_exc()
-                            return await ctx.send(f'```py\n[Error: 001] {e}\n!------------>\n{tb}```')
-                        else:
-                            pass
-                    else:
-                        pass
-
-            else:
-                try:
-                    m_fl = m.content
-                    place = m_fl.replace('🇦🇺', 'Australia/Sydney') \
-                                .replace('🇧🇷', 'America/Sao_Paulo') \
-                                .replace('🇨🇳', 'Asia/Shanghai') \
-                                .replace('🇨🇷', 'America/Costa_Rica') \
-                                .replace('cr', 'America/Costa_Rica') \
-                                .replace('🇩🇪', 'Europe/Berlin') \
-                                .replace('🇪🇸', 'Europe/Madrid') \
-                                .replace('🇫🇷', 'Europe/Paris') \
-                                .replace('fr', 'Europe/Paris') \
-                                .replace('🇬🇧', 'Europe/London') \
-                                .replace('gb', 'Europe/London') \
-                                .replace('uk', 'Europe/London') \
-                                .replace('🇮🇳', 'Asia/Calcutta') \
-                                .replace('🇮🇹', 'Europe/Rome') \
-                                .replace('de', 'Europe/Berlin') \
-                                .replace('🇱🇰', 'Asia/Colombo') \
-                                .replace('🇮🇪', 'Europe/Dublin') \
-                                .replace('🇫🇮', 'Europe/Helsinki') \
-                                .replace('🇮🇱', 'Asia/Jerusalem') \
-                                .replace('🇲🇽', 'America/Mexico_City') \
-                                .replace('🇳🇵', 'Asia/Katmandu') \
-                                .replace('🇳🇿', 'Pacific/Auckland') \
-                                .replace('🇵🇦', 'America/Panama') \
-                                .replace('🇵🇪', 'America/Lima') \
-                                .replace('🇵🇭', 'Asia/Manila') \
-                                .replace('🇵🇱', 'Europe/Warsaw') \
-                                .replace('🇷🇴', 'Europe/Bucharest') \
-                                .replace('🇸🇬', 'Asia/Singapore') \
-                                .replace('🇿🇦', 'Africa/Johannesburg') \
-                                .replace('🇦🇷', 'America/Argentina/Buenos_Aires') \
-                                .replace('es', 'Europe/Madrid') \
-                                .replace('in', 'Asia/Calcutta') \
-                                .replace('bo', 'America/La_Paz') \
-                                .replace('🇧🇴', 'America/La_Paz')
-                    k = place.split('tz ')
-                    zone_c = str(k[1:]).strip('[').strip(']').strip('\'').strip(' ')
-                    title_c = zone_c.replace('/', ', ').replace('_', ' ')
-                    z_1 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                    try:
-                        flag_title = flag_country.title()
-                        e_1 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_1, color=0x7289da)
-                        s = await ctx.send(embed=e_1)
-                        await asyncio.sleep(1)
-                        z_2 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                        e_2 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_2, color=0xed791d)
-                        await s.edit(embed=e_2)
-                        await asyncio.sleep(2)
-                        z_3 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                        e_3 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_3, color=0x7289da)
-                        await s.edit(embed=e_3)
-                        await asyncio.sleep(3)
-                        z_4 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                        e_4 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_4, color=0xed791d)
-                        await s.edit(embed=e_4)
-                        await asyncio.sleep(5)
-                        z_5 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
-                        e_5 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_5, color=0x7289da)
-                        return await s.edit(embed=e_5)
-
-                    except discord.Forbidden:  # FORBIDDEN (status code: 403): Missing Permissions
-                        return await ctx.send(f'{title_c}\n{z_1}')
-
-                except Exception as e:
-                    if ctx.author.id in (dev[1] for dev in dev_list):
-                        if m.guild.id == 540072370527010841:
-                            tb = traceback.format_exc()
-                            return await ctx.send(f'```py\n[Error: 002] {e}\n!------------>\n{tb}```')
-                        else:
-                            pass
-                    else:
-                        return await ctx.send(msg, delete_after=23)
+        zone_c = self.index.resolve(flag_country)
+        if not zone_c:
+            # Partial or ambiguous input, list what it could mean instead of guessing
+            suggestions = self.index.search(flag_country, limit=5)
+            if suggestions:
+                listed = ', '.join(f'`{z}`' for z in suggestions)
+                return await ctx.send(f'**Did you mean:** {listed}', delete_after=23)
+            return await ctx.send(msg, delete_after=23)
+
+        try:
+            title_c = zone_c.replace('/', ', ').replace('_', ' ')
+            flag_title = flag_country.title()
+            z_1 = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
+            try:
+                e_1 = discord.Embed(title=f'{flag_title} | {title_c}', description=z_1, color=0x7289da)
+                s = await ctx.send(embed=e_1)
+                for delay, color in ((1, 0xed791d), (2, 0x7289da), (3, 0xed791d), (5, 0x7289da)):
+                    await asyncio.sleep(delay)
+                    z_n = datetime.now(timezone(zone_c)).strftime(f'%a %d %b, **%H:**%M:%S')
+                    await s.edit(embed=discord.Embed(title=f'{flag_title} | {title_c}', description=z_n, color=color))
+                return
+
+            except discord.Forbidden:  # FORBIDDEN (status code: 403): Missing Permissions
+                return await ctx.send(f'{title_c}\n{z_1}')
+
+        except Exception as e:
+            if ctx.author.id in (dev[1] for dev in dev_list):
+                if m.guild.id == 540072370527010841:
+                    tb = traceback.format_exc()
+                    return await ctx.send(f'```py\n[Error: 001] {e}\n!------------>\n{tb}```')
+
+    @commands.command(description='Benchmark the timezone lookup index', hidden=True)
+    @commands.has_permissions(administrator=True)
+    async def tzbench(self, ctx):
+        """ ✔ Time index lookups for every zone against a linear scan """
+        index_us, scan_us, found = await asyncio.to_thread(self.index.benchmark)
+        await ctx.send(f'**Zones:** {len(all_timezones)} • **build:** {self.index.build_ms:.1f} ms\n'
+                       f'**Index:** {index_us:.1f} µs/query • **scan:** {scan_us:.1f} µs/query\n'
+                       f'**Full names found:** {found:.1%}', delete_after=60)
 
 
 async def setup(bot):
@@ -20,24 +20,362 @@ SOFTWARE.
 import discord
 import logging
 import asyncio
-from typing import Optional, Dict, Set
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional, Dict, Set, List, Tuple, Callable, Awaitable
 from discord.ext import commands
 from discord import User
+from discord.ui import View, Button
+from pymongo.errors import PyMongoError
 from core import checks
 from core.models import PermissionLevel
 
-# Translation libraries (primary and fallback)
+# Translation libraries (primary and fallbacks), each one optional
 try:
     from deep_translator import GoogleTranslator  # Primary translator
     HAS_DEEP_TRANSLATOR = True
 except ImportError:
     HAS_DEEP_TRANSLATOR = False
+
+try:
     from googletrans import Translator  # Fallback 1
+except ImportError:
+    Translator = None
+
+try:
     from mtranslate import translate  # Fallback 2
+except ImportError:
+    translate = None
 
 logger = logging.getLogger("Modmail")
 
-__version__ = "2.0.0"
+__version__ = "2.1.0"
+
+TRANSLATE_WORKERS = 8  # Threads for blocking providers, room for a few long messages' chunks at once
+PROVIDER_TIMEOUT = 15  # Seconds a running provider call gets, time queued for a thread not included
+QUEUE_TIMEOUT = 10  # Seconds a call may wait for a free worker thread before the request fails
+CACHE_SIZE = 2000  # Translations kept in memory
+CACHE_TTL = 6 * 3600  # Seconds a translation stays in memory
+CACHE_DB_TTL = 30 * 86400  # Seconds a translation stays in the plugin database
+
+CHUNK_SIZE = 1800  # Characters per provider call, well under provider request limits
+CHUNK_CONCURRENCY = 3  # Chunks of one message translated at the same time
+PAGE_SIZE = 2000  # Characters per embed page
+EDIT_INTERVAL = 1.5  # Seconds between streamed progress edits
+
+_SPACES_RE = re.compile(r"[^\S\n]+")
+# Paragraph break, line break, or the space after a sentence end; captured so it is kept
+_BOUNDARY_RE = re.compile(r"(\n\s*\n|\n|(?<=[.!?…。！？])[^\S\n]+)")
+
+
+def segment_text(text: str, limit: int = CHUNK_SIZE) -> List[Tuple[str, str]]:
+    """Split ``text`` into ``(chunk, separator)`` pairs with chunks no longer than ``limit``.
+
+    Chunks end on paragraph, line or sentence boundaries where they can,
+    then on spaces, then anywhere. Joining each chunk with its separator
+    gives back the original text.
+    """
+    parts = _BOUNDARY_RE.split(text)
+    units: List[Tuple[str, str]] = []
+    for i in range(0, len(parts), 2):
+        piece = parts[i]
+        sep = parts[i + 1] if i + 1 < len(parts) else ""
+        while len(piece) > limit:
+            cut = piece.rfind(" ", 0, limit)
+            if cut > 0:
+                units.append((piece[:cut], " "))
+                piece = piece[cut + 1:]
+            else:
+                units.append((piece[:limit], ""))
+                piece = piece[limit:]
+        units.append((piece, sep))
+
+    chunks: List[Tuple[str, str]] = []
+    current, current_sep = None, ""
+    for piece, sep in units:
+        if current is not None and len(current) + len(current_sep) + len(piece) > limit:
+            chunks.append((current, current_sep))
+            current = None
+        current = piece if current is None else current + current_sep + piece
+        current_sep = sep
+    if current is not None:
+        chunks.append((current, current_sep))
+    return chunks
+
+
+def paginate_text(text: str, limit: int = PAGE_SIZE) -> List[str]:
+    """Split ``text`` into embed-sized pages on the same boundaries as :func:`segment_text`."""
+    pages = [chunk.strip() for chunk, _ in segment_text(text, limit)]
+    return [page for page in pages if page] or [text[:limit]]
+
+
+class TranslationPages(View):
+    """Previous/next buttons over the pages of a long translation."""
+
+    def __init__(self, embeds: List[discord.Embed]):
+        super().__init__(timeout=300)
+        self.embeds = embeds
+        self.current_page = 0
+        self.message = None
+
+    async def on_timeout(self):
+        if self.message:
+            try:
+                await self.message.edit(view=None)  # Keep the current page, drop the buttons
+            except discord.NotFound:
+                pass
+
+    async def update_embed(self, interaction):
+        await interaction.response.edit_message(embed=self.embeds[self.current_page], view=self)
+
+    @discord.ui.button(label="❰ prev", style=discord.ButtonStyle.grey)
+    async def previous_button(self, interaction: discord.Interaction, button: Button):
+        if self.current_page > 0:
+            self.current_page -= 1
+        await self.update_embed(interaction)
+
+    @discord.ui.button(label="next ❱", style=discord.ButtonStyle.grey)
+    async def next_button(self, interaction: discord.Interaction, button: Button):
+        if self.current_page < len(self.embeds) - 1:
+            self.current_page += 1
+        await self.update_embed(interaction)
+
+
+class TranslationError(Exception):
+    """Raised when every provider failed for a request."""
+
+
+class TranslationEngine:
+    """Runs the blocking translation libraries off the event loop.
+
+    Providers are tried in order on a bounded thread pool, identical requests
+    already in flight share one call, and each provider keeps latency/error
+    counters for the stats command.
+    """
+
+    def __init__(self, workers: int = TRANSLATE_WORKERS, timeout: float = PROVIDER_TIMEOUT,
+                 queue_timeout: float = QUEUE_TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate")
+        self._local = threading.local()  # googletrans clients are not safe to share across threads
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self.providers: List[Tuple[str, Callable[[str, str, str], str]]] = []
+        if HAS_DEEP_TRANSLATOR:
+            self.providers.append(("deep-translator", self._deep_translator))
+        if Translator is not None:
+            self.providers.append(("googletrans", self._googletrans))
+        if translate is not None:
+            self.providers.append(("mtranslate", self._mtranslate))
+        self.stats = {
+            name: {"calls": 0, "errors": 0, "timeouts": 0, "total_ms": 0.0, "max_ms": 0.0, "last_error": None}
+            for name, _ in self.providers
+        }
+        self.requests = 0
+        self.coalesced = 0
+        self.queued_calls = 0
+        self.queue_ms = 0.0  # Time calls spent waiting for a free worker thread
+        self.queue_max_ms = 0.0
+        self.stuck = 0  # Timed-out calls still occupying a worker thread
+        self.rejected = 0  # Requests failed fast because no worker thread was free
+
+    @staticmethod
+    def _deep_translator(text: str, target: str, source: str) -> str:
+        return GoogleTranslator(source=source, target=target).translate(text)
+
+    def _googletrans(self, text: str, target: str, source: str) -> str:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = Translator()
+        return client.translate(text, dest=target, src=source).text
+
+    @staticmethod
+    def _mtranslate(text: str, target: str, source: str) -> str:
+        return translate(text, target, source)
+
+    async def translate(self, text: str, target: str, source: str = "auto") -> str:
+        """Translate ``text``, joining an identical request that is already running."""
+        self.requests += 1
+        key = (text, source, target)
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = asyncio.ensure_future(self._run(text, target, source))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the call for everyone else
+        return await asyncio.shield(future)
+
+    async def _run(self, text: str, target: str, source: str) -> str:
+        if not self.providers:
+            raise TranslationError("no translation library is installed")
+        loop = asyncio.get_running_loop()
+        last_error = None
+        for name, call in self.providers:
+            if self.stuck >= self.workers:
+                # Every thread is held by a hung call, queueing would only wait on them
+                self.rejected += 1
+                raise TranslationError("all translation workers are stuck on timed-out calls")
+            stats = self.stats[name]
+            stats["calls"] += 1
+            queued = time.perf_counter()
+            started = loop.create_future()
+            abandoned = threading.Event()
+
+            def timed(call=call, started=started, abandoned=abandoned):
+                # Runs on the worker thread; the timeout starts from here, not from submission
+                if abandoned.is_set():
+                    return None
+                loop.call_soon_threadsafe(lambda: started.done() or started.set_result(time.perf_counter()))
+                return call(text, target, source)
+
+            job = loop.run_in_executor(self.executor, timed)
+            try:
+                begun = await asyncio.wait_for(started, timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                abandoned.set()
+                job.cancel()
+                self.rejected += 1
+                self._record_queue((time.perf_counter() - queued) * 1000)
+                # Every provider shares the pool, trying the next one would queue again
+                raise TranslationError(f"no translation worker was free within {self.queue_timeout}s")
+            self._record_queue((begun - queued) * 1000)
+            try:
+                result = await asyncio.wait_for(asyncio.shield(job), timeout=self.timeout)
+                if not result:
+                    raise TranslationError(f"{name} returned an empty result")
+                return result
+            except asyncio.TimeoutError:
+                stats["timeouts"] += 1
+                last_error = TranslationError(f"{name} timed out after {self.timeout}s")
+                # The thread can't be interrupted, count it until the call returns
+                self.stuck += 1
+                job.add_done_callback(self._unstick)
+            except Exception as e:
+                last_error = e
+            finally:
+                elapsed = (time.perf_counter() - begun) * 1000
+                stats["total_ms"] += elapsed
+                stats["max_ms"] = max(stats["max_ms"], elapsed)
+            stats["errors"] += 1
+            stats["last_error"] = str(last_error)[:100]
+            logger.warning(f"Translation provider {name} failed: {last_error}")
+        raise TranslationError(str(last_error))
+
+    def _record_queue(self, waited_ms: float):
+        self.queued_calls += 1
+        self.queue_ms += waited_ms
+        self.queue_max_ms = max(self.queue_max_ms, waited_ms)
+
+    def _unstick(self, job: asyncio.Future):
+        self.stuck -= 1
+        if not job.cancelled():
+            job.exception()  # Mark retrieved, the caller already moved on
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+class TranslationCache:
+    """Two-tier translation cache: an in-memory LRU with TTL in front of plugin-DB documents.
+
+    Keys are a sha256 of the language pair and the normalized text (NFC,
+    trimmed, runs of spaces collapsed), so the same canned reply pasted
+    with different spacing still hits.
+    """
+
+    def __init__(self, db, size: int = CACHE_SIZE, ttl: int = CACHE_TTL):
+        self.db = db
+        self.size = size
+        self.ttl = ttl
+        self.entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, target: str, source: str = "auto") -> str:
+        normalized = _SPACES_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+        digest = hashlib.sha256(f"{source}\0{target}\0{normalized}".encode("utf-8")).hexdigest()
+        return f"tr:{digest}"
+
+    async def create_indexes(self):
+        try:
+            await self.db.create_index(
+                'created_at',
+                name='translation_cache_ttl',
+                expireAfterSeconds=CACHE_DB_TTL,
+                partialFilterExpression={'type': 'translation_cache'}
+            )
+        except PyMongoError as e:
+            logger.error(f"Failed to create translation cache index: {e}")
+
+    def _remember(self, key: str, translated: str):
+        self.entries[key] = (time.monotonic() + self.ttl, translated)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            expires, translated = entry
+            if expires > time.monotonic():
+                self.entries.move_to_end(key)
+                self.memory_hits += 1
+                return translated
+            del self.entries[key]
+
+        try:
+            doc = await self.db.find_one({'_id': key}, {'translated': 1})
+        except PyMongoError as e:
+            logger.warning(f"Translation cache lookup failed: {e}")
+            doc = None
+        if doc:
+            self.db_hits += 1
+            self._remember(key, doc['translated'])
+            return doc['translated']
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, translated: str, target: str, source: str = "auto"):
+        self._remember(key, translated)
+        try:
+            await self.db.update_one(
+                {'_id': key},
+                {'$set': {
+                    'type': 'translation_cache',
+                    'source': source,
+                    'target': target,
+                    'translated': translated,
+                    'created_at': datetime.utcnow()
+                }},
+                upsert=True
+            )
+        except PyMongoError as e:
+            logger.warning(f"Translation cache write failed: {e}")
+
+    async def clear(self) -> int:
+        self.entries.clear()
+        result = await self.db.delete_many({'type': 'translation_cache'})
+        return result.deleted_count
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.db_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.memory_hits + self.db_hits) / self.lookups if self.lookups else 0.0
+
 
 class Translate(commands.Cog):
     """🔠 Translation tools for Modmail with user preferences and auto-translation.
@@ -59,11 +397,9 @@ class Translate(commands.Cog):
         self.user_prefs: Dict[int, str] = {}  # {user_id: target_lang}
         self.lock = asyncio.Lock()  # For thread-safe operations
         
-        # Initialize translator
-        if HAS_DEEP_TRANSLATOR:
-            self.translator = GoogleTranslator
-        else:
-            self.translator = Translator()
+        # Blocking providers run on the engine's thread pool
+        self.engine = TranslationEngine()
+        self.cache = TranslationCache(self.db)
         
         # Supported languages (ISO 639-1 codes)
         self.languages = {
@@ -100,8 +436,12 @@ class Translate(commands.Cog):
         
         bot.loop.create_task(self._load_config())
 
+    def cog_unload(self):
+        self.engine.close()
+
     async def _load_config(self):
         """Load configuration and user preferences from database."""
+        await self.cache.create_indexes()
         try:
             async with self.lock:
                 config = await self.db.find_one({'_id': 'config'})
@@ -131,23 +471,133 @@ class Translate(commands.Cog):
             return "No text provided to translate."
             
         try:
-            # Try primary translator first
-            if HAS_DEEP_TRANSLATOR:
-                translated = GoogleTranslator(source=source, target=target).translate(text)
-                return translated
-            
-            # Fallback to googletrans
-            try:
-                translated = self.translator.translate(text, dest=target, src=source).text
-                return translated
-            except Exception:
-                # Final fallback to mtranslate
-                return translate(text, target)
-                
+            if len(text) <= CHUNK_SIZE:
+                return await self._translate_cached(text, target, source)
+            translated, _ = await self._translate_segments(text, target, source)
+            return translated
         except Exception as e:
             logger.error(f"Translation failed: {e}", exc_info=True)
             return f"⚠️ Translation failed: {str(e)}"
 
+    async def _translate_cached(self, text: str, target: str, source: str = 'auto') -> str:
+        """Translate one provider-sized piece of text through the cache; raises on failure."""
+        key = self.cache.key(text, target, source)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+            
+        translated = await self.engine.translate(text, target, source)
+        await self.cache.put(key, translated, target, source)
+        return translated
+
+    async def _translate_segments(
+        self,
+        text: str,
+        target: str,
+        source: str = 'auto',
+        on_progress: Optional[Callable[[str, int, int], Awaitable[None]]] = None
+    ) -> Tuple[str, int]:
+        """Translate long text chunk by chunk, CHUNK_CONCURRENCY chunks at a time.
+        
+        ``on_progress(prefix, done, total)`` is awaited each time more of the
+        leading chunks are finished, so callers can stream the result. Chunks
+        that fail stay in the original language.
+        
+        Returns:
+            The reassembled translation and the number of failed chunks
+        """
+        segments = segment_text(text)
+        results: List[Optional[str]] = [None] * len(segments)
+        semaphore = asyncio.Semaphore(CHUNK_CONCURRENCY)
+        failed = 0
+        
+        async def run(index: int, chunk: str) -> Tuple[int, str]:
+            nonlocal failed
+            if not chunk.strip():
+                return index, chunk
+            async with semaphore:
+                try:
+                    return index, await self._translate_cached(chunk, target, source)
+                except Exception as e:
+                    failed += 1
+                    logger.warning(f"Translation of chunk {index + 1}/{len(segments)} failed: {e}")
+                    return index, chunk
+                    
+        def joined(count: int) -> str:
+            return "".join(results[i] + segments[i][1] for i in range(count))
+            
+        ready = 0
+        for finished in asyncio.as_completed([run(i, chunk) for i, (chunk, _) in enumerate(segments)]):
+            index, translated = await finished
+            results[index] = translated
+            if on_progress is None:
+                continue
+            start = ready
+            while ready < len(results) and results[ready] is not None:
+                ready += 1
+            if ready > start and ready < len(results):
+                await on_progress(joined(ready), ready, len(results))
+                
+        return joined(len(results)), failed
+
+    async def _send_translation(
+        self,
+        destination,
+        text: str,
+        target: str,
+        build_embed: Callable[[str], discord.Embed]
+    ):
+        """Translate ``text`` and send it as paged embeds built by ``build_embed``.
+        
+        Long text is translated in chunks and streamed into a single message,
+        which gets previous/next buttons once the translation is complete.
+        """
+        def with_footer(embed: discord.Embed, note: str) -> discord.Embed:
+            base = embed.footer.text if embed.footer and embed.footer.text else None
+            embed.set_footer(text=f"{base} • {note}" if base else note)
+            return embed
+            
+        if len(text) <= CHUNK_SIZE:
+            translated = await self._translate_text(text, target)
+            message, failed = None, 0
+        else:
+            message = await destination.send(
+                embed=with_footer(build_embed("⏳ Translating…"), f"Translating… 0/{len(segment_text(text))} parts")
+            )
+            last_edit = time.monotonic()
+            
+            async def stream(prefix: str, done: int, total: int):
+                nonlocal last_edit
+                if time.monotonic() - last_edit < EDIT_INTERVAL:
+                    return
+                last_edit = time.monotonic()
+                page = paginate_text(prefix)[-1]
+                try:
+                    await message.edit(embed=with_footer(build_embed(page), f"Translating… {done}/{total} parts"))
+                except discord.HTTPException:
+                    pass
+                    
+            translated, failed = await self._translate_segments(text, target, on_progress=stream)
+            
+        pages = paginate_text(translated)
+        embeds = []
+        for number, page in enumerate(pages, start=1):
+            embed = build_embed(page)
+            notes = []
+            if len(pages) > 1:
+                notes.append(f"Page {number}/{len(pages)}")
+            if failed:
+                notes.append(f"⚠️ {failed} part(s) left untranslated")
+            embeds.append(with_footer(embed, " • ".join(notes)) if notes else embed)
+            
+        view = TranslationPages(embeds) if len(embeds) > 1 else None
+        if message is None:
+            message = await destination.send(embed=embeds[0], view=view)
+        else:
+            await message.edit(embed=embeds[0], view=view)
+        if view:
+            view.message = message
+
     @commands.group(aliases=['translate', 'tr'], invoke_without_command=True)
     @commands.guild_only()
     async def translation(self, ctx, target_lang: Optional[str] = None, *, text: Optional[str] = None):
@@ -187,31 +637,26 @@ class Translate(commands.Cog):
             )
             
         try:
-            # Translate the text
-            translated = await self._translate_text(text, lang_code)
-            
-            # Handle message length limits
-            if len(translated) > 2000:
-                translated = translated[:1990] + "... [truncated]"
-                
-            # Create embed response
             lang_name = self.languages[lang_code]
-            embed = discord.Embed(
-                color=self.user_color,
-                title=f"Translation to {lang_name}",
-                description=translated
-            )
-            embed.set_author(
-                name=f"{ctx.author.display_name} ({ctx.author.id})",
-                icon_url=ctx.author.avatar.url if ctx.author.avatar else None
-            )
-            embed.add_field(
-                name="Original Text",
-                value=text[:1024] + ("..." if len(text) > 1024 else ""),
-                inline=False
-            )
             
-            await ctx.send(embed=embed)
+            def build_embed(description: str) -> discord.Embed:
+                embed = discord.Embed(
+                    color=self.user_color,
+                    title=f"Translation to {lang_name}",
+                    description=description
+                )
+                embed.set_author(
+                    name=f"{ctx.author.display_name} ({ctx.author.id})",
+                    icon_url=ctx.author.avatar.url if ctx.author.avatar else None
+                )
+                embed.add_field(
+                    name="Original Text",
+                    value=text[:1024] + ("..." if len(text) > 1024 else ""),
+                    inline=False
+                )
+                return embed
+                
+            await self._send_translation(ctx, text, lang_code, build_embed)
             
         except Exception as e:
             logger.error(f"Translation command failed: {e}", exc_info=True)
@@ -255,6 +700,55 @@ class Translate(commands.Cog):
         embed.set_footer(text=f"Use '{ctx.prefix}translation set <language>' to set your preference")
         await ctx.send(embed=embed)
 
+    @translation.command(name='stats')
+    @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
+    async def translation_stats(self, ctx, action: Optional[str] = None):
+        """Show cache hit rate and translation provider latency and error counts.
+        
+        Usage:
+        {prefix}translation stats
+        {prefix}translation stats clear (empty the translation cache)
+        """
+        if action and action.lower() == 'clear':
+            deleted = await self.cache.clear()
+            return await ctx.send(f"✅ Cleared the translation cache ({deleted} stored translations).")
+            
+        engine = self.engine
+        cache = self.cache
+        embed = discord.Embed(
+            title="Translation Stats",
+            description=(
+                f"Requests: **{engine.requests}** • Coalesced: {engine.coalesced}\n"
+                f"Worker threads: {engine.workers} • Provider timeout: {engine.timeout}s\n"
+                f"Queue wait: avg {engine.queue_ms / engine.queued_calls if engine.queued_calls else 0:.0f} ms"
+                f" • max {engine.queue_max_ms:.0f} ms • Stuck threads: {engine.stuck}"
+                f" • Rejected: {engine.rejected}"
+            ),
+            color=self.mod_color
+        )
+        embed.add_field(
+            name="Cache",
+            value=(
+                f"Hit rate: **{cache.hit_rate:.1%}** of {cache.lookups} lookups\n"
+                f"Memory hits: {cache.memory_hits} • DB hits: {cache.db_hits} • Misses: {cache.misses}\n"
+                f"In memory: {len(cache.entries)}/{cache.size}"
+            ),
+            inline=False
+        )
+        for name, stats in engine.stats.items():
+            calls = stats['calls']
+            avg = stats['total_ms'] / calls if calls else 0.0
+            value = (
+                f"Calls: {calls} • Errors: {stats['errors']} (timeouts {stats['timeouts']})\n"
+                f"Run avg: {avg:.0f} ms • Run max: {stats['max_ms']:.0f} ms"
+            )
+            if stats['last_error']:
+                value += f"\nLast error: `{stats['last_error']}`"
+            embed.add_field(name=name, value=value, inline=False)
+        if not engine.stats:
+            embed.add_field(name="Providers", value="⚠️ No translation library installed", inline=False)
+        await ctx.send(embed=embed)
+
     @commands.command(aliases=['tt'])
     @commands.guild_only()
     async def translatetext(self, ctx, message_id: Optional[int] = None, target_lang: Optional[str] = None):
@@ -298,21 +792,22 @@ class Translate(commands.Cog):
             return await ctx.send("⚠️ The selected message has no text content.")
             
         try:
-            translated = await self._translate_text(text, lang_code)
             lang_name = self.languages[lang_code]
             
-            embed = discord.Embed(
-                description=translated,
-                color=self.user_color,
-                timestamp=message.created_at
-            )
-            embed.set_author(
-                name=f"Translated to {lang_name}",
-                icon_url="https://i.imgur.com/yeHFKgl.png"
-            )
-            embed.set_footer(text=f"Original message by {message.author.display_name}")
-            
-            await ctx.send(embed=embed)
+            def build_embed(description: str) -> discord.Embed:
+                embed = discord.Embed(
+                    description=description,
+                    color=self.user_color,
+                    timestamp=message.created_at
+                )
+                embed.set_author(
+                    name=f"Translated to {lang_name}",
+                    icon_url="https://i.imgur.com/yeHFKgl.png"
+                )
+                embed.set_footer(text=f"Original message by {message.author.display_name}")
+                return embed
+                
+            await self._send_translation(ctx, text, lang_code, build_embed)
         except Exception as e:
             logger.error(f"Translate text command failed: {e}", exc_info=True)
             await ctx.send(f"⚠️ Failed to translate message: {str(e)}")
@@ -359,13 +854,14 @@ class Translate(commands.Cog):
         status = "enabled" if enabled else "disabled"
         await ctx.send(f"✅ Auto-translation has been {status} system-wide.")
 
+    @commands.Cog.listener()
     async def on_message(self, message):
         """Handle auto-translation of messages in configured threads."""
         if (not self.enabled or 
             not message.guild or 
             message.author.bot or 
             message.channel.id not in self.tt or
-            "User ID:" not in getattr(message.channel, 'topic', '')):
+            "User ID:" not in (getattr(message.channel, 'topic', None) or '')):
             return
             
         try:
@@ -383,18 +879,16 @@ class Translate(commands.Cog):
             user_id = int(message.channel.topic.split("User ID: ")[1].split("\n")[0])
             lang_code = self.user_prefs.get(user_id, 'en')
             
-            # Translate the text
-            translated = await self._translate_text(text, lang_code)
-            if len(translated) > 2000:
-                translated = translated[:1990] + "... [truncated]"
+            def build_embed(description: str) -> discord.Embed:
+                embed = discord.Embed(
+                    description=description,
+                    color=4388013  # Blurple
+                )
+                embed.set_footer(text="Auto-translated message")
+                return embed
                 
-            # Send translation
-            embed = discord.Embed(
-                description=translated,
-                color=4388013  # Blurple
-            )
-            embed.set_footer(text="Auto-translated message")
-            await message.channel.send(embed=embed)
+            # Translate and send, paging long messages instead of truncating them
+            await self._send_translation(message.channel, text, lang_code, build_embed)
             
         except Exception as e:
             logger.error(f"Auto-translation failed: {e}", exc_info=True)